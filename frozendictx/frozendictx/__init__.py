@@ -1,5 +1,41 @@
-from ._frozendict import FrozendictBase, frozendict, mapping_hash
+from ._frozendict import FrozendictBase, frozendict, mapping_digest, mapping_hash, streaming_mapping_hash
+from ._batch import FrozendictBatch
+from ._delta import FrozendictDelta
+from ._freeze import freeze, thaw
+from ._frozenmap import frozenmap
+from ._intern import InternStats
+from ._json import iter_ndjson, load_json, loads_json
+from ._mapped import MappedFrozendictWriter, mappedfrozendict
+from ._native import nativefrozendict
+from ._overlay import frozenoverlay
+from ._schema import frozenrecord, schema
+from ._shared import sharedfrozendict
+from ._sortedkeys import SortedKeys
 
 version = '1.0.0'
 
-__all__ = 'FrozendictBase', 'frozendict', 'mapping_hash', 'version'
+__all__ = (
+    'FrozendictBase',
+    'FrozendictBatch',
+    'FrozendictDelta',
+    'InternStats',
+    'MappedFrozendictWriter',
+    'SortedKeys',
+    'freeze',
+    'frozendict',
+    'frozenmap',
+    'frozenoverlay',
+    'frozenrecord',
+    'iter_ndjson',
+    'load_json',
+    'loads_json',
+    'mappedfrozendict',
+    'mapping_digest',
+    'mapping_hash',
+    'nativefrozendict',
+    'schema',
+    'sharedfrozendict',
+    'streaming_mapping_hash',
+    'thaw',
+    'version',
+    )
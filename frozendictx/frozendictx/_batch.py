@@ -0,0 +1,106 @@
+# mypy: ignore-errors
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from pickle import PickleBuffer
+from typing import Generic, Union, overload
+
+from ._frozendict import HASH_SEED_TOKEN, K, T, _storage, all_have_value_hash, frozendict
+
+
+def _load_batch(shapes: list, shape_ids: Union[bytes, memoryview], values: list, hashes: list, token: int, /):
+    ids = memoryview(shape_ids).cast('B').cast('I')
+    factories = [(cls._unpickle, keys) for cls, keys in shapes]
+    it = iter(values)
+    # zip stops when keys are exhausted, thus it takes exactly len(keys) values
+    items = [adopt(dict(zip(keys, it))) for adopt, keys in map(factories.__getitem__, ids)]
+    ids.release()
+    if token == HASH_SEED_TOKEN:
+        for d, hash_value in zip(items, hashes):
+            if hash_value is not None:
+                d._frozendict__hash = hash_value
+
+    return FrozendictBatch._from_list(items)
+
+
+class FrozendictBatch(Sequence, Generic[K, T]):
+    """
+    Immutable sequence of :class:`frozendict` instances which is pickled compactly.
+    Keys of dictionaries with the same keys in the same order are pickled once,
+    every dictionary is pickled as an index of its keys and its values.
+    Cached hash values are passed under the same conditions as for a single dictionary.
+
+    With pickle protocol 5, indexes of keys are passed as a buffer
+    which can be transferred out-of-band.
+    Attributes of instances of :class:`frozendict` subclasses are not preserved.
+    """
+    __slots__ = '_items',
+
+    def __init__(self, iterable: Iterable[frozendict[K, T]] = (), /):
+        items = list(iterable)
+        for d in items:
+            if not isinstance(d, frozendict):
+                raise TypeError(f'batch items must be instances of frozendict, got {d.__class__}')
+
+        self._items = items
+
+    @classmethod
+    def _from_list(cls, items: list, /) -> 'FrozendictBatch':
+        self = object.__new__(cls)
+        self._items = items
+        return self
+
+    def __reduce_ex__(self, protocol: int, /):
+        shapes = {}
+        shape_ids = array('I')
+        values = []
+        hashes = []
+        for d in self._items:
+            source = _storage(d)
+            shape = d.__class__, tuple(source)
+            shape_id = shapes.get(shape)
+            if shape_id is None:
+                shape_id = shapes[shape] = len(shapes)
+
+            shape_ids.append(shape_id)
+            values.extend(source.values())
+            h = d._frozendict__hash
+            if isinstance(h, int) and all_have_value_hash(source.keys()) and all_have_value_hash(source.values()):
+                hashes.append(h)
+            else:
+                hashes.append(None)
+
+        ids = PickleBuffer(shape_ids) if protocol >= 5 else shape_ids.tobytes()
+        return _load_batch, (list(shapes), ids, values, hashes, HASH_SEED_TOKEN)
+
+    # region getitem overload
+    @overload
+    def __getitem__(self, index: int, /) -> frozendict[K, T]: ...
+    @overload
+    def __getitem__(self, index: slice, /) -> 'FrozendictBatch[K, T]': ...
+    # endregion
+
+    def __getitem__(self, index, /):
+        if isinstance(index, slice):
+            return self._from_list(self._items[index])
+
+        return self._items[index]
+
+    def __len__(self, /):
+        return len(self._items)
+
+    def __iter__(self, /) -> Iterator[frozendict[K, T]]:
+        return iter(self._items)
+
+    def __eq__(self, other, /):
+        if isinstance(other, FrozendictBatch):
+            return self._items == other._items
+
+        return NotImplemented
+
+    def __hash__(self, /):
+        return hash(tuple(self._items))
+
+    def __str__(self, /):
+        return f'{self.__class__.__name__}({self._items})'
+
+    __repr__ = __str__
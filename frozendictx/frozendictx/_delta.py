@@ -0,0 +1,149 @@
+# mypy: ignore-errors
+from collections.abc import Iterable, Mapping, MutableMapping
+from itertools import compress, filterfalse, islice
+from operator import is_, is_not
+from types import MappingProxyType
+from typing import Any, Generic, TypeVar
+
+K = TypeVar('K')
+T = TypeVar('T')
+
+_missing = object()
+
+
+def scan_delta(old: Mapping, new: Mapping, added: dict, changed: dict, removed: list, /):
+    """
+    Add to ``added``, ``changed`` and ``removed`` the difference between ``old`` and ``new``
+    found by lookups of all items of ``new`` in ``old``.
+    Keys of ``old`` are scanned only if some of them are absent in ``new``.
+    """
+    if isinstance(old, dict) and isinstance(new, dict) and all(map(is_, old.keys(), new.keys())):
+        # A dictionary derived via ``|`` or ``set`` keeps the order of its base,
+        # thus keys at the same positions are the same objects,
+        # and a value can be changed only if it is another object.
+        # Positions are compared without calls of Python code.
+        get = old.get
+        for k in compress(new.keys(), map(is_not, old.values(), new.values())):
+            v = new[k]
+            if not get(k) == v:
+                changed[k] = v
+
+        if len(new) > len(old):
+            added.update(islice(new.items(), len(old), None))
+        else:
+            removed.extend(islice(old.keys(), len(new), None))
+
+        return
+
+    # For dictionaries, items are filtered without calls of Python code,
+    # an item view compares values by identity first, then by equality.
+    start = len(added)
+    for k, v in filterfalse(old.items().__contains__, new.items()):
+        if k in old:
+            changed[k] = v
+        else:
+            added[k] = v
+
+    # Every key of old is present in new if new has exactly the added keys more
+    if len(old) + len(added) - start != len(new):
+        removed.extend(filterfalse(new.__contains__, old.keys()))
+
+
+class FrozendictDelta(Generic[K, T]):
+    """
+    Immutable difference between two dictionaries: added, changed and removed keys.
+    Created via :meth:`FrozendictBase.diff` and applied via :meth:`FrozendictBase.patch`.
+    Pickled as two dictionaries and a tuple, i.e., only changed items are passed.
+    """
+    __slots__ = '_added', '_changed', '_removed'
+
+    def __init__(
+            self,
+            added: Mapping[K, T] = MappingProxyType({}),
+            changed: Mapping[K, T] = MappingProxyType({}),
+            removed: Iterable[K] = (),
+            /,
+            ):
+        self._added = dict(added)
+        self._changed = dict(changed)
+        self._removed = tuple(removed)
+
+    @classmethod
+    def _adopt(cls, added: dict, changed: dict, removed: tuple, /) -> 'FrozendictDelta':
+        self = object.__new__(cls)
+        self._added = added
+        self._changed = changed
+        self._removed = removed
+        return self
+
+    @property
+    def added(self, /) -> Mapping[K, T]:
+        """Items which keys are absent in the old dictionary."""
+        return MappingProxyType(self._added)
+
+    @property
+    def changed(self, /) -> Mapping[K, T]:
+        """New values of keys which are bound to different values in the old dictionary."""
+        return MappingProxyType(self._changed)
+
+    @property
+    def removed(self, /) -> tuple[K, ...]:
+        """Keys which are absent in the new dictionary."""
+        return self._removed
+
+    def __reduce__(self, /):
+        return self.__class__._adopt, (self._added, self._changed, self._removed)
+
+    def __len__(self, /):
+        return len(self._added) + len(self._changed) + len(self._removed)
+
+    def __eq__(self, other: Any, /) -> bool:
+        if isinstance(other, FrozendictDelta):
+            return (
+                    self._added == other._added
+                    and self._changed == other._changed
+                    and set(self._removed) == set(other._removed)
+            )
+
+        return NotImplemented
+
+    def __ne__(self, other: Any, /) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    __hash__ = None
+
+    def __str__(self, /):
+        return f'{self.__class__.__name__}(added={self._added}, changed={self._changed}, removed={self._removed})'
+
+    __repr__ = __str__
+
+    def apply_to(self, d: dict, /):
+        """
+        Apply the delta to ``d`` in place.
+        Raise :class:`TypeError` if ``d`` is not a mutable mapping;
+        use ``patch`` of immutable dictionaries instead.
+        Raise :class:`ValueError` if ``d`` is not the old dictionary of the delta,
+        i.e., some added key is present or some changed or removed key is absent.
+        ``d`` is left partially changed in this case.
+        """
+        if not isinstance(d, MutableMapping):
+            raise TypeError(f'delta can be applied only to a mutable mapping, got {d.__class__.__name__}')
+
+        for k in self._removed:
+            if d.pop(k, _missing) is _missing:
+                raise ValueError(f'removed key {k!r} is absent')
+
+        for k in self._changed:
+            if k not in d:
+                raise ValueError(f'changed key {k!r} is absent')
+
+        for k in self._added:
+            if k in d:
+                raise ValueError(f'added key {k!r} is present')
+
+        d.update(self._changed)
+        d.update(self._added)
@@ -0,0 +1,112 @@
+# mypy: ignore-errors
+from typing import Any
+
+from ._frozendict import FrozendictBase, frozendict
+from ._native import nativefrozendict
+
+_in_progress = object()
+# Most frequent leaves are checked before a call to avoid its overhead
+_scalars = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _freeze(obj: Any, memo: dict, /) -> Any:
+    cls = obj.__class__
+    if not isinstance(obj, (dict, list, tuple, set, FrozendictBase)):
+        return obj
+
+    key = id(obj)
+    result = memo.get(key)
+    if result is _in_progress:
+        raise ValueError(f'cannot freeze a cyclic structure, {cls.__name__} contains itself')
+
+    if result is not None:
+        return result
+
+    memo[key] = _in_progress
+    if isinstance(obj, (dict, FrozendictBase)):
+        d = {k: v if v.__class__ in _scalars else _freeze(v, memo) for k, v in obj.items()}
+        if isinstance(obj, (FrozendictBase, nativefrozendict)) and all(d[k] is v for k, v in obj.items()):
+            result = obj
+        else:
+            result = frozendict(d)
+
+        try:
+            # Values are already hashed, thus the cached hash value costs one pass over items
+            hash(result)
+        except TypeError:
+            pass
+    elif isinstance(obj, set):
+        # Elements of sets are already hashable
+        result = frozenset(obj)
+    else:
+        items = [o if o.__class__ in _scalars else _freeze(o, memo) for o in obj]
+        if cls is list:
+            result = tuple(items)
+        elif all(a is b for a, b in zip(items, obj)):
+            result = obj
+        elif hasattr(cls, '_make'):
+            # Named tuples take items as separate arguments of the constructor
+            result = cls._make(items)
+        else:
+            result = cls(items)
+
+    memo[key] = result
+    # Keep the source alive, otherwise its id can be reused by another object
+    memo[id(memo)].append(obj)
+    return result
+
+
+def freeze(obj: Any, /) -> Any:
+    """
+    Return an immutable copy of ``obj``.
+    Dictionaries are converted into :class:`frozendict`, lists into tuples,
+    sets into frozensets; values are converted recursively.
+    Instances of :class:`FrozendictBase`, :class:`nativefrozendict` and tuples
+    are kept if their values need no conversion.
+    Otherwise, tuples are rebuilt with the same class, named tuples via ``_make``.
+    Other objects are kept as is.
+
+    Shared substructures are converted only once and stay shared in the result.
+    Hash values of dictionaries are calculated bottom-up during conversion,
+    thus later ``hash`` and ``deepcopy`` calls are O(1).
+    Raise ValueError if ``obj`` contains itself.
+    """
+    memo = {}
+    memo[id(memo)] = []
+    return _freeze(obj, memo)
+
+
+def _thaw(obj: Any, memo: dict, /) -> Any:
+    if not isinstance(obj, (FrozendictBase, nativefrozendict, tuple, frozenset)):
+        return obj
+
+    key = id(obj)
+    result = memo.get(key)
+    if result is not None:
+        return result
+
+    if isinstance(obj, (FrozendictBase, nativefrozendict)):
+        result = {k: v if v.__class__ in _scalars else _thaw(v, memo) for k, v in obj.items()}
+    elif isinstance(obj, frozenset):
+        # Elements of sets must stay hashable
+        result = set(obj)
+    else:
+        result = [o if o.__class__ in _scalars else _thaw(o, memo) for o in obj]
+
+    memo[key] = result
+    memo[id(memo)].append(obj)
+    return result
+
+
+def thaw(obj: Any, /) -> Any:
+    """
+    Return a mutable copy of ``obj``, the reverse of :func:`freeze`.
+    Instances of :class:`FrozendictBase` and :class:`nativefrozendict` are converted into dictionaries,
+    tuples into lists, frozensets into sets; values are converted recursively.
+    Other objects are kept as is.
+
+    Shared substructures are converted only once and stay shared in the result.
+    """
+    memo = {}
+    memo[id(memo)] = []
+    return _thaw(obj, memo)
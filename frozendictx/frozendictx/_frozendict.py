@@ -1,10 +1,16 @@
 # mypy: ignore-errors
-from collections.abc import ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
+from collections.abc import Collection, ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
 from copy import deepcopy
-from itertools import chain
-from sys import getsizeof
+from hashlib import blake2b
+from math import isnan
+from struct import Struct, pack
+from sys import getsizeof, hash_info, version_info
 from typing import Any, Generic, Optional, Protocol, TypeVar, Union, overload
 
+from ._delta import FrozendictDelta, scan_delta
+from ._intern import InternPool, InternStats
+from ._sortedkeys import SortedKeys, sorted_keys
+
 K = TypeVar('K')
 K_co = TypeVar('K_co', covariant=True)
 V_co = TypeVar('V_co', covariant=True)
@@ -16,9 +22,103 @@ class SupportsKeysAndGetItem(Protocol[K, V_co]):
     def __getitem__(self, item: K, /) -> V_co: ...
 
 
+# region Incremental hashing
+# Hash value of a frozenset is calculated in two steps.
+# At first, shuffled bits of hash values of all items are combined via xor,
+# the result is called a state here.
+# Then the state is mixed with the number of items to get the final hash value.
+# Xor is commutative and self-inverse, thus the state of a derived mapping
+# can be calculated from the state of its parent by xor-ing out removed items
+# and xor-ing in added ones. Both mixing steps are invertible,
+# hence the state can be restored from a cached hash value without storing it.
+# Algorithm: https://github.com/python/cpython/blob/3.9/Objects/setobject.c#L749
+_HASH_MASK = (1 << hash_info.width) - 1
+_HASH_SIGN = 1 << (hash_info.width - 1)
+_HASH_RESERVED = 590923713
+_HASH_INVERSE_MULTIPLIER = pow(69069, -1, 1 << hash_info.width)
+
+
+def item_hash_bits(item: tuple, /) -> int:
+    """Calculate shuffled bits of hash value of a key-value pair. Raise TypeError if it is unhashable."""
+    h = hash(item)
+    return ((h ^ 89869747) ^ (h << 16)) * 3644798167 & _HASH_MASK
+
+
+def hash_from_state(state: int, size: int, /) -> int:
+    """Calculate hash value of a mapping with ``size`` items from its state."""
+    h = state ^ ((size + 1) * 1927868237 & _HASH_MASK)
+    h ^= (h >> 11) ^ (h >> 25)
+    h = (h * 69069 + 907133923) & _HASH_MASK
+    if h == _HASH_MASK:
+        return _HASH_RESERVED
+
+    return h - (h & _HASH_SIGN) * 2
+
+
+def hash_state(hash_value: int, size: int, /) -> Optional[int]:
+    """
+    Restore the state of a mapping with ``size`` items from its hash value.
+    Return ``None`` if the state cannot be restored unambiguously.
+    """
+    if hash_value == _HASH_RESERVED:
+        return None
+
+    x = ((hash_value & _HASH_MASK) - 907133923) * _HASH_INVERSE_MULTIPLIER & _HASH_MASK
+    # Invert x = h ^ (h >> 11) ^ (h >> 25), every iteration restores at least 11 more bits.
+    h = x
+    while True:
+        h_next = x ^ (h >> 11) ^ (h >> 25)
+        if h_next == h:
+            break
+
+        h = h_next
+
+    return h ^ ((size + 1) * 1927868237 & _HASH_MASK)
+# endregion
+
+
+def streaming_mapping_hash(m: Mapping, /) -> int:
+    """
+    Calculate hash value of a mapping without creating a frozenset of its items.
+    The result is the same as ``hash(frozenset(m.items()))``, but only constant extra memory is used.
+    """
+    state = 0
+    # Items iterator of a dict reuses the same tuple if it is not referenced anymore,
+    # hence no tuple is created here.
+    for h in map(hash, m.items()):
+        # Bits above the hash width do not affect the lower ones, cut them once at the end.
+        state ^= ((h ^ 89869747) ^ (h << 16)) * 3644798167
+
+    return hash_from_state(state & _HASH_MASK, len(m))
+
+
+STREAMING_HASH_THRESHOLD = 200_000
+"""
+Mappings with at least this many items are hashed by :func:`streaming_mapping_hash`.
+For smaller mappings creation of a frozenset is faster.
+The value is the first size at which streaming is faster
+in the crossover table of ``reports/streaming-hash.md``,
+starting from it the median ratio stays below 1.
+"""
+
+
 def mapping_hash(m: Mapping, /) -> int:
     """Calculate hash value of a mapping. All mappings must use this function."""
-    return hash(frozenset(m.items()))
+    if len(m) < STREAMING_HASH_THRESHOLD:
+        return hash(frozenset(m.items()))
+
+    return streaming_mapping_hash(m)
+
+
+def _storage(m: Mapping, /) -> Mapping:
+    # Returns the dict with items of FrozendictBase or the mapping itself.
+    # Updating a dict from another dict is much faster than from an arbitrary mapping.
+    # Subclasses with other storage do not set the attribute,
+    # compact frozendict keeps its keys there and is returned itself.
+    if type(m) is _compactfrozendict:
+        return m
+
+    return getattr(m, '_FrozendictBase__source', m)
 
 
 @Mapping.register
@@ -67,12 +167,59 @@ class FrozendictBase(Generic[K_co, V_co]):
     # endregion
 
     def __new__(cls, iterable = (), /, **kwargs):
+        return cls._from_dict(dict(iterable, **kwargs))
+
+    @classmethod
+    def adopt(cls, d: dict[K_co, V_co], /) -> 'FrozendictBase[K_co, V_co]':
+        """
+        Create a dictionary which takes ownership of ``d``.
+        If items are stored in a dict, ``d`` is used without copying,
+        thus it must not be modified afterwards.
+        """
         self = object.__new__(cls)  # todo check behaviour with multiple inheritance
-        self.__source = dict(iterable, **kwargs)
+        self.__source = d
         return self
 
-    def __getnewargs__(self, /):
-        return self.__source,
+    @classmethod
+    def _from_dict(cls, d: dict[K_co, V_co], /) -> 'FrozendictBase[K_co, V_co]':
+        # Creates a dictionary from a new dict which is not referenced elsewhere.
+        # Unlike adopt, subclasses may store items in another way.
+        return cls.adopt(d)
+
+    @classmethod
+    def _derive(cls, d: dict[K_co, V_co], /) -> 'FrozendictBase[K_co, V_co]':
+        # Creates the result of an operation from a new dict.
+        # Subclasses defined outside the package may set up instances in __new__ and __init__,
+        # thus the constructor is skipped only for classes which are known not to do so.
+        if cls is FrozendictBase or cls is frozendict:
+            return cls._from_dict(d)
+
+        return cls(d)
+
+    @classmethod
+    def _unpickle(cls, d: dict[K_co, V_co], /) -> 'FrozendictBase[K_co, V_co]':
+        # Like _derive, but __init__ is not called, as for other unpickled objects.
+        if cls is FrozendictBase or cls is frozendict:
+            return cls._from_dict(d)
+
+        return cls.__new__(cls, d)
+
+    @classmethod
+    def merged(cls, /, *mappings: Mapping[K_co, V_co]) -> 'FrozendictBase[K_co, V_co]':
+        """
+        Create a dictionary from items of all mappings,
+        later mappings take precedence like in ``a | b | c``.
+        Items are copied once via dict union.
+        """
+        d = {}
+        for m in mappings:
+            d |= _storage(m)
+
+        return cls._derive(d)
+
+    def __reduce__(self, /):
+        # An unpickled dictionary is owned only by pickle, thus it can be adopted without copying.
+        return self.__class__._unpickle, (self.__source,), getattr(self, '__dict__', None)
 
     # region fromkeys overload
     @classmethod
@@ -86,7 +233,7 @@ class FrozendictBase(Generic[K_co, V_co]):
     @classmethod
     def fromkeys(cls, iterable, value = None, /):
         """Create a new dictionary with keys from ``iterable`` and values set to ``value``."""
-        return cls((k, value) for k in iterable)
+        return cls._derive(dict.fromkeys(iterable, value))
 
     def __getitem__(self, item: K_co, /) -> V_co:
         return self.__source[item]
@@ -146,16 +293,45 @@ class FrozendictBase(Generic[K_co, V_co]):
 
     def __or__(self, other: Mapping[K, T], /) -> 'FrozendictBase[Union[K_co, K], Union[V_co, T]]':
         if isinstance(other, Mapping):
-            return self.__class__(chain(self.__source.items(), other.items()))
+            d = dict(_storage(self))
+            d |= _storage(other)
+            return self.__class__._derive(d)
 
         return NotImplemented
 
     def __ror__(self, other: Mapping[K, T], /) -> 'FrozendictBase[Union[K_co, K], Union[V_co, T]]':
         if isinstance(other, Mapping):
-            return self.__class__(chain(other.items(), self.__source.items()))
+            d = dict(_storage(other))
+            d |= _storage(self)
+            return self.__class__._derive(d)
 
         return NotImplemented
 
+    def diff(self, other: Mapping[K, T], /) -> FrozendictDelta[K, T]:
+        """
+        Return the delta which turns this dictionary into ``other``.
+        Values are compared by identity first, then by equality.
+        """
+        added = {}
+        changed = {}
+        removed = []
+        if _storage(self) is not _storage(other):
+            scan_delta(_storage(self), _storage(other), added, changed, removed)
+
+        return FrozendictDelta._adopt(added, changed, tuple(removed))
+
+    def patch(self, delta: FrozendictDelta[K, T], /) -> 'FrozendictBase[Union[K_co, K], Union[V_co, T]]':
+        """
+        Return a new dictionary with ``delta`` applied.
+        Raise :class:`ValueError` if the delta was not made from an equal dictionary.
+        """
+        if not delta:
+            return self
+
+        d = dict(_storage(self))
+        delta.apply_to(d)
+        return self.__class__._derive(d)
+
     def __eq__(self, other: Any, /) -> bool:
         return other == self.__source
 
@@ -183,12 +359,205 @@ def get_hash_value_or_unhashable_type(mapping: Mapping, /) -> Union[int, str]:
         return str(e)[18:-1]
 
 
+def has_value_hash(o: Any, /) -> bool:
+    """
+    Return true if hash value of ``o`` depends only on its value and the hash seed,
+    i.e., an equal object in another process with the same seed has the same hash value.
+    Only built-in scalars and immutable containers of such objects are considered.
+    """
+    cls = o.__class__
+    if cls in _value_hash_types:
+        return True
+
+    if cls is float or cls is complex:
+        # Since Python 3.10 hash value of NaN depends on its identity;
+        # a complex number is not equal to itself if any of its parts is NaN
+        return o == o
+
+    if cls is tuple or cls is frozenset:
+        return all(map(has_value_hash, o))
+
+    if isinstance(o, FrozendictBase):
+        return all_have_value_hash(o.keys()) and all_have_value_hash(o.values())
+
+    return False
+
+
+def all_have_value_hash(objects: Collection, /) -> bool:
+    """Return true if :func:`has_value_hash` is true for all objects."""
+    # Scalars are checked without calls of Python functions
+    return _value_hash_types.issuperset(map(type, objects)) or all(map(has_value_hash, objects))
+
+
+# Floats and complex numbers are checked for NaN separately.
+# Before Python 3.12 hash value of None depends on its address
+_value_hash_types = frozenset((str, bytes, int, bool, *((type(None),) if version_info >= (3, 12) else ())))
+HASH_SEED_TOKEN = hash('frozendictx')
+"""
+Hash value of a constant string.
+Processes with the same token hash strings and bytes the same way,
+thus they can share cached hash values.
+"""
+
+
+def restore_hashed(cls: type, d: dict, hash_value: int, token: int, /) -> 'frozendict':
+    """
+    Create a dictionary from ``d`` with the given cached hash value
+    if it was calculated with the same hash seed.
+    """
+    self = cls._unpickle(d)
+    if token == HASH_SEED_TOKEN:
+        self._frozendict__hash = hash_value
+
+    return self
+
+
+# region Digest
+# Every value is encoded as a tag, the length of its payload and the payload,
+# thus a concatenation of encodings is unambiguous.
+# Equal numbers have equal encodings like they have equal hash values, e.g., 1, 1.0 and True.
+# A mapping is encoded as its digest, which is calculated over sorted encodings of its items,
+# thus it does not depend on the order of items. Digests of frozendict are cached,
+# hence nested dictionaries are encoded without traversing them again.
+DIGEST_SIZE = 32
+"""The size of digests returned by :func:`mapping_digest` in bytes."""
+
+
+_header = Struct('<cQ').pack
+
+
+def _tagged(tag: bytes, payload: bytes, /) -> bytes:
+    return _header(tag, len(payload)) + payload
+
+
+# Integers are encoded as minimal two's complement, small ones are packed as 8 bytes
+_SMALL_INT = 1 << 63
+_small_int = Struct('<cQq').pack
+
+
+def _encode_int(o: int, /) -> bytes:
+    if -_SMALL_INT <= o < _SMALL_INT:
+        return _small_int(b'i', 8, o)
+
+    return _tagged(b'i', o.to_bytes((o.bit_length() + 8) // 8, 'little', signed=True))
+
+
+def _encode_float(o: float, /) -> bytes:
+    if o.is_integer():
+        return _encode_int(int(o))
+
+    # All NaNs are encoded the same way
+    return _tagged(b'f', pack('<d', float('nan') if isnan(o) else o))
+
+
+def _encode_set(o: frozenset, /) -> bytes:
+    return _tagged(b'S', b''.join(sorted(map(encode_value, o))))
+
+
+_encoders = {
+    str: lambda o, /: _tagged(b's', o.encode('utf-8', 'surrogatepass')),
+    int: _encode_int,
+    bool: _encode_int,
+    float: _encode_float,
+    type(None): lambda o, /: b'n',
+    bytes: lambda o, /: _tagged(b'b', o),
+    tuple: lambda o, /: _tagged(b't', b''.join(map(encode_value, o))),
+    frozenset: _encode_set,
+    complex: lambda o, /: _encode_float(o.real) if o.imag == 0 else _tagged(b'c', pack('<dd', o.real, o.imag)),
+    }
+
+
+def encode_value(o: Any, /) -> bytes:
+    """
+    Return the canonical encoding of an immutable value which does not depend on the hash seed.
+    Supported are strings, bytes, numbers, ``None``, tuples, frozensets and hashable mappings,
+    including subclasses of these types.
+    Raise TypeError for other values.
+    """
+    cls = o.__class__
+    # The most frequent types are encoded without extra calls
+    if cls is str:
+        payload = o.encode('utf-8', 'surrogatepass')
+        return _header(b's', len(payload)) + payload
+
+    if cls is int and -_SMALL_INT <= o < _SMALL_INT:
+        return _small_int(b'i', 8, o)
+
+    encode = _encoders.get(cls)
+    if encode is not None:
+        return encode(o)
+
+    if isinstance(o, frozendict):
+        return _tagged(b'm', o.digest())
+
+    if isinstance(o, Mapping) and o.__class__.__hash__ is not None:
+        return _tagged(b'm', mapping_digest(o))
+
+    for cls, encode in _encoders.items():
+        if isinstance(o, cls):
+            return encode(o)
+
+    raise TypeError(f'cannot digest {o.__class__.__name__!r} object')
+
+
+def mapping_digest(m: Mapping, /) -> bytes:
+    """
+    Calculate the digest of a mapping via BLAKE2b.
+    Unlike hash value, the digest does not depend on the hash seed,
+    thus it can be used as a key of a persistent or shared cache.
+    Equal mappings have equal digests regardless of the order of their items.
+    Raise TypeError if some key or value is not supported by :func:`encode_value`.
+    """
+    items = sorted(map(bytes.__add__, map(encode_value, m.keys()), map(encode_value, m.values())))
+    return blake2b(pack('<Q', len(items)) + b''.join(items), digest_size=DIGEST_SIZE).digest()
+# endregion
+
+
+_missing = object()
+_intern_pool = InternPool()
+INCREMENTAL_HASH_RATIO = 8
+"""
+When a hashed :class:`frozendict` is merged via ``|`` with a mapping
+at least this many times smaller than the result,
+hash value of the result is derived from the cached one.
+"""
+COMPACT_MAX_SIZE = 6
+"""
+:class:`frozendict` instances with at most this many items store them in two tuples
+instead of a dict. Such instances are smaller and are looked up by a linear scan of keys,
+for larger sizes the scan becomes noticeably slower than a hash lookup.
+"""
+
+
 class frozendict(FrozendictBase[K_co, V_co]):
     """
     Subclass of :class:`FrozendictBase`. Hashable if all values are hashable.
     If hashable, hash value is cached after its first calculation.
+    Hash value of a dictionary derived via ``|`` from a hashed one
+    is calculated from the cached value and changed items only.
+
+    Equal hashable dictionaries can be collapsed into one shared instance via ``intern``.
+
+    Dictionaries with at most :data:`COMPACT_MAX_SIZE` items are stored compactly
+    in a tuple of keys and a tuple of values.
+    Such instances are equal, hashed and pickled as other ones,
+    and ``__class__`` and ``isinstance`` report :class:`frozendict`,
+    but ``type()`` returns a private subclass.
+    Their lookups scan keys comparing them by identity and equality only, not by hash value,
+    thus they differ from dict lookups for keys whose equality does not agree with hash values.
+    Subclasses and ``adopt`` always use a dict.
+
+    ``digest`` returns a hash value which does not depend on the hash seed,
+    it is cached after its first calculation like hash value.
+
+    Reads are safe from multiple threads, including builds without GIL.
+    Caches, i.e., hash value, digest and sorted keys, are published without locks:
+    a cache is stored once as a complete object, and concurrent first calls
+    may calculate equal values several times instead of waiting for each other.
     """
-    __slots__ = '__hash',
+    # Weak references are required by the interning pool.
+    # This increases size of each instance by 8 bytes.
+    __slots__ = '__hash', '__digest', '__weakref__'
 
     # region new overload
     @overload
@@ -228,28 +597,243 @@ class frozendict(FrozendictBase[K_co, V_co]):
     # endregion
 
     def __new__(cls, iterable = (), /, **kwargs):
-        self = FrozendictBase.__new__(cls, iterable, **kwargs)
+        return cls._from_dict(dict(iterable, **kwargs))
+
+    @classmethod
+    def adopt(cls, d: dict[K_co, V_co], /) -> 'frozendict[K_co, V_co]':
+        """
+        Create a dictionary which uses ``d`` without copying.
+        ``d`` must not be modified afterwards.
+        """
+        self = super().adopt(d)
         # todo check behaviour with multiple inheritance
         self.__hash = None
+        self.__digest = None
         return self
 
+    @classmethod
+    def _from_dict(cls, d: dict[K_co, V_co], /) -> 'frozendict[K_co, V_co]':
+        if cls is frozendict and len(d) <= COMPACT_MAX_SIZE:
+            return _compactfrozendict._from_items(tuple(d), tuple(d.values()))
+
+        return cls.adopt(d)
+
+    def __cached_hash(self, /) -> Union[int, str]:
+        # The slot is read once and written once with a complete value.
+        # Threads which see None concurrently calculate and store equal values,
+        # thus no lock is required even without GIL, and a reader never sees a partial result.
+        h = self.__hash
+        if h is None:
+            h = get_hash_value_or_unhashable_type(_storage(self))
+            self.__hash = h
+
+        return h
+
     def __hash__(self, /):
-        if self.__hash is None:
-            self.__hash = get_hash_value_or_unhashable_type(self._FrozendictBase__source)
+        h = self.__hash
+        if h is None:
+            h = self.__cached_hash()
 
-        if isinstance(self.__hash, int):
-            return self.__hash
+        if isinstance(h, int):
+            return h
 
-        raise TypeError(f'unhashable type: {self.__hash!r}')
+        raise TypeError(f'unhashable type: {h!r}')
 
-    def __deepcopy__(self, memo, /):
-        if self.__hash is None:
-            self.__hash = get_hash_value_or_unhashable_type(self._FrozendictBase__source)
+    def digest(self, /) -> bytes:
+        """
+        Return the digest of the dictionary calculated via :func:`mapping_digest`.
+        Unlike hash value, it is the same in all processes. The digest is cached,
+        and nested dictionaries contribute their cached digests.
+        Raise TypeError if some key or value cannot be digested.
+        """
+        # Published like the hash value
+        h = self.__digest
+        if h is None:
+            h = mapping_digest(self)
+            self.__digest = h
+
+        return h
+
+    def _class_and_dict(self, /) -> tuple[type, dict]:
+        # Returns the class and a dict which recreate the dictionary on pickling and deep copying
+        return self.__class__, self._FrozendictBase__source
+
+    def __reduce__(self, /):
+        cls, source = self._class_and_dict()
+        return cls._unpickle, (source,), getattr(self, '__dict__', None)
+
+    def __reduce_ex__(self, protocol: int, /):
+        # The cached hash value is passed if it does not depend on identities of objects.
+        # It is dropped on unpickling if the hash seed is different.
+        cls, source = self._class_and_dict()
+        h = self.__hash
+        if (
+                isinstance(h, int)
+                and all_have_value_hash(source.keys())
+                and all_have_value_hash(source.values())
+        ):
+            return (
+                restore_hashed,
+                (cls, source, h, HASH_SEED_TOKEN),
+                getattr(self, '__dict__', None),
+                )
+
+        return cls._unpickle, (source,), getattr(self, '__dict__', None)
 
-        if isinstance(self.__hash, int):
+    def __deepcopy__(self, memo, /):
+        if isinstance(self.__cached_hash(), int):
             return self
 
-        return self.__class__(deepcopy(self._FrozendictBase__source, memo))
+        cls, source = self._class_and_dict()
+        return cls(deepcopy(source, memo))
+
+    def __eq__(self, other: Any, /) -> bool:
+        if self is other:
+            return True
+
+        # Different hash values imply different items.
+        # In particular, interned dictionaries are compared by identity in most cases.
+        if isinstance(other, frozendict):
+            h1 = self.__hash
+            h2 = other.__hash
+            if isinstance(h1, int) and isinstance(h2, int) and h1 != h2:
+                return False
+
+        return FrozendictBase.__eq__(self, other)
+
+    def __ne__(self, other: Any, /) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    @classmethod
+    def intern(cls, mapping: Mapping[K, T], /) -> 'frozendict[K, T]':
+        """
+        Return a shared dictionary equal to ``mapping``.
+        If there is no such dictionary, it is created from ``mapping`` unless it is already
+        an instance of this class, and then stored in the interning pool.
+        The pool keeps only weak references, dictionaries are removed from it when they are not used.
+        Raise TypeError if ``mapping`` is unhashable.
+        """
+        if mapping.__class__ is not cls:
+            mapping = cls(mapping)
+
+        return _intern_pool.intern(mapping)
+
+    # region interned overload
+    @classmethod
+    @overload
+    def interned(cls, /) -> 'frozendict': ...
+    @classmethod
+    @overload
+    def interned(cls, /, **kwargs: V_co) -> 'frozendict[str, V_co]': ...
+    @classmethod
+    @overload
+    def interned(cls, mapping: SupportsKeysAndGetItem[K, T], /) -> 'frozendict[K, T]': ...
+    @classmethod
+    @overload
+    def interned(cls, mapping: SupportsKeysAndGetItem[str, T], /, **kwargs: T) -> 'frozendict[str, T]': ...
+    @classmethod
+    @overload
+    def interned(cls, iterable: Iterable[tuple[K, T]], /) -> 'frozendict[K, T]': ...
+    @classmethod
+    @overload
+    def interned(cls, iterable: Iterable[tuple[str, T]], /, **kwargs: T) -> 'frozendict[str, T]': ...
+    # endregion
+
+    @classmethod
+    def interned(cls, iterable = (), /, **kwargs):
+        """Create a dictionary like the constructor does and pass it to ``intern``."""
+        return _intern_pool.intern(cls(iterable, **kwargs))
+
+    @staticmethod
+    def intern_stats() -> InternStats:
+        """Return statistics of the interning pool."""
+        return _intern_pool.stats()
+
+    @staticmethod
+    def schema(keys: Iterable[K], /) -> 'type[frozenrecord[K, Any]]':
+        """
+        Return a subclass of :class:`frozenrecord` which instances have exactly the given keys.
+        Such instances store only values, keys are shared among all of them.
+        """
+        # frozenrecord depends on this module
+        from ._schema import schema
+
+        return schema(keys)
+
+    def sorted_keys(self, /) -> SortedKeys[K_co]:
+        """
+        Return keys of the dictionary in sorted order with lookups in O(log n),
+        e.g., ``irange``, ``prefix``, ``floor``, ``ceil`` and ``nth``.
+        Keys must be comparable with each other.
+        The result is built on the first call and cached while the dictionary is alive.
+        """
+        return sorted_keys(self)
+
+    def __derive_hash(
+            self,
+            other: Mapping,
+            override: bool,
+            result: 'frozendict',
+            /,
+            removed: Collection = (),
+            ):
+        # Calculation of the state delta is done in Python, and it is several times slower
+        # than hashing of the same number of items via frozenset.
+        # Thus, it is worth only if other mapping is small enough compared to the result.
+        h = self.__hash
+        if not isinstance(h, int) or (len(other) + len(removed)) * INCREMENTAL_HASH_RATIO > len(result):
+            return
+
+        source = _storage(self)
+        state = hash_state(h, len(source))
+        if state is None:
+            return
+
+        try:
+            for k in removed:
+                state ^= item_hash_bits((k, source[k]))
+
+            for k, v in other.items():
+                old = source.get(k, _missing)
+                if old is _missing:
+                    state ^= item_hash_bits((k, v))
+                elif override:
+                    state ^= item_hash_bits((k, old)) ^ item_hash_bits((k, v))
+        except TypeError:
+            # Leave the hash value to be calculated on demand
+            return
+
+        result.__hash = hash_from_state(state, len(result))
+
+    def __or__(self, other: Mapping[K, T], /) -> 'frozendict[Union[K_co, K], Union[V_co, T]]':
+        result = FrozendictBase.__or__(self, other)
+        if result is not NotImplemented:
+            self.__derive_hash(other, True, result)
+
+        return result
+
+    def __ror__(self, other: Mapping[K, T], /) -> 'frozendict[Union[K_co, K], Union[V_co, T]]':
+        result = FrozendictBase.__ror__(self, other)
+        if result is not NotImplemented:
+            self.__derive_hash(other, False, result)
+
+        return result
+
+    def patch(self, delta: FrozendictDelta[K, T], /) -> 'frozendict[Union[K_co, K], Union[V_co, T]]':
+        """
+        Return a new dictionary with ``delta`` applied.
+        Raise :class:`ValueError` if the delta was not made from an equal dictionary.
+        If this dictionary is hashed, hash value of the result is derived from changed items.
+        """
+        result = FrozendictBase.patch(self, delta)
+        if result is not self:
+            self.__derive_hash(delta.changed | delta.added, True, result, delta.removed)
+
+        return result
 
     # region Overload for PyCharm
     # noinspection PyMethodOverriding
@@ -263,10 +847,168 @@ class frozendict(FrozendictBase[K_co, V_co]):
     @classmethod
     def fromkeys(cls, iterable, value = None, /): ...
 
-    def __or__(self, other: Mapping[K, T], /) -> 'frozendict[Union[K_co, K], Union[V_co, T]]': ...
-    def __ror__(self, other: Mapping[K, T], /) -> 'frozendict[Union[K_co, K], Union[V_co, T]]': ...
-
     del fromkeys
-    del __or__
-    del __ror__
+
+    @classmethod
+    def merged(cls, /, *mappings: Mapping[K_co, V_co]) -> 'frozendict[K_co, V_co]': ...
+
+    del merged
     # endregion
+
+
+class _CompactKeysView(KeysView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return iter(self._mapping._FrozendictBase__source)
+
+
+class _CompactValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return iter(self._mapping._compactfrozendict__values)
+
+
+class _CompactItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return zip(self._mapping._FrozendictBase__source, self._mapping._compactfrozendict__values)
+
+
+class _compactfrozendict(frozendict[K_co, V_co]):
+    # Storage of small frozendict instances: a tuple of keys and a tuple of values.
+    # Two tuples of n items take less memory than a dict for small n,
+    # and a lookup scans keys comparing them by identity first, then by equality.
+    # Keys are kept in the slot of FrozendictBase which holds a dict in other instances.
+    # Instances pretend to be frozendict, they are never created directly:
+    # code which dispatches on __class__ treats them as frozendict,
+    # and pickles and deep copies are created via frozendict.
+    # Hash value, equality, views and union read the tuples without creating a dict.
+    __slots__ = '__values',
+
+    @property
+    def __class__(self, /):
+        return frozendict
+
+    @classmethod
+    def adopt(cls, d: dict[K_co, V_co], /) -> frozendict[K_co, V_co]:
+        return frozendict.adopt(d)
+
+    @classmethod
+    def _from_dict(cls, d: dict[K_co, V_co], /) -> frozendict[K_co, V_co]:
+        return frozendict._from_dict(d)
+
+    @classmethod
+    def _from_items(cls, keys: tuple, values: tuple, /) -> '_compactfrozendict[K_co, V_co]':
+        self = object.__new__(cls)
+        self._FrozendictBase__source = keys
+        self.__values = values
+        self._frozendict__hash = None
+        self._frozendict__digest = None
+        return self
+
+    def _class_and_dict(self, /) -> tuple[type, dict]:
+        return frozendict, dict(zip(self._FrozendictBase__source, self.__values))
+
+    def _frozendict__cached_hash(self, /) -> Union[int, str]:
+        # Equal to mapping_hash of a small mapping, items are hashed without calls of Python code
+        h = self._frozendict__hash
+        if h is None:
+            try:
+                h = hash(frozenset(zip(self._FrozendictBase__source, self.__values)))
+            except TypeError as e:
+                h = str(e)[18:-1]
+
+            self._frozendict__hash = h
+
+        return h
+
+    def __getitem__(self, item: K_co, /) -> V_co:
+        try:
+            return self.__values[self._FrozendictBase__source.index(item)]
+        except ValueError:
+            # raises TypeError if item is not hashable
+            hash(item)
+            raise KeyError(item) from None
+
+    def get(self, key, default = None, /):
+        """Return the value for key if ``key`` is in the dictionary, else ``default``."""
+        keys = self._FrozendictBase__source
+        if key in keys:
+            return self.__values[keys.index(key)]
+
+        hash(key)
+        return default
+
+    def keys(self, /) -> KeysView[K_co]:
+        """Return a set-like object providing a view on keys."""
+        return _CompactKeysView(self)
+
+    def values(self, /) -> ValuesView[V_co]:
+        """Return an object providing a view on values."""
+        return _CompactValuesView(self)
+
+    def items(self, /) -> ItemsView[K_co, V_co]:
+        """Return a set-like object providing a view on key-value pairs."""
+        return _CompactItemsView(self)
+
+    def __len__(self, /):
+        return len(self._FrozendictBase__source)
+
+    def __contains__(self, item: Any, /):
+        # raises TypeError if item is not hashable
+        return item in self._FrozendictBase__source or hash(item) is None
+
+    def __iter__(self, /) -> Iterator[K_co]:
+        return iter(self._FrozendictBase__source)
+
+    def __reversed__(self, /) -> Iterator[K_co]:
+        return reversed(self._FrozendictBase__source)
+
+    def __str__(self, /):
+        return f'frozendict({dict(self.items()) if self else ""})'
+
+    __repr__ = __str__
+
+    def __eq__(self, other: Any, /) -> bool:
+        keys = self._FrozendictBase__source
+        if isinstance(other, frozendict):
+            # Dictionaries built from the same keys in the same order are compared as tuples
+            if type(other) is _compactfrozendict and keys == other._FrozendictBase__source:
+                h1 = self._frozendict__hash
+                h2 = other._frozendict__hash
+                if isinstance(h1, int) and isinstance(h2, int) and h1 != h2:
+                    return False
+
+                return self.__values == other.__values
+
+            h1 = self._frozendict__hash
+            h2 = other._frozendict__hash
+            if isinstance(h1, int) and isinstance(h2, int) and h1 != h2:
+                return False
+
+        source = _storage(other)
+        if source.__class__ is dict or isinstance(other, Mapping):
+            # Items are compared like dict compares them, lookups in a dict are done without calls of Python code
+            items = source.items()
+            return len(items) == len(keys) and all(map(items.__contains__, zip(keys, self.__values)))
+
+        return NotImplemented
+
+    # Definition of __eq__ resets the inherited __hash__
+    __hash__ = frozendict.__hash__
+
+    def sizeof(self, /, gc_self: bool = True, gc_inner: bool = False) -> int:
+        """Return the size of a dictionary in bytes.
+
+        :param gc_self: If true, garbage collector overhead for itself is included.
+        :param gc_inner: If true, garbage collector overhead for inner tuples is included.
+        """
+        keys = self._FrozendictBase__source
+        return (
+                (getsizeof(self) if gc_self else self.__sizeof__())
+                + (getsizeof(keys) if gc_inner else keys.__sizeof__())
+                + (getsizeof(self.__values) if gc_inner else self.__values.__sizeof__())
+        )
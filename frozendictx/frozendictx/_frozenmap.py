@@ -0,0 +1,732 @@
+# mypy: ignore-errors
+from collections.abc import ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
+from copy import deepcopy
+from itertools import chain
+from sys import getsizeof, hash_info
+from typing import Any, Optional, Union, overload
+
+from ._delta import FrozendictDelta, scan_delta
+from ._frozendict import (
+    FrozendictBase,
+    K,
+    K_co,
+    SupportsKeysAndGetItem,
+    T,
+    V_co,
+    get_hash_value_or_unhashable_type,
+    hash_from_state,
+    hash_state,
+    item_hash_bits,
+    )
+
+# Every level of the trie consumes 5 bits of a hash value, i.e., every node has up to 32 slots.
+_SHIFT_STEP = 5
+_INDEX_MASK = (1 << _SHIFT_STEP) - 1
+_HASH_MASK = (1 << hash_info.width) - 1
+
+# Marks a slot of a node array which holds a child node instead of a key-value pair.
+_subnode = object()
+_missing = object()
+
+if hasattr(int, 'bit_count'):
+    _bit_count = int.bit_count
+else:  # Python 3.9
+    def _bit_count(n: int, /) -> int:
+        return bin(n).count('1')
+
+
+def _hash(key: Any, /) -> int:
+    return hash(key) & _HASH_MASK
+
+
+class _BitmapNode:
+    """
+    A node of hash array mapped trie.
+    Its array holds keys and values one after another;
+    a key slot equal to ``_subnode`` means the next slot holds a child node.
+    A set bit in the bitmap marks which of 32 possible slots are present in the array.
+
+    Nodes are never changed once they become reachable from some ``frozenmap``.
+    A node is changed in place only by the operation which created it,
+    this operation is identified by ``mutid``.
+    """
+    __slots__ = 'bitmap', 'array', 'mutid'
+
+    def __init__(self, bitmap: int, array: list, mutid: Optional[object], /):
+        self.bitmap = bitmap
+        self.array = array
+        self.mutid = mutid
+
+    def editable(self, mutid: Optional[object], /) -> '_BitmapNode':
+        if mutid is not None and self.mutid is mutid:
+            return self
+
+        return _BitmapNode(self.bitmap, self.array.copy(), mutid)
+
+    def find(self, shift: int, h: int, key: Any, /) -> Any:
+        node = self
+        while True:
+            if node.__class__ is _CollisionNode:
+                return node.find(shift, h, key)
+
+            bit = 1 << ((h >> shift) & _INDEX_MASK)
+            if not node.bitmap & bit:
+                return _missing
+
+            idx = _bit_count(node.bitmap & (bit - 1)) * 2
+            k = node.array[idx]
+            if k is _subnode:
+                node = node.array[idx + 1]
+                shift += _SHIFT_STEP
+            elif k is key or k == key:
+                return node.array[idx + 1]
+            else:
+                return _missing
+
+    def assoc(self, shift: int, h: int, key: Any, value: Any, mutid: Optional[object], /):
+        """
+        Returns a node with the given key bound to the given value
+        and whether the key was absent in this node.
+        """
+        bit = 1 << ((h >> shift) & _INDEX_MASK)
+        idx = _bit_count(self.bitmap & (bit - 1)) * 2
+
+        if not self.bitmap & bit:
+            if mutid is not None and self.mutid is mutid:
+                self.array[idx:idx] = key, value
+                self.bitmap |= bit
+                return self, True
+
+            array = self.array
+            return _BitmapNode(self.bitmap | bit, [*array[:idx], key, value, *array[idx:]], mutid), True
+
+        k = self.array[idx]
+        v = self.array[idx + 1]
+        if k is _subnode:
+            sub, added = v.assoc(shift + _SHIFT_STEP, h, key, value, mutid)
+            if sub is v:
+                return self, added
+
+            node = self.editable(mutid)
+            node.array[idx + 1] = sub
+            return node, added
+
+        if k is key or k == key:
+            if v is value:
+                return self, False
+
+            node = self.editable(mutid)
+            node.array[idx + 1] = value
+            return node, False
+
+        # Another key occupies the slot, both pairs go one level below.
+        sub = _make_node(shift + _SHIFT_STEP, _hash(k), k, v, h, key, value, mutid)
+        node = self.editable(mutid)
+        node.array[idx] = _subnode
+        node.array[idx + 1] = sub
+        return node, True
+
+    def without(self, shift: int, h: int, key: Any, mutid: Optional[object], /):
+        """
+        Returns a node without the given key or ``None`` if such node is empty.
+        Returns this node if the key is absent.
+        """
+        bit = 1 << ((h >> shift) & _INDEX_MASK)
+        if not self.bitmap & bit:
+            return self
+
+        idx = _bit_count(self.bitmap & (bit - 1)) * 2
+        k = self.array[idx]
+        v = self.array[idx + 1]
+        if k is _subnode:
+            sub = v.without(shift + _SHIFT_STEP, h, key, mutid)
+            if sub is v:
+                return self
+
+            if sub is not None:
+                node = self.editable(mutid)
+                pair = sub.single_pair()
+                if pair is None:
+                    node.array[idx + 1] = sub
+                else:
+                    # A child with a single pair is inlined into its parent.
+                    node.array[idx:idx + 2] = pair
+
+                return node
+        elif not (k is key or k == key):
+            return self
+
+        if self.bitmap == bit:
+            return None
+
+        node = self.editable(mutid)
+        del node.array[idx:idx + 2]
+        node.bitmap ^= bit
+        return node
+
+    def single_pair(self, /) -> Optional[list]:
+        if len(self.array) == 2 and self.array[0] is not _subnode:
+            return self.array
+
+        return None
+
+
+class _CollisionNode:
+    """
+    A node of hash array mapped trie which holds keys with the same hash value.
+    Its array holds keys and values one after another.
+    """
+    __slots__ = 'hash', 'array', 'mutid'
+
+    def __init__(self, h: int, array: list, mutid: Optional[object], /):
+        self.hash = h
+        self.array = array
+        self.mutid = mutid
+
+    def editable(self, mutid: Optional[object], /) -> '_CollisionNode':
+        if mutid is not None and self.mutid is mutid:
+            return self
+
+        return _CollisionNode(self.hash, self.array.copy(), mutid)
+
+    def index(self, key: Any, /) -> int:
+        array = self.array
+        for i in range(0, len(array), 2):
+            k = array[i]
+            if k is key or k == key:
+                return i
+
+        return -1
+
+    def find(self, shift: int, h: int, key: Any, /) -> Any:
+        if h == self.hash:
+            idx = self.index(key)
+            if idx >= 0:
+                return self.array[idx + 1]
+
+        return _missing
+
+    def assoc(self, shift: int, h: int, key: Any, value: Any, mutid: Optional[object], /):
+        if h != self.hash:
+            # Place this node into a bitmap node and add the pair there.
+            bit = 1 << ((self.hash >> shift) & _INDEX_MASK)
+            return _BitmapNode(bit, [_subnode, self], mutid).assoc(shift, h, key, value, mutid)
+
+        idx = self.index(key)
+        if idx < 0:
+            node = self.editable(mutid)
+            node.array += key, value
+            return node, True
+
+        if self.array[idx + 1] is value:
+            return self, False
+
+        node = self.editable(mutid)
+        node.array[idx + 1] = value
+        return node, False
+
+    def without(self, shift: int, h: int, key: Any, mutid: Optional[object], /):
+        if h != self.hash:
+            return self
+
+        idx = self.index(key)
+        if idx < 0:
+            return self
+
+        node = self.editable(mutid)
+        del node.array[idx:idx + 2]
+        return node
+
+    def single_pair(self, /) -> Optional[list]:
+        if len(self.array) == 2:
+            return self.array
+
+        return None
+
+
+def _make_node(
+        shift: int,
+        h1: int,
+        key1: Any,
+        value1: Any,
+        h2: int,
+        key2: Any,
+        value2: Any,
+        mutid: Optional[object],
+        /,
+        ) -> Union[_BitmapNode, _CollisionNode]:
+    if h1 == h2:
+        return _CollisionNode(h1, [key1, value1, key2, value2], mutid)
+
+    node, _ = _BitmapNode(0, [], mutid).assoc(shift, h1, key1, value1, mutid)
+    node, _ = node.assoc(shift, h2, key2, value2, mutid)
+    return node
+
+
+def _iter_items(node: Union[_BitmapNode, _CollisionNode], /) -> Iterator[tuple]:
+    array = node.array
+    for i in range(0, len(array), 2):
+        k = array[i]
+        if k is _subnode:
+            yield from _iter_items(array[i + 1])
+        else:
+            yield k, array[i + 1]
+
+
+def _iter_keys(node: Union[_BitmapNode, _CollisionNode], /) -> Iterator:
+    array = node.array
+    for i in range(0, len(array), 2):
+        k = array[i]
+        if k is _subnode:
+            yield from _iter_keys(array[i + 1])
+        else:
+            yield k
+
+
+def _iter_values(node: Union[_BitmapNode, _CollisionNode], /) -> Iterator:
+    array = node.array
+    for i in range(0, len(array), 2):
+        if array[i] is _subnode:
+            yield from _iter_values(array[i + 1])
+        else:
+            yield array[i + 1]
+
+
+def _iter_nodes(node: Union[_BitmapNode, _CollisionNode], /) -> Iterator:
+    yield node
+    array = node.array
+    for i in range(0, len(array), 2):
+        if array[i] is _subnode:
+            yield from _iter_nodes(array[i + 1])
+
+
+def _iter_pairs(iterable, kwargs: dict, /) -> Iterator[tuple]:
+    # Mimics how dict constructor treats its arguments.
+    if hasattr(iterable, 'keys'):
+        for k in iterable.keys():
+            yield k, iterable[k]
+    else:
+        for k, v in iterable:
+            yield k, v
+
+    yield from kwargs.items()
+
+
+def _slot_items(k: Any, v: Any, /) -> dict:
+    # Returns items stored in a slot of a bitmap node
+    if k is _subnode:
+        return dict(_iter_items(v))
+
+    return {k: v}
+
+
+def _diff_nodes(
+        a: Union[_BitmapNode, _CollisionNode],
+        b: Union[_BitmapNode, _CollisionNode],
+        shift: int,
+        added: dict,
+        changed: dict,
+        removed: list,
+        /,
+        ):
+    # Nodes shared by both tries are skipped without visiting their items,
+    # thus the cost depends on the number of nodes changed since the tries diverged.
+    if a is b:
+        return
+
+    if a.__class__ is not _BitmapNode or b.__class__ is not _BitmapNode:
+        scan_delta(dict(_iter_items(a)), dict(_iter_items(b)), added, changed, removed)
+        return
+
+    a_array = a.array
+    b_array = b.array
+    a_idx = 0
+    b_idx = 0
+    bits = a.bitmap | b.bitmap
+    while bits:
+        bit = bits & -bits
+        bits ^= bit
+        if a.bitmap & bit:
+            ka = a_array[a_idx]
+            va = a_array[a_idx + 1]
+            a_idx += 2
+        else:
+            ka = _missing
+
+        if b.bitmap & bit:
+            kb = b_array[b_idx]
+            vb = b_array[b_idx + 1]
+            b_idx += 2
+        else:
+            kb = _missing
+
+        if kb is _missing:
+            removed.extend(_slot_items(ka, va))
+        elif ka is _missing:
+            added |= _slot_items(kb, vb)
+        elif ka is _subnode and kb is _subnode:
+            _diff_nodes(va, vb, shift + _SHIFT_STEP, added, changed, removed)
+        elif ka is _subnode or kb is _subnode:
+            scan_delta(_slot_items(ka, va), _slot_items(kb, vb), added, changed, removed)
+        elif ka is kb or ka == kb:
+            if not (va is vb or va == vb):
+                changed[kb] = vb
+        else:
+            removed.append(ka)
+            added[kb] = vb
+
+
+_empty_node = _BitmapNode(0, [], None)
+
+
+def _derive_state(state: int, old: Any, key: Any, value: Any, /) -> Optional[int]:
+    # Returns the hash state after key is bound to value or None if value is unhashable.
+    try:
+        if old is _missing:
+            return state ^ item_hash_bits((key, value))
+
+        return state ^ item_hash_bits((key, old)) ^ item_hash_bits((key, value))
+    except TypeError:
+        return None
+
+
+class _FrozenmapKeysView(KeysView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return _iter_keys(self._mapping._frozenmap__root)
+
+
+class _FrozenmapValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return _iter_values(self._mapping._frozenmap__root)
+
+
+class _FrozenmapItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return _iter_items(self._mapping._frozenmap__root)
+
+
+class frozenmap(FrozendictBase[K_co, V_co]):
+    """
+    Persistent immutable dictionary based on hash array mapped trie.
+    Methods ``set``, ``delete`` and ``update`` and operator ``|``
+    return a new dictionary which shares structure with the original one
+    and require O(log32 n) time and memory per changed key.
+
+    Iteration order is determined by hash values of keys, insertion order is not preserved.
+    Hashable if all values are hashable.
+    If hashable, hash value is cached after its first calculation.
+    """
+    __slots__ = '__root', '__len', '__hash'
+
+    # region new overload
+    @overload
+    def __new__(cls, /) -> 'frozenmap': ...
+    @overload
+    def __new__(cls, /, **kwargs: V_co) -> 'frozenmap[str, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            mapping: SupportsKeysAndGetItem[K_co, V_co],
+            /,
+            ) -> 'frozenmap[K_co, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            mapping: SupportsKeysAndGetItem[str, V_co],
+            /,
+            **kwargs: V_co,
+            ) -> 'frozenmap[str, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            iterable: Iterable[tuple[K_co, V_co]],
+            /
+            ) -> 'frozenmap[K_co, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            iterable: Iterable[tuple[str, V_co]],
+            /,
+            **kwargs: V_co,
+            ) -> 'frozenmap[str, V_co]': ...
+    # endregion
+
+    def __new__(cls, iterable = (), /, **kwargs):
+        if isinstance(iterable, frozenmap) and not kwargs:
+            return cls.__from_root(iterable.__root, iterable.__len)
+
+        return cls.__from_root(_empty_node, 0).__update(_iter_pairs(iterable, kwargs))
+
+    @classmethod
+    def adopt(cls, d: dict[K_co, V_co], /) -> 'frozenmap[K_co, V_co]':
+        """Create a dictionary from items of ``d``. Items are stored in a trie, thus they are copied."""
+        return cls(d)
+
+    @classmethod
+    def __from_root(cls, root: _BitmapNode, length: int, /, state: Optional[int] = None):
+        self = object.__new__(cls)
+        self.__root = root
+        self.__len = length
+        self.__hash = None if state is None else hash_from_state(state, length)
+        return self
+
+    def __hash_state(self, /) -> Optional[int]:
+        # The state of the cached hash value, it is used to derive hash values of new dictionaries.
+        if isinstance(self.__hash, int):
+            return hash_state(self.__hash, self.__len)
+
+        return None
+
+    def __reduce__(self, /):
+        return self.__class__, (dict(_iter_items(self.__root)),)
+
+    def __update(self, pairs: Iterable[tuple], /):
+        # Nodes created during this call are changed in place until the call ends.
+        mutid = object()
+        root = self.__root
+        length = self.__len
+        state = self.__hash_state()
+        for k, v in pairs:
+            h = _hash(k)
+            if state is not None:
+                state = _derive_state(state, root.find(0, h, k), k, v)
+
+            root, added = root.assoc(0, h, k, v, mutid)
+            length += added
+
+        if root is self.__root:
+            return self
+
+        return self.__from_root(root, length, state)
+
+    def set(self, key: K, value: T, /) -> 'frozenmap[Union[K_co, K], Union[V_co, T]]':
+        """Return a new dictionary with ``key`` bound to ``value``."""
+        h = _hash(key)
+        root, added = self.__root.assoc(0, h, key, value, None)
+        if root is self.__root:
+            return self
+
+        state = self.__hash_state()
+        if state is not None:
+            state = _derive_state(state, self.__root.find(0, h, key), key, value)
+
+        return self.__from_root(root, self.__len + added, state)
+
+    def delete(self, key: K_co, /) -> 'frozenmap[K_co, V_co]':
+        """Return a new dictionary without ``key``. Raise :class:`KeyError` if it is absent."""
+        h = _hash(key)
+        root = self.__root.without(0, h, key, None)
+        if root is self.__root:
+            raise KeyError(key)
+
+        state = self.__hash_state()
+        if state is not None:
+            state ^= item_hash_bits((key, self.__root.find(0, h, key)))
+
+        return self.__from_root(_empty_node if root is None else root, self.__len - 1, state)
+
+    # region update overload
+    @overload
+    def update(self, /, **kwargs: T) -> 'frozenmap[Union[K_co, str], Union[V_co, T]]': ...
+    @overload
+    def update(
+            self,
+            mapping: SupportsKeysAndGetItem[K, T],
+            /,
+            ) -> 'frozenmap[Union[K_co, K], Union[V_co, T]]': ...
+
+    @overload
+    def update(
+            self,
+            iterable: Iterable[tuple[K, T]],
+            /,
+            ) -> 'frozenmap[Union[K_co, K], Union[V_co, T]]': ...
+    # endregion
+
+    def update(self, iterable = (), /, **kwargs):
+        """
+        Return a new dictionary updated with pairs from ``iterable`` and ``kwargs``.
+        Accepts the same arguments as :meth:`dict.update`.
+        """
+        return self.__update(_iter_pairs(iterable, kwargs))
+
+    def diff(self, other: Mapping[K, T], /) -> FrozendictDelta[K, T]:
+        """
+        Return the delta which turns this dictionary into ``other``.
+        Values are compared by identity first, then by equality.
+        If ``other`` is a :class:`frozenmap` derived from this one or vice versa,
+        only nodes which are not shared by both are visited.
+        """
+        if not isinstance(other, frozenmap):
+            return FrozendictBase.diff(self, other)
+
+        added = {}
+        changed = {}
+        removed = []
+        _diff_nodes(self.__root, other.__root, 0, added, changed, removed)
+        return FrozendictDelta._adopt(added, changed, tuple(removed))
+
+    def patch(self, delta: FrozendictDelta[K, T], /) -> 'frozenmap[Union[K_co, K], Union[V_co, T]]':
+        """
+        Return a new dictionary with ``delta`` applied.
+        Raise :class:`ValueError` if the delta was not made from an equal dictionary.
+        Nodes without changed keys are shared with this dictionary.
+        """
+        if not delta:
+            return self
+
+        root = self.__root
+        for k in delta.changed:
+            if root.find(0, _hash(k), k) is _missing:
+                raise ValueError(f'changed key {k!r} is absent')
+
+        for k in delta.added:
+            if root.find(0, _hash(k), k) is not _missing:
+                raise ValueError(f'added key {k!r} is present')
+
+        # Nodes created during this call are changed in place until the call ends.
+        mutid = object()
+        state = self.__hash_state()
+        for k in delta.removed:
+            h = _hash(k)
+            old = root.find(0, h, k)
+            if old is _missing:
+                raise ValueError(f'removed key {k!r} is absent')
+
+            if state is not None:
+                try:
+                    state ^= item_hash_bits((k, old))
+                except TypeError:
+                    state = None
+
+            root = root.without(0, h, k, mutid)
+            if root is None:
+                root = _empty_node
+
+        result = self.__from_root(root, self.__len - len(delta.removed), state)
+        return result.__update(chain(delta.changed.items(), delta.added.items()))
+
+    def __getitem__(self, item: K_co, /) -> V_co:
+        value = self.__root.find(0, _hash(item), item)
+        if value is _missing:
+            raise KeyError(item)
+
+        return value
+
+    def get(self, key, default = None, /):
+        """Return the value for key if ``key`` is in the dictionary, else ``default``."""
+        value = self.__root.find(0, _hash(key), key)
+        return default if value is _missing else value
+
+    def keys(self, /) -> KeysView[K_co]:
+        """Return a set-like object providing a view on keys."""
+        return _FrozenmapKeysView(self)
+
+    def values(self, /) -> ValuesView[V_co]:
+        """Return an object providing a view on values."""
+        return _FrozenmapValuesView(self)
+
+    def items(self, /) -> ItemsView[K_co, V_co]:
+        """Return a set-like object providing a view on key-value pairs."""
+        return _FrozenmapItemsView(self)
+
+    def __hash__(self, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self)
+
+        if isinstance(self.__hash, int):
+            return self.__hash
+
+        raise TypeError(f'unhashable type: {self.__hash!r}')
+
+    def __deepcopy__(self, memo, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self)
+
+        if isinstance(self.__hash, int):
+            return self
+
+        return self.__class__(deepcopy(dict(_iter_items(self.__root)), memo))
+
+    def __str__(self, /):
+        return f'{self.__class__.__name__}({dict(_iter_items(self.__root)) if self.__len else ""})'
+
+    __repr__ = __str__
+
+    def __len__(self, /):
+        return self.__len
+
+    def __contains__(self, item: Any, /):
+        # raises TypeError if item is not hashable
+        return self.__root.find(0, _hash(item), item) is not _missing
+
+    def __iter__(self, /) -> Iterator[K_co]:
+        return _iter_keys(self.__root)
+
+    # Order of keys is arbitrary
+    __reversed__ = None
+
+    def __or__(self, other: Mapping[K, T], /) -> 'frozenmap[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            return self.__update(other.items())
+
+        return NotImplemented
+
+    def __ror__(self, other: Mapping[K, T], /) -> 'frozenmap[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            # Pairs of this dictionary take precedence,
+            # add only those pairs of other mapping which keys are absent here.
+            root = self.__root
+            return self.__update((k, v) for k, v in other.items() if root.find(0, _hash(k), k) is _missing)
+
+        return NotImplemented
+
+    def __eq__(self, other: Any, /) -> bool:
+        if self is other:
+            return True
+
+        if isinstance(other, Mapping):
+            if self.__len != len(other):
+                return False
+
+            for k, v in _iter_items(self.__root):
+                o = other.get(k, _missing)
+                if not (o is v or o == v):
+                    return False
+
+            return True
+
+        return NotImplemented
+
+    def __ne__(self, other: Any, /) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def sizeof(self, /, gc_self: bool = True, gc_inner: bool = False) -> int:
+        """Return the size of a dictionary in bytes.
+        Nodes shared with other dictionaries are included.
+
+        :param gc_self: If true, garbage collector overhead for itself is included.
+        :param gc_inner: If true, garbage collector overhead for trie nodes is included.
+        """
+        size = getsizeof(self) if gc_self else self.__sizeof__()
+        for node in _iter_nodes(self.__root):
+            if gc_inner:
+                size += getsizeof(node) + getsizeof(node.array)
+            else:
+                size += node.__sizeof__() + node.array.__sizeof__()
+
+        return size
@@ -0,0 +1,100 @@
+# mypy: ignore-errors
+from threading import Lock
+from typing import Any, NamedTuple
+from weakref import ref
+
+
+class InternStats(NamedTuple):
+    """Statistics of an interning pool."""
+    hits: int
+    """The number of times an equal instance was found in the pool."""
+    misses: int
+    """The number of times an instance was added to the pool."""
+    size: int
+    """The number of alive instances in the pool."""
+    bytes_saved: int
+    """Total size of duplicates replaced by instances from the pool."""
+
+    @property
+    def hit_rate(self, /) -> float:
+        """The ratio of hits to all interning attempts."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.
+
+
+class InternPool:
+    """
+    Pool of hashable instances which keeps only weak references to them.
+    Equal instances of the same type are collapsed into the one stored first.
+    Instances must support weak references and have method ``sizeof``.
+    The pool can be used from several threads at once.
+    """
+    __slots__ = '_table', '_size', '_hits', '_misses', '_bytes_saved', '_lock', '_dead'
+
+    def __init__(self, /):
+        # Maps hash values to weak references.
+        # A list of references is used when different instances have the same hash value.
+        self._table: dict[int, list[ref]] = {}
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+        self._lock = Lock()
+        # Hash values and references of collected instances.
+        # Callbacks of references run in any thread, including one which holds the lock,
+        # thus they only append here and the references are removed under the lock.
+        self._dead: list[tuple[int, ref]] = []
+
+    def intern(self, instance: Any, /) -> Any:
+        """
+        Return an instance from the pool equal to the given one.
+        If there is no such instance, add the given one to the pool and return it.
+        Raise TypeError if the instance is unhashable.
+        """
+        h = hash(instance)
+        with self._lock:
+            if self._dead:
+                self._remove_dead()
+
+            refs = self._table.get(h)
+            if refs is None:
+                refs = self._table[h] = []
+            else:
+                cls = instance.__class__
+                for r in refs:
+                    o = r()
+                    if o is not None and o.__class__ is cls and o == instance:
+                        self._hits += 1
+                        if o is not instance:
+                            self._bytes_saved += instance.sizeof()
+
+                        return o
+
+            dead = self._dead
+            refs.append(ref(instance, lambda r, /: dead.append((h, r))))
+            self._size += 1
+            self._misses += 1
+            return instance
+
+    def _remove_dead(self, /):
+        # Must be called under the lock
+        dead = self._dead
+        while dead:
+            h, r = dead.pop()
+            refs = self._table[h]
+            refs.remove(r)
+            if not refs:
+                del self._table[h]
+
+            self._size -= 1
+
+    def stats(self, /) -> InternStats:
+        """Return statistics of this pool."""
+        with self._lock:
+            self._remove_dead()
+            return InternStats(self._hits, self._misses, self._size, self._bytes_saved)
+
+    def __len__(self, /):
+        with self._lock:
+            self._remove_dead()
+            return self._size
@@ -0,0 +1,137 @@
+# mypy: ignore-errors
+from collections.abc import Iterable, Iterator
+from json import JSONDecoder
+from typing import Any, IO, Union
+
+from ._frozendict import FrozendictBase, frozendict
+
+MAX_INTERNED = 1 << 16
+"""
+The default maximal number of keys and sub-objects remembered by :func:`iter_ndjson`.
+When it is exceeded, remembered objects are forgotten.
+"""
+
+# Scalars which can be equal to each other while being different JSON values, e.g., 1, 1.0 and true
+_numbers = frozenset((int, bool))
+
+
+class _Builder:
+    """
+    Builds immutable values during decoding via ``object_pairs_hook``.
+    Equal keys and sub-objects are replaced with the ones met first.
+    """
+    __slots__ = 'cls', 'intern', 'max_size', 'keys', 'objects'
+
+    def __init__(self, cls: type, intern: bool, max_size: int, /):
+        self.cls = cls
+        self.intern = intern
+        self.max_size = max_size
+        self.keys = {}
+        # Maps tokens of sub-objects to sub-objects
+        self.objects = {}
+
+    @staticmethod
+    def _tokens(values: Iterable[Any], /) -> Iterator[Any]:
+        # Equal tokens imply equal JSON values.
+        # Sub-objects are already interned, thus they are identified by identity.
+        # Floats are identified by representations, since 0.0 and -0.0 are equal.
+        return (
+            v if v.__class__ is str
+            else (v.__class__, v) if v.__class__ in _numbers
+            else (float, repr(v)) if v.__class__ is float
+            else id(v)
+            for v in values
+            )
+
+    def _store(self, token: tuple, o: Any, /) -> Any:
+        # Called when the token is not found, thus a new object is created only for the first equal value
+        objects = self.objects
+        if len(objects) >= self.max_size:
+            objects.clear()
+
+        objects[token] = o
+        return o
+
+    def array(self, items: list, /) -> tuple:
+        array = self.array
+        if not self.intern:
+            return tuple(array(v) if v.__class__ is list else v for v in items)
+
+        items = [array(v) if v.__class__ is list else v for v in items]
+        token = (tuple, *self._tokens(items))
+        o = self.objects.get(token)
+        return self._store(token, tuple(items)) if o is None else o
+
+    def object(self, pairs: list[tuple[str, Any]], /) -> FrozendictBase:
+        array = self.array
+        if self.intern:
+            keys = self.keys
+            if len(keys) >= self.max_size:
+                keys.clear()
+
+            d = {keys.setdefault(k, k): array(v) if v.__class__ is list else v for k, v in pairs}
+            token = (dict, *d, *self._tokens(d.values()))
+            o = self.objects.get(token)
+            return self._store(token, self.cls._derive(d)) if o is None else o
+
+        return self.cls._derive({k: array(v) if v.__class__ is list else v for k, v in pairs})
+
+    def decoder(self, /) -> JSONDecoder:
+        return JSONDecoder(object_pairs_hook=self.object)
+
+    def result(self, o: Any, /) -> Any:
+        return self.array(o) if o.__class__ is list else o
+
+
+def loads_json(
+        s: Union[str, bytes, bytearray],
+        /,
+        cls: type[FrozendictBase] = frozendict,
+        intern: bool = True,
+        ) -> Any:
+    """
+    Decode a JSON document from ``s`` into immutable values.
+    Objects are created as instances of ``cls``, arrays as tuples.
+    If ``intern`` is true, equal keys and sub-objects are shared within the document.
+    Values of different types are never shared, e.g., ``1``, ``1.0`` and ``true``.
+    """
+    if not isinstance(s, str):
+        s = s.decode()
+
+    builder = _Builder(cls, intern, float('inf'))
+    return builder.result(builder.decoder().decode(s))
+
+
+def load_json(
+        fp: IO,
+        /,
+        cls: type[FrozendictBase] = frozendict,
+        intern: bool = True,
+        ) -> Any:
+    """Decode a JSON document from a text or binary file like :func:`loads_json` does."""
+    return loads_json(fp.read(), cls, intern)
+
+
+def iter_ndjson(
+        lines: Iterable[Union[str, bytes]],
+        /,
+        cls: type[FrozendictBase] = frozendict,
+        intern: bool = True,
+        max_interned: int = MAX_INTERNED,
+        ) -> Iterator[Any]:
+    """
+    Decode newline-delimited JSON documents from ``lines``, e.g., a text or binary file,
+    and yield them one by one like :func:`loads_json` does. Blank lines are skipped.
+
+    Equal keys and sub-objects are shared across documents,
+    at most ``max_interned`` of them are remembered at once,
+    thus memory usage does not depend on the number of lines.
+    """
+    builder = _Builder(cls, intern, max_interned)
+    decode = builder.decoder().decode
+    for line in lines:
+        if not isinstance(line, str):
+            line = line.decode()
+
+        if line and not line.isspace():
+            yield builder.result(decode(line))
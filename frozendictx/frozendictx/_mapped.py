@@ -0,0 +1,504 @@
+# mypy: ignore-errors
+"""
+Layout of a file, similar to constant database (CDB):
+
+- header: magic bytes, the number of items, the end of records
+  and 256 pairs of a position and the number of slots of a hash table;
+- records: encoded items in insertion order, every item is two unsigned 32-bit integers
+  with sizes of an encoded key and an encoded value followed by the encoded key and value;
+- hash tables: every table is an array of slots, every slot is a pair of unsigned 64-bit integers,
+  the first one is a stable hash value of a key, the second one is a position of the record,
+  zero position marks an empty slot; slots are looked up via linear probing.
+
+The lowest 8 bits of a hash value select the table, the other bits select the first slot.
+Magic bytes are written last, thus an unfinished file cannot be opened.
+Keys and values are encoded the same way as in shared dictionaries.
+"""
+import os
+from array import array
+from collections.abc import ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from sys import getsizeof
+from typing import Any, Union, overload
+
+from ._frozendict import (
+    FrozendictBase,
+    K,
+    K_co,
+    SupportsKeysAndGetItem,
+    T,
+    V_co,
+    frozendict,
+    get_hash_value_or_unhashable_type,
+    )
+from ._shared import _ITEM_HEADER, _decode, _encode, _stable_hash
+
+_MAGIC = b'FDXMAP01'
+_HEADER = Struct('<8sQQ')
+_TABLE = Struct('<QQ')
+_TABLES = 256
+_RECORDS_START = _HEADER.size + _TABLES * _TABLE.size
+
+StrPath = Union[str, os.PathLike]
+
+
+class MappedFrozendictWriter:
+    """
+    Writer of files for :class:`mappedfrozendict`.
+    Records are written to the file as soon as they are added,
+    only a stable hash value and a position of every record are kept in memory until the file is finished.
+
+    Use it as a context manager: the file is finished on exit
+    or removed if an exception is raised.
+    """
+    __slots__ = '_path', '_file', '_hashes', '_positions', '_position', '_closed'
+
+    def __init__(self, path: StrPath, /):
+        self._path = path
+        self._file = open(path, 'w+b')
+        self._file.write(bytes(_RECORDS_START))
+        self._hashes = [array('Q') for _ in range(_TABLES)]
+        self._positions = [array('Q') for _ in range(_TABLES)]
+        self._position = _RECORDS_START
+        self._closed = False
+
+    def add(self, key: Any, value: Any, /):
+        """
+        Write a key-value pair to the file.
+        Raise TypeError if the key cannot be stored.
+        Duplicate keys are detected when the file is finished.
+        """
+        if self._closed:
+            raise ValueError('writer is closed')
+
+        h = _stable_hash(key)
+        # Raises TypeError if the key cannot be stored
+        key = _encode(key, allow_pickle=False)
+        value = _encode(value, allow_pickle=True)
+        table = h & (_TABLES - 1)
+        self._hashes[table].append(h)
+        self._positions[table].append(self._position)
+
+        self._file.write(_ITEM_HEADER.pack(len(key), len(value)))
+        self._file.write(key)
+        self._file.write(value)
+        self._position += _ITEM_HEADER.size + len(key) + len(value)
+
+    def update(self, iterable: Union[SupportsKeysAndGetItem, Iterable[tuple]] = (), /, **kwargs):
+        """Write items of a mapping or an iterable of key-value pairs and keyword arguments to the file."""
+        if hasattr(iterable, 'keys'):
+            for k in iterable.keys():
+                self.add(k, iterable[k])
+        else:
+            for k, v in iterable:
+                self.add(k, v)
+
+        for k, v in kwargs.items():
+            self.add(k, v)
+
+    def __read_key(self, position: int, /) -> Any:
+        self._file.seek(position)
+        key_len, _ = _ITEM_HEADER.unpack(self._file.read(_ITEM_HEADER.size))
+        return _decode(memoryview(self._file.read(key_len)))
+
+    def __check_duplicates(self, hashes: array, positions: array, /):
+        # Only records with equal hash values are read back from the file
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        start = 0
+        while start < len(order):
+            h = hashes[order[start]]
+            end = start + 1
+            while end < len(order) and hashes[order[end]] == h:
+                end += 1
+
+            if end - start > 1:
+                keys = [self.__read_key(positions[i]) for i in order[start:end]]
+                for n, k in enumerate(keys):
+                    if k in keys[n + 1:]:
+                        raise ValueError(f'key {k!r} is added more than once')
+
+            start = end
+
+    def close(self, /):
+        """
+        Finish the file.
+        Raise ValueError and remove the file if the same key is added more than once.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        f = self._file
+        try:
+            f.flush()
+            length = 0
+            tables = []
+            for hashes, positions in zip(self._hashes, self._positions):
+                self.__check_duplicates(hashes, positions)
+                length += len(hashes)
+
+            f.seek(self._position)
+            table_position = self._position
+            for hashes, positions in zip(self._hashes, self._positions):
+                # Keep load factor of every table at most 1/2
+                slots = len(hashes) * 2
+                table = array('Q', bytes(slots * _TABLE.size))
+                for h, p in zip(hashes, positions):
+                    slot = (h >> 8) % slots
+                    while table[slot * 2 + 1]:
+                        slot = (slot + 1) % slots
+
+                    table[slot * 2] = h
+                    table[slot * 2 + 1] = p
+
+                f.write(table.tobytes())
+                tables.append(_TABLE.pack(table_position, slots))
+                table_position += slots * _TABLE.size
+
+            f.seek(_HEADER.size)
+            f.write(b''.join(tables))
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, length, self._position))
+        except BaseException:
+            f.close()
+            os.remove(self._path)
+            raise
+        else:
+            f.close()
+        finally:
+            self._hashes = self._positions = None
+
+    def discard(self, /):
+        """Close and remove the unfinished file."""
+        if not self._closed:
+            self._closed = True
+            self._hashes = self._positions = None
+            self._file.close()
+            os.remove(self._path)
+
+    def __enter__(self, /):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb, /):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class mappedfrozendict(FrozendictBase[K_co, V_co]):
+    """
+    Immutable dictionary stored in a file which is mapped into memory.
+    Opening a file takes the same time regardless of its size,
+    items are decoded only when they are accessed.
+    Pages of the file are loaded by the operating system on demand
+    and shared among all processes which open the same file.
+    Pickling preserves only the path to the file.
+
+    Use :class:`MappedFrozendictWriter` or :meth:`write` to create a file.
+    Keys must be None, bool, int, float, str or bytes.
+    Values of these types are stored as is, values of other types are pickled,
+    i.e., every access to such value returns a new object.
+
+    Hashable if all values are hashable.
+    If hashable, hash value is cached after its first calculation.
+    """
+    __slots__ = '__path', '__mmap', '__view', '__len', '__end', '__hash'
+
+    def __new__(cls, path: StrPath, /):
+        """Open a file created by :class:`MappedFrozendictWriter`."""
+        with open(path, 'rb') as f:
+            mm = mmap(f.fileno(), 0, access=ACCESS_READ)
+
+        if len(mm) < _RECORDS_START:
+            mm.close()
+            raise ValueError(f'file {path!r} does not contain a dictionary')
+
+        magic, length, end = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC:
+            mm.close()
+            raise ValueError(f'file {path!r} does not contain a dictionary')
+
+        self = object.__new__(cls)
+        # A relative path would be resolved against another working directory after unpickling
+        self.__path = os.path.abspath(path)
+        self.__mmap = mm
+        self.__view = memoryview(mm)
+        self.__len = length
+        self.__end = end
+        self.__hash = None
+        return self
+
+    @classmethod
+    def adopt(cls, d: dict, /):
+        """Not supported, dictionaries are created from files. Use :meth:`write` instead."""
+        raise TypeError(f'{cls.__name__} can be created only from a file')
+
+    # region write overload
+    @overload
+    @classmethod
+    def write(cls, path: StrPath, /) -> 'mappedfrozendict': ...
+    @overload
+    @classmethod
+    def write(cls, path: StrPath, /, **kwargs: V_co) -> 'mappedfrozendict[str, V_co]': ...
+
+    @overload
+    @classmethod
+    def write(
+            cls,
+            path: StrPath,
+            mapping: SupportsKeysAndGetItem[K_co, V_co],
+            /,
+            ) -> 'mappedfrozendict[K_co, V_co]': ...
+
+    @overload
+    @classmethod
+    def write(
+            cls,
+            path: StrPath,
+            mapping: SupportsKeysAndGetItem[str, V_co],
+            /,
+            **kwargs: V_co,
+            ) -> 'mappedfrozendict[str, V_co]': ...
+
+    @overload
+    @classmethod
+    def write(
+            cls,
+            path: StrPath,
+            iterable: Iterable[tuple[K_co, V_co]],
+            /
+            ) -> 'mappedfrozendict[K_co, V_co]': ...
+
+    @overload
+    @classmethod
+    def write(
+            cls,
+            path: StrPath,
+            iterable: Iterable[tuple[str, V_co]],
+            /,
+            **kwargs: V_co,
+            ) -> 'mappedfrozendict[str, V_co]': ...
+    # endregion
+
+    @classmethod
+    def write(cls, path, iterable = (), /, **kwargs):
+        """
+        Write items to a file and open it.
+        Items are streamed to the file, an iterable is consumed only once.
+        Raise ValueError if the same key is met more than once.
+        """
+        with MappedFrozendictWriter(path) as writer:
+            writer.update(iterable, **kwargs)
+
+        return cls(path)
+
+    @property
+    def path(self, /) -> StrPath:
+        """The absolute path to the file."""
+        return self.__path
+
+    def close(self, /):
+        """Unmap the file."""
+        self.__view.release()
+        self.__mmap.close()
+
+    def __reduce__(self, /):
+        return self.__class__, (self.__path,)
+
+    def __item(self, position: int, /) -> tuple[memoryview, memoryview, int]:
+        # Returns views on an encoded key and value and the position of the next record
+        key_len, value_len = _ITEM_HEADER.unpack_from(self.__mmap, position)
+        position += _ITEM_HEADER.size
+        key_end = position + key_len
+        value_end = key_end + value_len
+        return self.__view[position:key_end], self.__view[key_end:value_end], value_end
+
+    def __find(self, key: Any, /) -> int:
+        # Returns the position of a record with the given key or 0
+        h = _stable_hash(key)
+        if h is None:
+            # raises TypeError if key is not hashable
+            hash(key)
+            return 0
+
+        mm = self.__mmap
+        table_position, slots = _TABLE.unpack_from(mm, _HEADER.size + (h & (_TABLES - 1)) * _TABLE.size)
+        if not slots:
+            return 0
+
+        slot = (h >> 8) % slots
+        while True:
+            slot_hash, position = _TABLE.unpack_from(mm, table_position + slot * _TABLE.size)
+            if not position:
+                return 0
+
+            if slot_hash == h:
+                k = _decode(self.__item(position)[0])
+                if k is key or k == key:
+                    return position
+
+            slot = (slot + 1) % slots
+
+    def __positions(self, /) -> Iterator[int]:
+        position = _RECORDS_START
+        end = self.__end
+        while position < end:
+            yield position
+            key_len, value_len = _ITEM_HEADER.unpack_from(self.__mmap, position)
+            position += _ITEM_HEADER.size + key_len + value_len
+
+    def __getitem__(self, item: K_co, /) -> V_co:
+        position = self.__find(item)
+        if not position:
+            raise KeyError(item)
+
+        return _decode(self.__item(position)[1])
+
+    def get(self, key, default = None, /):
+        """Return the value for key if ``key`` is in the dictionary, else ``default``."""
+        position = self.__find(key)
+        if not position:
+            return default
+
+        return _decode(self.__item(position)[1])
+
+    def keys(self, /):
+        """Return a set-like object providing a view on keys."""
+        return _MappedKeysView(self)
+
+    def values(self, /):
+        """Return an object providing a view on values."""
+        return _MappedValuesView(self)
+
+    def items(self, /):
+        """Return a set-like object providing a view on key-value pairs."""
+        return _MappedItemsView(self)
+
+    def _iter_items(self, /) -> Iterator[tuple[K_co, V_co]]:
+        for position in self.__positions():
+            k, v, _ = self.__item(position)
+            yield _decode(k), _decode(v)
+
+    def _iter_keys(self, /) -> Iterator[K_co]:
+        for position in self.__positions():
+            yield _decode(self.__item(position)[0])
+
+    def _iter_values(self, /) -> Iterator[V_co]:
+        for position in self.__positions():
+            yield _decode(self.__item(position)[1])
+
+    def __hash__(self, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self)
+
+        if isinstance(self.__hash, int):
+            return self.__hash
+
+        raise TypeError(f'unhashable type: {self.__hash!r}')
+
+    def __deepcopy__(self, memo, /):
+        # Every access decodes new objects, mutable values cannot be shared.
+        return self
+
+    def __str__(self, /):
+        return f'{self.__class__.__name__}({dict(self._iter_items()) if self.__len else ""})'
+
+    __repr__ = __str__
+
+    def __len__(self, /):
+        return self.__len
+
+    def __contains__(self, item: Any, /):
+        # raises TypeError if item is not hashable
+        return self.__find(item) > 0
+
+    def __iter__(self, /) -> Iterator[K_co]:
+        return self._iter_keys()
+
+    def __reversed__(self, /) -> Iterator[K_co]:
+        # Records can be walked only forward
+        for position in reversed(list(self.__positions())):
+            yield _decode(self.__item(position)[0])
+
+    def __or__(self, other: Mapping[K, T], /) -> 'frozendict[Union[K_co, K], Union[V_co, T]]':
+        # The result is stored in the memory of this process.
+        if isinstance(other, Mapping):
+            d = dict(self._iter_items())
+            d.update(other.items())
+            return frozendict(d)
+
+        return NotImplemented
+
+    def __ror__(self, other: Mapping[K, T], /) -> 'frozendict[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            d = dict(other.items())
+            d.update(self._iter_items())
+            return frozendict(d)
+
+        return NotImplemented
+
+    def __eq__(self, other: Any, /) -> bool:
+        if self is other:
+            return True
+
+        if isinstance(other, Mapping):
+            if self.__len != len(other):
+                return False
+
+            missing = object()
+            for k, v in self._iter_items():
+                o = other.get(k, missing)
+                if not (o is v or o == v):
+                    return False
+
+            return True
+
+        return NotImplemented
+
+    def __ne__(self, other: Any, /) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def sizeof(self, /, gc_self: bool = True, gc_inner: bool = False) -> int:
+        """Return the size of a dictionary in bytes.
+        The mapped file is not included, see ``nbytes``.
+
+        :param gc_self: If true, garbage collector overhead for itself is included.
+        :param gc_inner: If true, garbage collector overhead for inner objects is included.
+        """
+        size = getsizeof(self) if gc_self else self.__sizeof__()
+        for o in (self.__mmap, self.__view):
+            size += getsizeof(o) if gc_inner else o.__sizeof__()
+
+        return size
+
+    @property
+    def nbytes(self, /) -> int:
+        """The size of the file in bytes."""
+        return len(self.__mmap)
+
+
+class _MappedKeysView(KeysView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return self._mapping._iter_keys()
+
+
+class _MappedValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return self._mapping._iter_values()
+
+
+class _MappedItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return self._mapping._iter_items()
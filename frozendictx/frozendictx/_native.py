@@ -0,0 +1,188 @@
+# mypy: ignore-errors
+from collections.abc import Iterable, Mapping
+from copy import deepcopy
+from sys import getsizeof
+from typing import Any, Union, overload
+
+from ._frozendict import (
+    K,
+    K_co,
+    SupportsKeysAndGetItem,
+    T,
+    V_co,
+    get_hash_value_or_unhashable_type,
+    )
+
+
+class _Blocked:
+    """Descriptor which hides a method of dict as if it is not defined."""
+    __slots__ = '_name',
+
+    def __set_name__(self, owner: type, name: str, /):
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type = None, /):
+        if instance is None:
+            raise AttributeError(f'type object {owner.__name__!r} has no attribute {self._name!r}')
+
+        raise AttributeError(f'{instance.__class__.__name__!r} object has no attribute {self._name!r}')
+
+
+class nativefrozendict(dict[K_co, V_co]):
+    """
+    Immutable dictionary which is a subclass of dict with all mutators blocked.
+    Lookups, ``in``, iteration, ``len`` and comparison are done by dict itself
+    without calls of Python methods.
+
+    Unlike other implementations, it is an instance of dict but not of :class:`FrozendictBase`.
+    Immutability is not enforced against direct calls of dict methods, e.g., ``dict.update(d, ...)``.
+    Method ``copy`` returns a mutable dict.
+
+    Hashable if all values are hashable.
+    If hashable, hash value is cached after its first calculation.
+    """
+    __slots__ = '__hash',
+
+    # region new overload
+    @overload
+    def __new__(cls, /) -> 'nativefrozendict': ...
+    @overload
+    def __new__(cls, /, **kwargs: V_co) -> 'nativefrozendict[str, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            mapping: SupportsKeysAndGetItem[K_co, V_co],
+            /,
+            ) -> 'nativefrozendict[K_co, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            mapping: SupportsKeysAndGetItem[str, V_co],
+            /,
+            **kwargs: V_co,
+            ) -> 'nativefrozendict[str, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            iterable: Iterable[tuple[K_co, V_co]],
+            /
+            ) -> 'nativefrozendict[K_co, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            iterable: Iterable[tuple[str, V_co]],
+            /,
+            **kwargs: V_co,
+            ) -> 'nativefrozendict[str, V_co]': ...
+    # endregion
+
+    def __new__(cls, iterable = (), /, **kwargs):
+        self = dict.__new__(cls)
+        dict.update(self, iterable, **kwargs)
+        self.__hash = None
+        return self
+
+    def __init__(self, iterable = (), /, **kwargs):
+        # dict.__init__ updates the dictionary, items are already set in __new__
+        pass
+
+    @classmethod
+    def adopt(cls, d: dict[K_co, V_co], /) -> 'nativefrozendict[K_co, V_co]':
+        """Create a dictionary from items of ``d``. A dict subclass cannot adopt items, thus they are copied."""
+        return cls(d)
+
+    # region fromkeys overload
+    @classmethod
+    @overload
+    def fromkeys(cls, iterable: Iterable[K], /) -> 'nativefrozendict[K, None]': ...
+    @classmethod
+    @overload
+    def fromkeys(cls, iterable: Iterable[K], value: T, /) -> 'nativefrozendict[K, T]': ...
+    # endregion
+
+    @classmethod
+    def fromkeys(cls, iterable, value = None, /):
+        """Create a new dictionary with keys from ``iterable`` and values set to ``value``."""
+        # dict.fromkeys fills instances of subclasses via __setitem__
+        return cls(dict.fromkeys(iterable, value))
+
+    @classmethod
+    def merged(cls, /, *mappings: Mapping[K_co, V_co]) -> 'nativefrozendict[K_co, V_co]':
+        """
+        Create a dictionary from items of all mappings,
+        later mappings take precedence like in ``a | b | c``.
+        """
+        self = cls()
+        for m in mappings:
+            dict.update(self, m)
+
+        return self
+
+    def __setitem__(self, key: Any, value: Any, /):
+        raise TypeError(f'{self.__class__.__name__!r} object does not support item assignment')
+
+    def __delitem__(self, key: Any, /):
+        raise TypeError(f'{self.__class__.__name__!r} object does not support item deletion')
+
+    clear = _Blocked()
+    pop = _Blocked()
+    popitem = _Blocked()
+    setdefault = _Blocked()
+    update = _Blocked()
+
+    def __ior__(self, other: Any, /):
+        # ``d |= other`` binds ``d`` to ``d | other`` like for other immutable types
+        return NotImplemented
+
+    def __reduce__(self, /):
+        return self.__class__, (dict(self),)
+
+    def __copy__(self, /):
+        return self
+
+    def __hash__(self, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self)
+
+        if isinstance(self.__hash, int):
+            return self.__hash
+
+        raise TypeError(f'unhashable type: {self.__hash!r}')
+
+    def __deepcopy__(self, memo, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self)
+
+        if isinstance(self.__hash, int):
+            return self
+
+        return self.__class__(deepcopy(dict(self), memo))
+
+    def __str__(self, /):
+        return f'{self.__class__.__name__}({dict.__repr__(self) if self else ""})'
+
+    __repr__ = __str__
+
+    def __or__(self, other: Mapping[K, T], /) -> 'nativefrozendict[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            return self.merged(self, other)
+
+        return NotImplemented
+
+    def __ror__(self, other: Mapping[K, T], /) -> 'nativefrozendict[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            return self.merged(other, self)
+
+        return NotImplemented
+
+    def sizeof(self, /, gc_self: bool = True, gc_inner: bool = False) -> int:
+        """Return the size of a dictionary in bytes.
+
+        :param gc_self: If true, garbage collector overhead for itself is included.
+        :param gc_inner: Ignored, there is no inner dictionary.
+        """
+        return getsizeof(self) if gc_self else self.__sizeof__()
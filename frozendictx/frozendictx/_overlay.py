@@ -0,0 +1,288 @@
+# mypy: ignore-errors
+from collections.abc import ItemsView, Iterator, KeysView, Mapping, ValuesView
+from copy import deepcopy
+from sys import getsizeof
+from types import MappingProxyType
+from typing import Any, Union
+
+from ._delta import FrozendictDelta
+from ._frozendict import (
+    FrozendictBase,
+    K,
+    K_co,
+    T,
+    V_co,
+    _storage,
+    frozendict,
+    get_hash_value_or_unhashable_type,
+    )
+from ._native import nativefrozendict
+
+_missing = object()
+OVERLAY_MAX_DEPTH = 8
+"""
+The maximal number of layers in :class:`frozenoverlay`.
+An overlay with more layers is flattened on creation.
+"""
+
+
+def _snapshot(layer: Mapping, /) -> Mapping:
+    # Immutable layers are referenced, others are copied.
+    # Dictionaries inside frozendict are looked up directly to avoid a method call.
+    if isinstance(layer, frozendict):
+        return _storage(layer)
+
+    if isinstance(layer, (FrozendictBase, nativefrozendict)):
+        return layer
+
+    return dict(layer.items())
+
+
+class frozenoverlay(FrozendictBase[K_co, V_co]):
+    """
+    Immutable dictionary which keeps references to its layers
+    and looks up keys starting from the last layer, like ``collections.ChainMap`` in reverse.
+    ``frozenoverlay(a, b, c)`` is equal to ``a | b | c``,
+    but it is created without copying items of immutable layers.
+    Mutable layers are copied.
+    Merging an overlay with a mapping via ``|`` adds a new layer.
+
+    Layers are merged into one dictionary when:
+
+    - the number of layers exceeds :data:`OVERLAY_MAX_DEPTH`;
+    - lookups have visited more extra layers than the total size of layers,
+      i.e., when slower lookups have cost more than merging;
+    - an operation requires all items, e.g., iteration, ``len``, hashing or comparison.
+
+    Hashable if all values are hashable.
+    If hashable, hash value is cached after its first calculation.
+    """
+    __slots__ = '__layers', '__probes', '__cost', '__hash'
+
+    def __new__(cls, /, *layers: Mapping[K_co, V_co]):
+        return cls.__from_layers(tuple(cls.__iter_layers(layers)))
+
+    @classmethod
+    def adopt(cls, d: dict[K_co, V_co], /) -> 'frozenoverlay[K_co, V_co]':
+        """
+        Create a dictionary with the only layer ``d`` which is used without copying.
+        ``d`` must not be modified afterwards.
+        """
+        return cls.__from_layers((d,) if d else ())
+
+    @staticmethod
+    def __iter_layers(layers: tuple, /) -> Iterator[Mapping]:
+        for layer in layers:
+            if isinstance(layer, frozenoverlay):
+                yield from layer.__layers
+            elif not isinstance(layer, Mapping):
+                raise TypeError(f'layers must be mappings, got {layer.__class__}')
+            elif len(layer) > 0:
+                yield _snapshot(layer)
+
+    @classmethod
+    def __from_layers(cls, layers: tuple, /):
+        self = object.__new__(cls)
+        self.__layers = layers
+        self.__probes = 0
+        self.__cost = sum(map(len, layers))
+        self.__hash = None
+        if len(layers) > OVERLAY_MAX_DEPTH:
+            self.__flatten()
+
+        return self
+
+    @property
+    def layers(self, /) -> tuple[Mapping[K_co, V_co], ...]:
+        """
+        Layers of this dictionary from bottom to top, copied layers are read-only proxies.
+        A flattened dictionary has one layer.
+        """
+        return tuple(MappingProxyType(layer) if layer.__class__ is dict else layer for layer in self.__layers)
+
+    @property
+    def depth(self, /) -> int:
+        """The number of layers."""
+        return len(self.__layers)
+
+    def __flatten(self, /) -> dict:
+        layers = self.__layers
+        if len(layers) == 1 and layers[0].__class__ is dict:
+            return layers[0]
+
+        d = {}
+        for layer in layers:
+            d.update(layer.items())
+
+        self.__layers = d,
+        self.__probes = 0
+        self.__cost = len(d)
+        return d
+
+    def __lookup(self, key: Any, /) -> Any:
+        # Returns a value or _missing
+        probes = 0
+        value = _missing
+        for layer in reversed(self.__layers):
+            value = layer.get(key, _missing)
+            if value is not _missing:
+                break
+
+            probes += 1
+
+        if probes:
+            self.__probes += probes
+            if self.__probes > self.__cost:
+                self.__flatten()
+
+        return value
+
+    def __reduce__(self, /):
+        return self.__class__, self.__layers
+
+    def __getitem__(self, item: K_co, /) -> V_co:
+        layers = self.__layers
+        if len(layers) == 1:
+            return layers[0][item]
+
+        value = self.__lookup(item)
+        if value is _missing:
+            raise KeyError(item)
+
+        return value
+
+    def get(self, key, default = None, /):
+        """Return the value for key if ``key`` is in the dictionary, else ``default``."""
+        layers = self.__layers
+        if len(layers) == 1:
+            return layers[0].get(key, default)
+
+        value = self.__lookup(key)
+        return default if value is _missing else value
+
+    def keys(self, /) -> KeysView[K_co]:
+        """Return a set-like object providing a view on keys."""
+        return self.__flatten().keys()
+
+    def values(self, /) -> ValuesView[V_co]:
+        """Return an object providing a view on values."""
+        return self.__flatten().values()
+
+    def items(self, /) -> ItemsView[K_co, V_co]:
+        """Return a set-like object providing a view on key-value pairs."""
+        return self.__flatten().items()
+
+    def __hash__(self, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self.__flatten())
+
+        if isinstance(self.__hash, int):
+            return self.__hash
+
+        raise TypeError(f'unhashable type: {self.__hash!r}')
+
+    def __deepcopy__(self, memo, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self.__flatten())
+
+        if isinstance(self.__hash, int):
+            return self
+
+        return self.__from_layers((deepcopy(self.__flatten(), memo),))
+
+    def __str__(self, /):
+        d = self.__flatten()
+        return f'{self.__class__.__name__}({d if d else ""})'
+
+    __repr__ = __str__
+
+    def __len__(self, /):
+        return len(self.__flatten())
+
+    def __contains__(self, item: Any, /):
+        # raises TypeError if item is not hashable
+        layers = self.__layers
+        if len(layers) == 1:
+            return item in layers[0]
+
+        return self.__lookup(item) is not _missing
+
+    def __iter__(self, /) -> Iterator[K_co]:
+        return iter(self.__flatten())
+
+    def __reversed__(self, /) -> Iterator[K_co]:
+        return reversed(self.__flatten())
+
+    def __or__(self, other: Mapping[K, T], /) -> 'frozenoverlay[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            return self.__from_layers(self.__layers + tuple(self.__iter_layers((other,))))
+
+        return NotImplemented
+
+    def __ror__(self, other: Mapping[K, T], /) -> 'frozenoverlay[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            return self.__from_layers(tuple(self.__iter_layers((other,))) + self.__layers)
+
+        return NotImplemented
+
+    def diff(self, other: Mapping[K, T], /) -> FrozendictDelta[K, T]:
+        """
+        Return the delta which turns this dictionary into ``other``.
+        Values are compared by identity first, then by equality.
+        If ``other`` is a :class:`frozenoverlay` made by adding layers on top of this one,
+        only items of the added layers are visited.
+        """
+        if isinstance(other, frozenoverlay):
+            layers = self.__layers
+            other_layers = other.__layers
+            n = len(layers)
+            if n <= len(other_layers) and all(a is b for a, b in zip(layers, other_layers)):
+                top = {}
+                for layer in other_layers[n:]:
+                    top.update(layer.items())
+
+                added = {}
+                changed = {}
+                for k, v in top.items():
+                    o = self.get(k, _missing)
+                    if o is _missing:
+                        added[k] = v
+                    elif not (o is v or o == v):
+                        changed[k] = v
+
+                return FrozendictDelta._adopt(added, changed, ())
+
+        return FrozendictBase.diff(self, other)
+
+    def __eq__(self, other: Any, /) -> bool:
+        if self is other:
+            return True
+
+        if isinstance(other, Mapping):
+            return other == self.__flatten()
+
+        return NotImplemented
+
+    def __ne__(self, other: Any, /) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def sizeof(self, /, gc_self: bool = True, gc_inner: bool = False) -> int:
+        """Return the size of a dictionary in bytes.
+        Layers are included even if they are shared with other dictionaries.
+
+        :param gc_self: If true, garbage collector overhead for itself is included.
+        :param gc_inner: If true, garbage collector overhead for inner objects is included.
+        """
+        size = getsizeof(self) if gc_self else self.__sizeof__()
+        size += getsizeof(self.__layers) if gc_inner else self.__layers.__sizeof__()
+        for layer in self.__layers:
+            if isinstance(layer, FrozendictBase):
+                size += layer.sizeof(gc_inner, gc_inner)
+            else:
+                size += getsizeof(layer) if gc_inner else layer.__sizeof__()
+
+        return size
@@ -0,0 +1,255 @@
+# mypy: ignore-errors
+from collections.abc import ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
+from copy import deepcopy
+from sys import getsizeof
+from typing import Any, Union, overload
+
+from ._frozendict import (
+    FrozendictBase,
+    K,
+    K_co,
+    SupportsKeysAndGetItem,
+    T,
+    V_co,
+    frozendict,
+    get_hash_value_or_unhashable_type,
+    )
+
+
+class _RecordValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return iter(self._mapping._frozenrecord__values)
+
+
+class _RecordItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return zip(self._mapping._keys, self._mapping._frozenrecord__values)
+
+
+class frozenrecord(FrozendictBase[K_co, V_co]):
+    """
+    Immutable dictionary with keys defined by its class, i.e., by its schema.
+    Instances store only a tuple of values, the mapping from keys to indexes
+    is shared among all instances of the same schema.
+    Use :func:`schema` to get a class for specific keys.
+
+    Hashable if all values are hashable.
+    If hashable, hash value is cached after its first calculation.
+    """
+    __slots__ = '__values', '__hash'
+    _keys: tuple = ()
+    _index: dict = {}
+
+    # region new overload
+    @overload
+    def __new__(cls, /) -> 'frozenrecord': ...
+    @overload
+    def __new__(cls, /, **kwargs: V_co) -> 'frozenrecord[str, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            mapping: SupportsKeysAndGetItem[K_co, V_co],
+            /,
+            ) -> 'frozenrecord[K_co, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            mapping: SupportsKeysAndGetItem[str, V_co],
+            /,
+            **kwargs: V_co,
+            ) -> 'frozenrecord[str, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            iterable: Iterable[tuple[K_co, V_co]],
+            /
+            ) -> 'frozenrecord[K_co, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            iterable: Iterable[tuple[str, V_co]],
+            /,
+            **kwargs: V_co,
+            ) -> 'frozenrecord[str, V_co]': ...
+    # endregion
+
+    def __new__(cls, iterable = (), /, **kwargs):
+        d = dict(iterable, **kwargs)
+        if len(d) != len(cls._keys) or not all(k in d for k in cls._keys):
+            raise ValueError(f'keys {tuple(d)} do not match schema keys {cls._keys}')
+
+        return cls.__from_tuple(tuple(map(d.__getitem__, cls._keys)))
+
+    @classmethod
+    def adopt(cls, d: dict[K_co, V_co], /) -> 'frozenrecord[K_co, V_co]':
+        """Create a dictionary from items of ``d``. Only values are stored, thus they are copied."""
+        return cls(d)
+
+    @classmethod
+    def __from_tuple(cls, values: tuple, /):
+        self = object.__new__(cls)
+        self.__values = values
+        self.__hash = None
+        return self
+
+    @classmethod
+    def from_values(cls, values: Iterable[V_co], /) -> 'frozenrecord[Any, V_co]':
+        """Create a dictionary from values listed in the order of schema keys."""
+        values = tuple(values)
+        if len(values) != len(cls._keys):
+            raise ValueError(f'expected {len(cls._keys)} values, got {len(values)}')
+
+        return cls.__from_tuple(values)
+
+    def __reduce__(self, /):
+        return _restore, (self._keys, self.__values)
+
+    def __getitem__(self, item: K_co, /) -> V_co:
+        return self.__values[self._index[item]]
+
+    def get(self, key, default = None, /):
+        """Return the value for key if ``key`` is in the dictionary, else ``default``."""
+        idx = self._index.get(key)
+        return default if idx is None else self.__values[idx]
+
+    def keys(self, /) -> KeysView[K_co]:
+        """Return a set-like object providing a view on keys."""
+        return self._index.keys()
+
+    def values(self, /) -> ValuesView[V_co]:
+        """Return an object providing a view on values."""
+        return _RecordValuesView(self)
+
+    def items(self, /) -> ItemsView[K_co, V_co]:
+        """Return a set-like object providing a view on key-value pairs."""
+        return _RecordItemsView(self)
+
+    def __hash__(self, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self)
+
+        if isinstance(self.__hash, int):
+            return self.__hash
+
+        raise TypeError(f'unhashable type: {self.__hash!r}')
+
+    def __deepcopy__(self, memo, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self)
+
+        if isinstance(self.__hash, int):
+            return self
+
+        return self.__from_tuple(deepcopy(self.__values, memo))
+
+    def __str__(self, /):
+        return f'{self.__class__.__name__}({dict(zip(self._keys, self.__values)) if self._keys else ""})'
+
+    __repr__ = __str__
+
+    def __len__(self, /):
+        return len(self._keys)
+
+    def __contains__(self, item: Any, /):
+        # raises TypeError if item is not hashable
+        return item in self._index
+
+    def __iter__(self, /) -> Iterator[K_co]:
+        return iter(self._keys)
+
+    def __reversed__(self, /) -> Iterator[K_co]:
+        return reversed(self._keys)
+
+    def __from_dict(self, d: dict, /) -> FrozendictBase:
+        # The result keeps the schema if keys are not added, otherwise it is a frozendict.
+        if len(d) == len(self._keys):
+            return self.__from_tuple(tuple(d.values()))
+
+        return frozendict(d)
+
+    def __or__(self, other: Mapping[K, T], /) -> 'FrozendictBase[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            d = dict(zip(self._keys, self.__values))
+            d.update(other.items())
+            return self.__from_dict(d)
+
+        return NotImplemented
+
+    def __ror__(self, other: Mapping[K, T], /) -> 'FrozendictBase[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            if all(k in self._index for k in other):
+                # Values of this dictionary take precedence, the result is equal to it.
+                return self
+
+            d = dict(other.items())
+            d.update(zip(self._keys, self.__values))
+            return frozendict(d)
+
+        return NotImplemented
+
+    def __eq__(self, other: Any, /) -> bool:
+        if self is other:
+            return True
+
+        if other.__class__ is self.__class__:
+            return self.__values == other.__values
+
+        if isinstance(other, Mapping):
+            return other == dict(zip(self._keys, self.__values))
+
+        return NotImplemented
+
+    def __ne__(self, other: Any, /) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def sizeof(self, /, gc_self: bool = True, gc_inner: bool = False) -> int:
+        """Return the size of a dictionary in bytes.
+        Keys and the shared mapping from keys to indexes are not included.
+
+        :param gc_self: If true, garbage collector overhead for itself is included.
+        :param gc_inner: If true, garbage collector overhead for inner tuple is included.
+        """
+        return (
+                (getsizeof(self) if gc_self else self.__sizeof__())
+                + (getsizeof(self.__values) if gc_inner else self.__values.__sizeof__())
+        )
+
+
+_schemas: dict[tuple, type] = {}
+
+
+def schema(keys: Iterable[K], /) -> type[frozenrecord[K, Any]]:
+    """
+    Return a subclass of :class:`frozenrecord` which instances have exactly the given keys.
+    Calls with the same keys return the same class.
+    """
+    keys = tuple(keys)
+    cls = _schemas.get(keys)
+    if cls is None:
+        index = {k: i for i, k in enumerate(keys)}
+        if len(index) != len(keys):
+            raise ValueError(f'schema keys must be unique, got {keys}')
+
+        cls = _schemas[keys] = type(
+            frozenrecord.__name__,
+            (frozenrecord,),
+            dict(__slots__=(), __module__=frozenrecord.__module__, _keys=keys, _index=index),
+            )
+
+    return cls
+
+
+def _restore(keys: tuple, values: tuple, /) -> frozenrecord:
+    return schema(keys).from_values(values)
@@ -0,0 +1,489 @@
+# mypy: ignore-errors
+"""
+Layout of a shared memory block:
+
+- header: magic bytes, the number of items and the capacity of the index;
+- index: ``capacity`` unsigned 64-bit integers, every non-zero integer
+  is the number of an entry plus one, zero marks an empty slot;
+  slots are looked up via linear probing;
+- entries: pairs of unsigned 64-bit integers in insertion order,
+  the first one is a stable hash value of a key,
+  the second one is an offset of the encoded item from the start of data;
+- data: encoded items, every item is two unsigned 32-bit integers
+  with sizes of an encoded key and an encoded value followed by the encoded key and value.
+
+Keys and values are encoded as a tag byte followed by a payload.
+"""
+from collections.abc import ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
+from multiprocessing.shared_memory import SharedMemory
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from struct import Struct
+from sys import getsizeof
+from typing import Any, Optional, Union, overload
+from zlib import crc32
+
+from ._frozendict import (
+    FrozendictBase,
+    K,
+    K_co,
+    SupportsKeysAndGetItem,
+    T,
+    V_co,
+    frozendict,
+    get_hash_value_or_unhashable_type,
+    )
+
+_MAGIC = b'FDXSHM01'
+_HEADER = Struct('<8sQQ')
+_ITEM_HEADER = Struct('<II')
+_FLOAT = Struct('<d')
+
+_TAG_NONE = b'n'
+_TAG_TRUE = b't'
+_TAG_FALSE = b'f'
+_TAG_INT = b'i'
+_TAG_FLOAT = b'd'
+_TAG_STR = b's'
+_TAG_BYTES = b'b'
+_TAG_PICKLE = b'p'
+
+_ORD_NONE, _ORD_TRUE, _ORD_FALSE, _ORD_INT, _ORD_FLOAT, _ORD_STR, _ORD_BYTES, _ORD_PICKLE = (
+    _TAG_NONE[0],
+    _TAG_TRUE[0],
+    _TAG_FALSE[0],
+    _TAG_INT[0],
+    _TAG_FLOAT[0],
+    _TAG_STR[0],
+    _TAG_BYTES[0],
+    _TAG_PICKLE[0],
+    )
+
+
+def _encode_int(value: int, /) -> bytes:
+    return _TAG_INT + value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True)
+
+
+def _encode(value: Any, /, allow_pickle: bool) -> bytes:
+    cls = value.__class__
+    if cls is str:
+        return _TAG_STR + value.encode('utf-8', 'surrogatepass')
+    if cls is int:
+        return _encode_int(value)
+    if cls is bytes:
+        return _TAG_BYTES + value
+    if cls is float:
+        return _TAG_FLOAT + _FLOAT.pack(value)
+    if value is None:
+        return _TAG_NONE
+    if value is True:
+        return _TAG_TRUE
+    if value is False:
+        return _TAG_FALSE
+    if allow_pickle:
+        return _TAG_PICKLE + dumps(value, HIGHEST_PROTOCOL)
+
+    raise TypeError(
+        f'keys must be None, bool, int, float, str or bytes, '
+        f'got {value!r} of type {cls}'
+        )
+
+
+def _stable_hash(key: Any, /) -> Optional[int]:
+    """
+    Return hash value of a key which is the same in all processes
+    or ``None`` if the key cannot be stored in a shared dictionary.
+    Equal numbers have equal hash values.
+    """
+    cls = key.__class__
+    if cls is str:
+        return crc32(_TAG_STR + key.encode('utf-8', 'surrogatepass'))
+    if cls is int or cls is bool:
+        return crc32(_encode_int(key))
+    if cls is bytes:
+        return crc32(_TAG_BYTES + key)
+    if cls is float:
+        if key.is_integer():
+            return crc32(_encode_int(int(key)))
+
+        return crc32(_TAG_FLOAT + _FLOAT.pack(key))
+    if key is None:
+        return crc32(_TAG_NONE)
+
+    return None
+
+
+def _decode(data: memoryview, /) -> Any:
+    tag = data[0]
+    if tag == _ORD_STR:
+        return str(data[1:], 'utf-8', 'surrogatepass')
+    if tag == _ORD_INT:
+        return int.from_bytes(data[1:], 'little', signed=True)
+    if tag == _ORD_BYTES:
+        return bytes(data[1:])
+    if tag == _ORD_FLOAT:
+        return _FLOAT.unpack(data[1:])[0]
+    if tag == _ORD_NONE:
+        return None
+    if tag == _ORD_TRUE:
+        return True
+    if tag == _ORD_FALSE:
+        return False
+    if tag == _ORD_PICKLE:
+        return loads(data[1:])
+
+    raise ValueError(f'unknown tag {tag!r}')
+
+
+def _attach(name: str, /) -> SharedMemory:
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:  # Python below 3.13
+        # The block is registered in the resource tracker of this process.
+        # Child processes share the tracker with their parent, and the block is already
+        # registered there by its creator, thus nothing happens.
+        return SharedMemory(name)
+
+
+class sharedfrozendict(FrozendictBase[K_co, V_co]):
+    """
+    Immutable dictionary stored in a shared memory block as an open addressing hash table.
+    Other processes attach to the block without copying it,
+    items are decoded only when they are accessed.
+    Pickling preserves only the name of the block,
+    thus passing a shared dictionary to a worker process is cheap.
+
+    Keys must be None, bool, int, float, str or bytes.
+    Values of these types are stored as is, values of other types are pickled,
+    i.e., every access to such value returns a new object.
+
+    The process which created a dictionary must call ``unlink`` once all processes stop using it.
+    Hashable if all values are hashable.
+    If hashable, hash value is cached after its first calculation.
+    """
+    __slots__ = '__shm', '__index', '__entries', '__data', '__mask', '__len', '__hash'
+
+    # region new overload
+    @overload
+    def __new__(cls, /) -> 'sharedfrozendict': ...
+    @overload
+    def __new__(cls, /, **kwargs: V_co) -> 'sharedfrozendict[str, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            mapping: SupportsKeysAndGetItem[K_co, V_co],
+            /,
+            ) -> 'sharedfrozendict[K_co, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            mapping: SupportsKeysAndGetItem[str, V_co],
+            /,
+            **kwargs: V_co,
+            ) -> 'sharedfrozendict[str, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            iterable: Iterable[tuple[K_co, V_co]],
+            /
+            ) -> 'sharedfrozendict[K_co, V_co]': ...
+
+    @overload
+    def __new__(
+            cls,
+            iterable: Iterable[tuple[str, V_co]],
+            /,
+            **kwargs: V_co,
+            ) -> 'sharedfrozendict[str, V_co]': ...
+    # endregion
+
+    def __new__(cls, iterable = (), /, **kwargs):
+        """Create a new shared memory block with the given items."""
+        source = dict(iterable, **kwargs)
+        hashes = []
+        items = []
+        data_size = 0
+        for k, v in source.items():
+            h = _stable_hash(k)
+            # Raises TypeError if the key cannot be stored
+            k = _encode(k, allow_pickle=False)
+            v = _encode(v, allow_pickle=True)
+            hashes.append(h)
+            items.append((k, v))
+            data_size += _ITEM_HEADER.size + len(k) + len(v)
+
+        # Keep load factor of the index at most 1/2
+        capacity = 1 << (len(items) * 2).bit_length()
+        entries_offset = _HEADER.size + capacity * 8
+        data_offset = entries_offset + len(items) * 16
+        shm = SharedMemory(create=True, size=data_offset + data_size)
+        buf = shm.buf
+        _HEADER.pack_into(buf, 0, _MAGIC, len(items), capacity)
+
+        index = buf[_HEADER.size:entries_offset].cast('Q')
+        entries = buf[entries_offset:data_offset].cast('Q')
+        mask = capacity - 1
+        offset = 0
+        for i, (h, (k, v)) in enumerate(zip(hashes, items)):
+            slot = h & mask
+            while index[slot]:
+                slot = (slot + 1) & mask
+
+            index[slot] = i + 1
+            entries[i * 2] = h
+            entries[i * 2 + 1] = offset
+
+            pos = data_offset + offset
+            _ITEM_HEADER.pack_into(buf, pos, len(k), len(v))
+            pos += _ITEM_HEADER.size
+            buf[pos:pos + len(k)] = k
+            pos += len(k)
+            buf[pos:pos + len(v)] = v
+            offset += _ITEM_HEADER.size + len(k) + len(v)
+
+        index.release()
+        entries.release()
+        return cls.__from_shm(shm)
+
+    @classmethod
+    def adopt(cls, d: dict[K_co, V_co], /) -> 'sharedfrozendict[K_co, V_co]':
+        """Create a new shared memory block with items of ``d``."""
+        return cls(d)
+
+    @classmethod
+    def attach(cls, name: str, /) -> 'sharedfrozendict':
+        """
+        Attach to an existing shared memory block with the given name.
+
+        Before Python 3.13, if this process is not a descendant of the creator,
+        the block is destroyed when this process exits.
+        """
+        return cls.__from_shm(_attach(name))
+
+    @classmethod
+    def __from_shm(cls, shm: SharedMemory, /):
+        magic, length, capacity = _HEADER.unpack_from(shm.buf, 0)
+        if magic != _MAGIC:
+            shm.close()
+            raise ValueError(f'shared memory block {shm.name!r} does not contain a dictionary')
+
+        entries_offset = _HEADER.size + capacity * 8
+        data_offset = entries_offset + length * 16
+
+        self = object.__new__(cls)
+        self.__shm = shm
+        # Views are read-only, thus a stray write raises instead of corrupting the table in all processes
+        buf = shm.buf
+        self.__index = buf[_HEADER.size:entries_offset].cast('Q').toreadonly()
+        self.__entries = buf[entries_offset:data_offset].cast('Q').toreadonly()
+        self.__data = buf[data_offset:].toreadonly()
+        self.__mask = capacity - 1
+        self.__len = length
+        self.__hash = None
+        return self
+
+    @property
+    def name(self, /) -> str:
+        """The name of the shared memory block."""
+        return self.__shm.name
+
+    def close(self, /):
+        """Close access to the shared memory block from this instance."""
+        self.__index.release()
+        self.__entries.release()
+        self.__data.release()
+        self.__shm.close()
+
+    def unlink(self, /):
+        """Request the shared memory block to be destroyed once all processes close it."""
+        self.__shm.unlink()
+
+    def __reduce__(self, /):
+        return self.__class__.attach, (self.name,)
+
+    def __item(self, entry: int, /) -> tuple[memoryview, memoryview]:
+        offset = self.__entries[entry * 2 + 1]
+        key_len, value_len = _ITEM_HEADER.unpack_from(self.__data, offset)
+        offset += _ITEM_HEADER.size
+        key_end = offset + key_len
+        return self.__data[offset:key_end], self.__data[key_end:key_end + value_len]
+
+    def __find(self, key: Any, /) -> int:
+        # Returns the number of an entry with the given key or -1
+        h = _stable_hash(key)
+        if h is None:
+            # raises TypeError if key is not hashable
+            hash(key)
+            return -1
+
+        index = self.__index
+        entries = self.__entries
+        mask = self.__mask
+        slot = h & mask
+        while True:
+            entry = index[slot]
+            if not entry:
+                return -1
+
+            entry -= 1
+            if entries[entry * 2] == h:
+                k = _decode(self.__item(entry)[0])
+                if k is key or k == key:
+                    return entry
+
+            slot = (slot + 1) & mask
+
+    def __getitem__(self, item: K_co, /) -> V_co:
+        entry = self.__find(item)
+        if entry < 0:
+            raise KeyError(item)
+
+        return _decode(self.__item(entry)[1])
+
+    def get(self, key, default = None, /):
+        """Return the value for key if ``key`` is in the dictionary, else ``default``."""
+        entry = self.__find(key)
+        if entry < 0:
+            return default
+
+        return _decode(self.__item(entry)[1])
+
+    def keys(self, /):
+        """Return a set-like object providing a view on keys."""
+        return _SharedKeysView(self)
+
+    def values(self, /):
+        """Return an object providing a view on values."""
+        return _SharedValuesView(self)
+
+    def items(self, /):
+        """Return a set-like object providing a view on key-value pairs."""
+        return _SharedItemsView(self)
+
+    def _iter_items(self, /) -> Iterator[tuple[K_co, V_co]]:
+        for entry in range(self.__len):
+            k, v = self.__item(entry)
+            yield _decode(k), _decode(v)
+
+    def _iter_keys(self, /) -> Iterator[K_co]:
+        for entry in range(self.__len):
+            yield _decode(self.__item(entry)[0])
+
+    def _iter_values(self, /) -> Iterator[V_co]:
+        for entry in range(self.__len):
+            yield _decode(self.__item(entry)[1])
+
+    def __hash__(self, /):
+        if self.__hash is None:
+            self.__hash = get_hash_value_or_unhashable_type(self)
+
+        if isinstance(self.__hash, int):
+            return self.__hash
+
+        raise TypeError(f'unhashable type: {self.__hash!r}')
+
+    def __deepcopy__(self, memo, /):
+        # Every access decodes new objects, mutable values cannot be shared.
+        return self
+
+    def __str__(self, /):
+        return f'{self.__class__.__name__}({dict(self._iter_items()) if self.__len else ""})'
+
+    __repr__ = __str__
+
+    def __len__(self, /):
+        return self.__len
+
+    def __contains__(self, item: Any, /):
+        # raises TypeError if item is not hashable
+        return self.__find(item) >= 0
+
+    def __iter__(self, /) -> Iterator[K_co]:
+        return self._iter_keys()
+
+    def __reversed__(self, /) -> Iterator[K_co]:
+        for entry in reversed(range(self.__len)):
+            yield _decode(self.__item(entry)[0])
+
+    def __or__(self, other: Mapping[K, T], /) -> 'frozendict[Union[K_co, K], Union[V_co, T]]':
+        # The result is stored in the memory of this process.
+        if isinstance(other, Mapping):
+            d = dict(self._iter_items())
+            d.update(other.items())
+            return frozendict(d)
+
+        return NotImplemented
+
+    def __ror__(self, other: Mapping[K, T], /) -> 'frozendict[Union[K_co, K], Union[V_co, T]]':
+        if isinstance(other, Mapping):
+            d = dict(other.items())
+            d.update(self._iter_items())
+            return frozendict(d)
+
+        return NotImplemented
+
+    def __eq__(self, other: Any, /) -> bool:
+        if self is other:
+            return True
+
+        if isinstance(other, Mapping):
+            if self.__len != len(other):
+                return False
+
+            missing = object()
+            for k, v in self._iter_items():
+                o = other.get(k, missing)
+                if not (o is v or o == v):
+                    return False
+
+            return True
+
+        return NotImplemented
+
+    def __ne__(self, other: Any, /) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    def sizeof(self, /, gc_self: bool = True, gc_inner: bool = False) -> int:
+        """Return the size of a dictionary in bytes.
+        The shared memory block is not included, see ``nbytes``.
+
+        :param gc_self: If true, garbage collector overhead for itself is included.
+        :param gc_inner: If true, garbage collector overhead for inner objects is included.
+        """
+        size = getsizeof(self) if gc_self else self.__sizeof__()
+        for o in (self.__shm, self.__index, self.__entries, self.__data):
+            size += getsizeof(o) if gc_inner else o.__sizeof__()
+
+        return size
+
+    @property
+    def nbytes(self, /) -> int:
+        """The size of the shared memory block in bytes."""
+        return self.__shm.size
+
+
+class _SharedKeysView(KeysView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return self._mapping._iter_keys()
+
+
+class _SharedValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return self._mapping._iter_values()
+
+
+class _SharedItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        return self._mapping._iter_items()
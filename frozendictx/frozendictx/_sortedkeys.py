@@ -0,0 +1,154 @@
+# mypy: ignore-errors
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+from typing import Any, Generic, Optional, TypeVar, Union, overload
+from weakref import ref
+
+K = TypeVar('K')
+T = TypeVar('T')
+
+
+class SortedKeys(Sequence, Generic[K]):
+    """
+    Immutable sorted sequence of keys of a dictionary.
+    Lookups are done via binary search in O(log n).
+    """
+    __slots__ = '_keys',
+
+    def __init__(self, keys: Sequence[K], /):
+        self._keys = sorted(keys)
+
+    # region getitem overload
+    @overload
+    def __getitem__(self, index: int, /) -> K: ...
+    @overload
+    def __getitem__(self, index: slice, /) -> list[K]: ...
+    # endregion
+
+    def __getitem__(self, index, /):
+        return self._keys[index]
+
+    def __len__(self, /):
+        return len(self._keys)
+
+    def __iter__(self, /) -> Iterator[K]:
+        return iter(self._keys)
+
+    def __reversed__(self, /) -> Iterator[K]:
+        return reversed(self._keys)
+
+    def __contains__(self, key: Any, /):
+        i = bisect_left(self._keys, key)
+        return i < len(self._keys) and self._keys[i] == key
+
+    def __str__(self, /):
+        return f'{self.__class__.__name__}({self._keys})'
+
+    __repr__ = __str__
+
+    def nth(self, n: int, /) -> K:
+        """Return the key at position ``n`` in sorted order. Negative positions count from the end."""
+        return self._keys[n]
+
+    def index(self, key: K, /, start: int = 0, stop: Optional[int] = None) -> int:
+        """Return the position of ``key`` in sorted order. Raise ValueError if it is absent."""
+        keys = self._keys
+        # Bounds are clamped and negative ones count from the end like in list.index
+        start, stop, _ = slice(start, stop).indices(len(keys))
+        i = bisect_left(keys, key, start, stop)
+        if i < stop and keys[i] == key:
+            return i
+
+        raise ValueError(f'{key!r} is not in keys')
+
+    # region floor overload
+    @overload
+    def floor(self, key: K, /) -> Optional[K]: ...
+    @overload
+    def floor(self, key: K, default: T, /) -> Union[K, T]: ...
+    # endregion
+
+    def floor(self, key, default = None, /):
+        """Return the greatest key less than or equal to ``key`` or ``default`` if there is no such key."""
+        i = bisect_right(self._keys, key)
+        return self._keys[i - 1] if i else default
+
+    # region ceil overload
+    @overload
+    def ceil(self, key: K, /) -> Optional[K]: ...
+    @overload
+    def ceil(self, key: K, default: T, /) -> Union[K, T]: ...
+    # endregion
+
+    def ceil(self, key, default = None, /):
+        """Return the least key greater than or equal to ``key`` or ``default`` if there is no such key."""
+        i = bisect_left(self._keys, key)
+        return self._keys[i] if i < len(self._keys) else default
+
+    def irange(
+            self,
+            lo: Optional[K] = None,
+            hi: Optional[K] = None,
+            /,
+            inclusive: tuple[bool, bool] = (True, True),
+            reverse: bool = False,
+            ) -> Iterator[K]:
+        """
+        Return an iterator over keys between ``lo`` and ``hi`` in sorted order.
+        If a bound is None, the range is not bounded on that side.
+        ``inclusive`` tells whether each bound is included.
+        """
+        keys = self._keys
+        if lo is None:
+            start = 0
+        else:
+            start = (bisect_left if inclusive[0] else bisect_right)(keys, lo)
+
+        if hi is None:
+            stop = len(keys)
+        else:
+            stop = (bisect_right if inclusive[1] else bisect_left)(keys, hi)
+
+        # islice would skip first ``start`` keys one by one
+        if reverse:
+            return map(keys.__getitem__, range(stop - 1, start - 1, -1))
+
+        return map(keys.__getitem__, range(start, stop))
+
+    def prefix(self, prefix: Union[str, bytes], /) -> Iterator[K]:
+        """Return an iterator over keys starting with ``prefix`` in sorted order."""
+        keys = self._keys
+        start = bisect_left(keys, prefix)
+        # Keys with the same prefix are adjacent
+        for i in range(start, len(keys)):
+            key = keys[i]
+            if not key.startswith(prefix):
+                break
+
+            yield key
+
+
+# Maps identifiers of dictionaries to weak references to them and their indexes.
+# A dictionary is not changed to keep its size, the index is built only on demand.
+_indexes: dict[int, tuple[ref, SortedKeys]] = {}
+
+
+def _discard(key: int, r: ref, /):
+    entry = _indexes.get(key)
+    if entry is not None and entry[0] is r:
+        del _indexes[key]
+
+
+def sorted_keys(d: Any, /) -> SortedKeys:
+    """
+    Return sorted keys of an immutable dictionary which supports weak references.
+    The result is cached until the dictionary is destroyed.
+    """
+    key = id(d)
+    entry = _indexes.get(key)
+    if entry is not None and entry[0]() is d:
+        return entry[1]
+
+    index = SortedKeys(d.keys())
+    _indexes[key] = ref(d, lambda r, /: _discard(key, r)), index
+    return index
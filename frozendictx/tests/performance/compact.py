@@ -0,0 +1,98 @@
+"""
+Compares ``frozendict`` with items stored in two tuples, i.e., the compact storage,
+and with items stored in a dict at different sizes to choose ``COMPACT_MAX_SIZE``.
+Memory is measured per instance with values created beforehand.
+Lookups use an equal key which is a different object, i.e., the worst case for a scan,
+a hit looks up the last key.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import IO
+
+from frozendictx import frozendict
+from frozendictx._frozendict import _compactfrozendict
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+SIZES = [0, 1, 2, 4, 6, 8, 10, 12, 16]
+ROWS = 20_000
+
+implementations = [
+    ('dict', lambda d: frozendict.adopt(d)),
+    ('tuples', lambda d: _compactfrozendict._from_items(tuple(d), tuple(d.values()))),
+    ]
+
+
+def make_dicts(n: int, /) -> list[dict]:
+    keys = [f'key{i}' for i in range(n)]
+    return [dict(zip(keys, range(i, i + n))) for i in range(ROWS)]
+
+
+def measure(factory: Callable[[dict], object], dicts: list[dict], /) -> float:
+    # Dicts are copied beforehand, thus only storage created by the factory is measured
+    dicts = [d.copy() for d in dicts]
+    gc.collect()
+    tracemalloc.start()
+    instances = list(map(factory, dicts))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size -= instances.__sizeof__()
+    if factory is implementations[0][1]:
+        # Adopted dicts are allocated before measuring
+        size += sum(map(dict.__sizeof__, dicts))
+
+    return size / len(dicts)
+
+
+def timing(stmt: str, d, key, /) -> str:
+    number = 100_000
+    return format_summary(time_stmt(stmt, dict(d=d, key=key, other=key), number=number), digits=0)
+
+
+def run(io: IO, /):
+    table = Table(
+        ['Measure', 'Storage', *(f'{n} items' for n in SIZES)],
+        [Alignment.LEFT, Alignment.LEFT, *(Alignment.RIGHT for _ in SIZES)],
+        io,
+        )
+
+    all_dicts = [make_dicts(n) for n in SIZES]
+    for descr, factory in implementations:
+        table.append(['Bytes per instance', descr, *(f'{measure(factory, dicts):.0f}' for dicts in all_dicts)])
+
+    for measure_descr, stmt, hit in [
+        ('Hit `d[key]`, ns', 'd[key]', True),
+        ('Miss `key in d`, ns', 'key in d', False),
+        ('`hash(d)` uncached, ns', 'd._frozendict__hash = None; hash(d)', True),
+        ('`d == other`, ns', 'd == other', None),
+        ]:
+        for descr, factory in implementations:
+            row = [measure_descr, descr]
+            for n, dicts in zip(SIZES, all_dicts):
+                d = factory(dicts[0].copy())
+                if hit is None:
+                    # An equal dictionary with another storage
+                    key = frozendict.adopt(dicts[0].copy())
+                elif hit and not n:
+                    row.append('-')
+                    continue
+                elif hit:
+                    key = ''.join(list(f'key{n - 1}'))
+                else:
+                    key = 'absent'
+
+                row.append(timing(stmt, d, key))
+
+            table.append(row)
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/compact.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        f.write('# Compact storage of small frozendict\n\n')
+        run(f)
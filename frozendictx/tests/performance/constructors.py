@@ -0,0 +1,79 @@
+"""
+Compares construction paths of ``frozendict`` which copy a dict with the ones which do not.
+Peak memory is measured with ``tracemalloc`` in a separate run,
+it includes only memory allocated during the construction.
+"""
+
+import gc
+import pickle
+import tracemalloc
+from collections.abc import Callable
+from itertools import chain
+from typing import IO
+
+from frozendictx import frozendict
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+
+def peak_memory(func: Callable[[], object], /) -> int:
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run_for_n_values(n: int, io: IO, /):
+    keys = [f'{i}' for i in range(n)]
+    a = frozendict({k: 0 for k in keys})
+    b = {k: 1 for k in keys[:n // 2]}
+    pickled_dict = pickle.dumps(dict(a))
+    pickled = pickle.dumps(a)
+
+    cases = [
+        (
+            'Wrap a new dict',
+            ('`frozendict(d)`', lambda: frozendict({k: 0 for k in keys})),
+            ('`frozendict.adopt(d)`', lambda: frozendict.adopt({k: 0 for k in keys})),
+            ),
+        (
+            'From keys',
+            ('Generator of pairs', lambda: frozendict((k, 0) for k in keys)),
+            ('`frozendict.fromkeys`', lambda: frozendict.fromkeys(keys, 0)),
+            ),
+        (
+            'Merge',
+            ('`chain` of items', lambda: frozendict(chain(a.items(), b.items()))),
+            ('`a | b`', lambda: a | b),
+            ),
+        (
+            'Unpickle',
+            ('Unpickle dict and copy', lambda: frozendict(pickle.loads(pickled_dict))),
+            ('Unpickle `frozendict`', lambda: pickle.loads(pickled)),
+            ),
+        ]
+
+    io.write(f'# {n:,} items in dict\n\n')
+    table = Table(
+        ['Operation', 'Construction way', 'Time required, μs', 'Peak memory, bytes'],
+        [Alignment.LEFT, Alignment.LEFT, Alignment.RIGHT, Alignment.RIGHT],
+        io,
+        )
+
+    number = max(1, 10_000 // n)
+    for operation, *ways in cases:
+        for descr, func in ways:
+            value = time_stmt('f()', dict(f=func), number=number)
+            table.append([operation, descr, format_summary(value, unit=1000, digits=3), f'{peak_memory(func):,}'])
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/constructors.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        for N in [10, 1000, 100_000, 1_000_000]:
+            run_for_n_values(N, f)
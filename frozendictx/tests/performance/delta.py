@@ -0,0 +1,60 @@
+"""
+Compares ``diff`` of a large dictionary with a copy which has a few changed keys.
+For ``frozenmap`` the copy is derived via ``update``, thus most trie nodes are shared,
+for ``frozenoverlay`` the copy has one more layer.
+The first row is a comparison via ``==`` which cannot tell what is changed
+and stops at the first changed key.
+"""
+
+from typing import IO
+
+from frozendictx import frozendict, frozenmap, frozenoverlay
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+CHANGES = 10
+
+
+def derive(cls: type, d, /):
+    changes = {f'{i}': -i for i in range(0, len(d), len(d) // CHANGES)}
+    if cls is frozenmap:
+        return d.update(changes)
+
+    return d | changes
+
+
+implementations = [
+    ('`frozendict` and `==`', frozendict, 'old == new'),
+    ('`frozendict`', frozendict, 'old.diff(new)'),
+    ('`frozenmap`', frozenmap, 'old.diff(new)'),
+    ('`frozenoverlay`', frozenoverlay, 'old.diff(new)'),
+    ]
+
+
+def run(io: IO, /):
+    sizes = [100, 10_000, 1_000_000]
+    table = Table(
+        ['Implementation', *(f'{n:,} items, μs' for n in sizes)],
+        [Alignment.LEFT, *(Alignment.RIGHT for _ in sizes)],
+        io,
+        )
+
+    for descr, cls, stmt in implementations:
+        row = [descr]
+        for n in sizes:
+            old = cls({f'{i}': i for i in range(n)})
+            new = derive(cls, old)
+            number = max(1, 100_000 // n)
+            row.append(format_summary(time_stmt(stmt, dict(old=old, new=new), number=number), unit=1000))
+
+        table.append(row)
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/delta.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        f.write(f'# Difference of {CHANGES} changed keys\n\n')
+        run(f)
@@ -0,0 +1,48 @@
+"""
+Compares time of ``hash(parent | override)`` when hash value of the parent is not cached,
+i.e., hash value of the result is calculated from scratch,
+with the time when it is cached, i.e., hash value of the result is derived from the cached one.
+Both cases include time required for ``|`` itself.
+"""
+
+from typing import IO
+
+from frozendictx import frozendict, frozenmap
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+implementations = frozendict, frozenmap
+
+
+def run_for_n_values(n: int, overrides: int, io: IO, /):
+    d = {f'{i}': i for i in range(1, n + 1)}
+    # Half of keys override existing ones, another half are new
+    other = {f'{i * 2 if i % 2 else -i}': -i for i in range(1, overrides + 1)}
+
+    io.write(f'## {n:,} items in dictionary, {overrides:,} items in override\n\n')
+    table = Table(
+        ['Implementation', 'Parent hash', 'Time required, μs'],
+        [Alignment.LEFT, Alignment.LEFT, Alignment.RIGHT],
+        io,
+        )
+
+    for cls in implementations:
+        not_hashed = cls(d)
+        hashed = cls(d)
+        hash(hashed)
+
+        for parent, descr in [(not_hashed, 'not cached'), (hashed, 'cached')]:
+            value = time_stmt('hash(d | other)', dict(d=parent, other=other), number=1)
+            table.append([f'`{cls.__name__}`', descr, format_summary(value, unit=1000, digits=3)])
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/derived-hash.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        for N in [1000, 10_000, 100_000, 1_000_000]:
+            f.write(f'# {N:,} items in dictionary\n\n')
+            for O in [1, 10, 100]:
+                run_for_n_values(N, O, f)
@@ -0,0 +1,83 @@
+"""
+Compares calculation of a process-independent digest of a dictionary with nested records
+via SHA-256 of canonical JSON and via ``frozendict.digest``.
+Uncached digest is calculated with digests of all nested dictionaries reset,
+derived digest is calculated for a dictionary derived via ``|`` from a digested one,
+i.e., nested dictionaries contribute their cached digests.
+"""
+
+import json
+from hashlib import sha256
+from typing import IO
+
+from frozendictx import freeze, frozendict
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+
+def make_records(n: int, /) -> dict:
+    return {
+        f'record{i}': {
+            'id': i,
+            'name': f'user{i}',
+            'score': i * 0.5,
+            'tags': ('admin', 'eu') if i % 2 else ('guest',),
+            'meta': {'active': True, 'parent': None},
+            }
+        for i in range(n)
+        }
+
+
+def reset(d: frozendict, /):
+    d._frozendict__digest = None
+    for v in d.values():
+        if isinstance(v, frozendict):
+            reset(v)
+
+
+implementations = [
+    ('SHA-256 of JSON', 'sha256(json.dumps(plain, sort_keys=True).encode()).digest()'),
+    ('Uncached `digest`', 'reset(fd); fd.digest()'),
+    ('Derived `digest`', 'fd.digest(); (fd | changes).digest()'),
+    ('Cached `digest`', 'fd.digest()'),
+    ]
+
+
+def run(io: IO, /):
+    sizes = [10, 1000, 100_000]
+    table = Table(
+        ['Implementation', *(f'{n:,} records, μs' for n in sizes)],
+        [Alignment.LEFT, *(Alignment.RIGHT for _ in sizes)],
+        io,
+        )
+
+    dictionaries = []
+    for n in sizes:
+        plain = make_records(n)
+        dictionaries.append((plain, freeze(plain)))
+
+    for descr, stmt in implementations:
+        row = [descr]
+        for plain, fd in dictionaries:
+            number = max(1, 10_000 // len(plain))
+            globals_ = dict(
+                plain=plain,
+                fd=fd,
+                changes={'record0': fd['record1']},
+                json=json,
+                sha256=sha256,
+                reset=reset,
+                )
+            row.append(format_summary(time_stmt(stmt, globals_, number=number), unit=1000))
+
+        table.append(row)
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/digest.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        f.write('# Digest of nested records\n\n')
+        run(f)
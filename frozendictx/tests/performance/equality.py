@@ -1,6 +1,7 @@
 from collections.abc import Mapping
 from typing import Any, IO
 
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
 from tests.performance.helper import *
 
 
@@ -68,21 +69,20 @@ def run_for_n_values(n: int, io: IO, /):
         io.write(f'## {descr}\n\n')
 
         table = Table(
-            ['Implementation', 'Time required, s'],
+            ['Implementation', 'Time required, ns'],
             [Alignment.LEFT, Alignment.RIGHT],
             io,
             )
 
         for ins in instances:
-            value = get_time_value(
-                repeat('v1 == v2', repeat=100, globals=globals_func(ins, d_shifted))
-                )
-            table.append([f'`{ins.__class__.__name__}`', value.seconds])
+            value = time_stmt('v1 == v2', globals_func(ins, d_shifted), number=max(1, 1_000_000 // n))
+            table.append([f'`{ins.__class__.__name__}`', format_summary(value)])
 
         io.write('\n')
 
 
 with open('reports/equality.md', 'w') as f:
     f.write(report_header())
+    f.write(SUMMARY_NOTE)
     for N in [10, 100, 1000]:
         run_for_n_values(N, f)
@@ -1,6 +1,7 @@
 from collections.abc import Mapping
 from typing import Any, Callable
 
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
 from tests.performance.helper import *
 
 
@@ -86,16 +87,8 @@ def run_test(
     d_shifted = {f'{i}': i + 1 for i in range(1, n + 1)}
     instance = cls(d)
 
-    value = get_time_value(
-        repeat(
-            'v1 == v2',
-            repeat=1000000,
-            number=1,
-            globals=globals_func(instance, d_shifted),
-            )
-        )
-
-    return n, description, cls.__name__, value.micro
+    value = time_stmt('v1 == v2', globals_func(instance, d_shifted), number=max(1, 1_000_000 // n))
+    return n, description, cls.__name__, format_summary(value, unit=1000, digits=3)
 
 
 def run_tests(*sizes: int):
@@ -125,6 +118,7 @@ def run_tests(*sizes: int):
 
     with open(md_file_path, 'w') as f:
         f.write(report_header())
+        f.write(SUMMARY_NOTE)
         for n in sizes:
             f.write(f'# {n:,} items in dictionaries\n\n')
 
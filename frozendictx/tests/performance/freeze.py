@@ -0,0 +1,86 @@
+"""
+Compares time required to convert a nested document into immutable containers
+by plain recursion and via ``freeze``, and time of the first ``hash`` and ``deepcopy`` of the result.
+Time of ``thaw`` is compared with ``deepcopy`` of the original document.
+"""
+
+from copy import deepcopy
+from typing import IO, Any
+
+from frozendictx import freeze, frozendict, thaw
+from tests.performance.harness import SUMMARY_NOTE, format_summary, summarize, time_stmt
+from tests.performance.helper import *
+
+
+def naive_freeze(obj: Any, /) -> Any:
+    if isinstance(obj, dict):
+        return frozendict({k: naive_freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(naive_freeze(o) for o in obj)
+    if isinstance(obj, set):
+        return frozenset(obj)
+
+    return obj
+
+
+def make_document(n: int, /) -> dict:
+    return {
+        'records': [
+            {
+                'id': i,
+                'name': f'record {i}',
+                'tags': [f'tag{i % 7}', f'tag{i % 11}'],
+                'meta': {'score': i / 3, 'flags': {i % 2, i % 3}, 'parent': {'id': i // 10}},
+                }
+            for i in range(n)
+            ],
+        }
+
+
+def measure(stmt: str, g: dict, /) -> str:
+    return format_summary(time_stmt(stmt, g, number=1), unit=1000, digits=3)
+
+
+def run_for_n_records(n: int, io: IO, /):
+    doc = make_document(n)
+
+    io.write(f'# {n:,} records in document\n\n')
+    table = Table(
+        ['Conversion way', 'Conversion, μs', 'First `hash`, μs', 'First `deepcopy`, μs'],
+        [Alignment.LEFT, Alignment.RIGHT, Alignment.RIGHT, Alignment.RIGHT],
+        io,
+        )
+
+    for descr, func in [('Plain recursion', naive_freeze), ('`freeze`', freeze)]:
+        g = dict(f=func, doc=doc, hash=hash, deepcopy=deepcopy)
+        conversion = measure('f(doc)', g)
+        times = []
+        for stmt in ['hash(r)', 'deepcopy(r)']:
+            # Every repetition gets a new result to measure the first call
+            values = []
+            for _ in range(15):
+                r = func(doc)
+                values.extend(repeat(stmt, repeat=1, number=1, globals=dict(g, r=r)))
+
+            times.append(format_summary(summarize(values), unit=1000, digits=3))
+
+        table.append([descr, conversion, *times])
+
+    io.write('\n')
+    table = Table(
+        ['Way to make mutable copy', 'Time required, μs'],
+        [Alignment.LEFT, Alignment.RIGHT],
+        io,
+        )
+    frozen = freeze(doc)
+    table.append(['`deepcopy` of original', measure('deepcopy(doc)', dict(deepcopy=deepcopy, doc=doc))])
+    table.append(['`thaw` of frozen', measure('thaw(frozen)', dict(thaw=thaw, frozen=frozen))])
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/freeze.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        for N in [100, 10_000, 100_000]:
+            run_for_n_records(N, f)
@@ -0,0 +1,377 @@
+"""
+Benchmark harness for implementations of immutable dictionaries.
+
+Every benchmark is run several times, every sample is the mean time of one operation
+over a number of loops calibrated to take at least ``--min-time`` seconds.
+Results contain the median, quartiles, interquartile range
+and the distribution-free 95% confidence interval of the median.
+
+Results are saved as JSON. If a baseline is given, medians are compared with it,
+and a benchmark is flagged as a regression when its median is slower by more than ``--threshold``
+and the confidence intervals do not overlap. In this case the exit code is 1.
+
+Usage example from the project directory::
+
+    python tests/performance/harness.py --sizes 10 1000 --output reports/raw/benchmark.json
+    python tests/performance/harness.py --sizes 10 1000 --baseline reports/raw/benchmark.json
+"""
+
+import gc
+import json
+import os
+import pickle
+import platform
+import sys
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterable
+from copy import copy, deepcopy
+from math import ceil, floor, sqrt
+from statistics import median, quantiles
+from time import perf_counter_ns
+from typing import Any, IO, NamedTuple, Optional
+
+from frozendictx import frozendict, frozenmap, nativefrozendict
+from tests.performance.helper import *
+
+implementations: dict[str, type] = {
+    'frozendict': frozendict,
+    'frozenmap': frozenmap,
+    'nativefrozendict': nativefrozendict,
+    }
+
+DEFAULT_SIZES = [10, 100, 1000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    """The name of the operation."""
+    setup: Callable[[type, dict, int], dict]
+    """Function which accepts a class, source items and the number of loops and returns globals for ``stmt``."""
+    stmt: str
+    """Statement which performs the operation once."""
+
+
+def fresh_instances(cls: type, source: dict, number: int, /) -> dict:
+    # Operations which cache something are measured on new instances
+    return dict(it=iter([cls(source) for _ in range(number)]))
+
+
+# Instances for operations which do not change them are created once per class and size
+_ready: dict[type, dict] = {}
+
+
+def ready_instance(cls: type, source: dict, _: int, /) -> dict:
+    g = _ready.get(cls)
+    if g is None:
+        d = cls(source)
+        try:
+            hash(d)
+        except TypeError:
+            pass
+
+        g = _ready[cls] = dict(
+            d=d,
+            other=cls(source),
+            key=next(iter(source)),
+            small={next(iter(source)): None},
+            data=pickle.dumps(d, pickle.HIGHEST_PROTOCOL),
+            )
+
+    return g.copy()
+
+
+benchmarks = [
+    Benchmark('construction', lambda cls, source, _: dict(cls=cls, source=source), 'cls(source)'),
+    Benchmark('lookup', ready_instance, 'd[key]'),
+    Benchmark('iteration', ready_instance, 'for _ in d.items(): pass'),
+    Benchmark('first hash', fresh_instances, 'hash(next(it))'),
+    Benchmark('cached hash', ready_instance, 'hash(d)'),
+    Benchmark('equality', ready_instance, 'd == other'),
+    Benchmark('union', ready_instance, 'd | small'),
+    Benchmark('copy', ready_instance, 'copy(d)'),
+    Benchmark('first deepcopy', fresh_instances, 'deepcopy(next(it))'),
+    Benchmark('pickle dumps', ready_instance, 'dumps(d, HIGHEST_PROTOCOL)'),
+    Benchmark('pickle loads', ready_instance, 'loads(data)'),
+    ]
+
+_common_globals = dict(
+    copy=copy,
+    deepcopy=deepcopy,
+    hash=hash,
+    next=next,
+    dumps=pickle.dumps,
+    loads=pickle.loads,
+    HIGHEST_PROTOCOL=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def run_loops(benchmark: Benchmark, cls: type, source: dict, number: int, /) -> float:
+    """Return the mean time of one operation in nanoseconds."""
+    g = benchmark.setup(cls, source, number)
+    g.update(_common_globals)
+    code = compile(f'for _i in range({number}):\n    {benchmark.stmt}', benchmark.name, 'exec')
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = perf_counter_ns()
+        exec(code, g)
+        end = perf_counter_ns()
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return (end - start) / number
+
+
+def calibrate(benchmark: Benchmark, cls: type, source: dict, min_time: float, /) -> int:
+    """Return the number of loops which takes at least ``min_time`` seconds."""
+    number = 1
+    while True:
+        elapsed = run_loops(benchmark, cls, source, number) * number / 1e9
+        if elapsed >= min_time:
+            return number
+
+        # Aim a bit higher than required to avoid many iterations
+        number = max(number * 2, ceil(number * min_time * 1.2 / max(elapsed, 1e-9)))
+
+
+class Summary(NamedTuple):
+    median: float
+    q1: float
+    q3: float
+    iqr: float
+    ci_low: float
+    ci_high: float
+    samples: int
+
+
+def summarize(samples: list[float], /) -> Summary:
+    """
+    Return statistics of samples.
+    The confidence interval of the median is built from order statistics,
+    thus it does not assume any distribution of samples.
+    """
+    values = sorted(samples)
+    n = len(values)
+    if n > 1:
+        q1, _, q3 = quantiles(values, n=4, method='inclusive')
+    else:
+        q1 = q3 = values[0]
+
+    # Ranks of the 95% interval via the normal approximation of the binomial distribution
+    half_width = 1.96 * sqrt(n) / 2
+    low = max(0, floor(n / 2 - half_width))
+    high = min(n - 1, ceil(n / 2 + half_width) - 1)
+    return Summary(median(values), q1, q3, q3 - q1, values[low], values[high], n)
+
+
+def time_stmt(stmt: str, globals_: dict[str, Any], /, number: int, samples: int = 15) -> Summary:
+    """
+    Return statistics of the mean time of one execution of ``stmt`` in nanoseconds.
+    Every sample executes it ``number`` times like ``timeit`` does, i.e., with garbage collection disabled.
+    Scripts which compare a few implementations use it instead of a whole benchmark.
+    """
+    return summarize([t / number for t in repeat(stmt, repeat=samples, number=number, globals=globals_)])
+
+
+def format_summary(summary: Summary, /, unit: float = 1, digits: int = 1) -> str:
+    """
+    Return the median, the interquartile range and the 95% confidence interval of the median
+    in ``unit`` nanoseconds for a table cell.
+    """
+    def f(value: float, /) -> str:
+        return f'{value / unit:,.{digits}f}'
+
+    return f'{f(summary.median)} (IQR {f(summary.iqr)}, CI {f(summary.ci_low)}–{f(summary.ci_high)})'
+
+
+SUMMARY_NOTE = (
+    'Times are medians of samples;'
+    ' interquartile ranges and 95% confidence intervals of medians are in parentheses.\n\n'
+    )
+
+
+def measure(
+        benchmark: Benchmark,
+        cls: type,
+        source: dict,
+        /,
+        repeat: int,
+        min_time: float,
+        max_time: float,
+        ) -> tuple[Summary, int]:
+    """
+    Return statistics of samples and the number of loops in every sample.
+    Fewer samples are taken if they would exceed ``max_time`` seconds, but at least 3.
+    """
+    number = calibrate(benchmark, cls, source, min_time)
+    samples = [run_loops(benchmark, cls, source, number)]
+    limit = max(3, min(repeat, int(max_time * 1e9 / (samples[0] * number))))
+    while len(samples) < limit:
+        samples.append(run_loops(benchmark, cls, source, number))
+
+    return summarize(samples), number
+
+
+def compare(result: dict, baseline: dict, threshold: float, /) -> Optional[str]:
+    """Return ``'regression'`` or ``'improvement'`` if the change is significant, otherwise ``None``."""
+    ratio = result['median_ns'] / baseline['median_ns']
+    if ratio > 1 + threshold and result['ci95_ns'][0] > baseline['ci95_ns'][1]:
+        return 'regression'
+
+    if ratio < 1 - threshold and result['ci95_ns'][1] < baseline['ci95_ns'][0]:
+        return 'improvement'
+
+    return None
+
+
+def result_key(result: dict, /) -> tuple:
+    return result['benchmark'], result['implementation'], result['size']
+
+
+def run(
+        sizes: Iterable[int],
+        names: Iterable[str],
+        operations: set[str],
+        /,
+        repeat: int,
+        min_time: float,
+        max_time: float,
+        log: IO = sys.stderr,
+        ) -> list[dict]:
+    results = []
+    for size in sizes:
+        source = {f'{i}': i for i in range(1, size + 1)}
+        for name in names:
+            cls = implementations[name]
+            for benchmark in benchmarks:
+                if operations and benchmark.name not in operations:
+                    continue
+
+                summary, number = measure(
+                    benchmark,
+                    cls,
+                    source,
+                    repeat=repeat,
+                    min_time=min_time,
+                    max_time=max_time,
+                    )
+                results.append(
+                    dict(
+                        benchmark=benchmark.name,
+                        implementation=name,
+                        size=size,
+                        median_ns=summary.median,
+                        q1_ns=summary.q1,
+                        q3_ns=summary.q3,
+                        iqr_ns=summary.iqr,
+                        ci95_ns=[summary.ci_low, summary.ci_high],
+                        samples=summary.samples,
+                        loops=number,
+                        )
+                    )
+                print(f'{size:>10,} {name:<18} {benchmark.name:<16} {summary.median:>16,.1f} ns', file=log)
+
+        del source
+        _ready.clear()
+        gc.collect()
+
+    return results
+
+
+def write_markdown(results: list[dict], io: IO, /):
+    io.write(report_header())
+    table = Table(
+        ['Size', 'Implementation', 'Benchmark', 'Median, ns', 'IQR, ns', '95% CI, ns', 'Change'],
+        [
+            Alignment.RIGHT,
+            Alignment.LEFT,
+            Alignment.LEFT,
+            Alignment.RIGHT,
+            Alignment.RIGHT,
+            Alignment.RIGHT,
+            Alignment.LEFT,
+            ],
+        io,
+        )
+    for r in results:
+        low, high = r['ci95_ns']
+        change = r.get('change')
+        table.append(
+            [
+                f'{r["size"]:,}',
+                f'`{r["implementation"]}`',
+                r['benchmark'],
+                f'{r["median_ns"]:,.1f}',
+                f'{r["iqr_ns"]:,.1f}',
+                f'{low:,.1f} – {high:,.1f}',
+                f'{change} ({r["baseline_ratio"]:.2f}×)' if change else '',
+                ]
+            )
+
+
+def info() -> dict[str, Any]:
+    return dict(
+        platform=platform.platform(aliased=True),
+        python_version=platform.python_version(),
+        python_compiler=platform.python_compiler(),
+        processor=platform.processor(),
+        )
+
+
+def main(argv: list[str] = None, /) -> int:
+    parser = ArgumentParser(description='Run benchmarks of immutable dictionaries.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--implementations', nargs='+', choices=list(implementations), default=list(implementations))
+    parser.add_argument('--benchmarks', nargs='+', choices=[b.name for b in benchmarks], default=[])
+    parser.add_argument('--repeat', type=int, default=15, help='the maximal number of samples')
+    parser.add_argument('--min-time', type=float, default=0.005, help='the minimal duration of a sample, s')
+    parser.add_argument('--max-time', type=float, default=5, help='the maximal duration of all samples, s')
+    parser.add_argument('--output', default='reports/raw/benchmark.json', help='path to save JSON results')
+    parser.add_argument('--markdown', help='path to save a markdown report')
+    parser.add_argument('--baseline', help='path to JSON results to compare with')
+    parser.add_argument('--threshold', type=float, default=0.05, help='the minimal relative change to report')
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.sizes,
+        args.implementations,
+        set(args.benchmarks),
+        repeat=args.repeat,
+        min_time=args.min_time,
+        max_time=args.max_time,
+        )
+
+    regressions = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = {result_key(r): r for r in json.load(f)['results']}
+
+        for r in results:
+            b = baseline.get(result_key(r))
+            if b is None:
+                continue
+
+            r['baseline_ratio'] = r['median_ns'] / b['median_ns']
+            r['change'] = compare(r, b, args.threshold)
+            if r['change'] == 'regression':
+                regressions += 1
+                print(
+                    f'regression: {r["benchmark"]} of {r["implementation"]} with {r["size"]:,} items '
+                    f'is {r["baseline_ratio"]:.2f} times slower',
+                    file=sys.stderr,
+                    )
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(dict(info=info(), results=results), f, indent=2)
+
+    if args.markdown:
+        with open(args.markdown, 'w') as f:
+            write_markdown(results, f)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
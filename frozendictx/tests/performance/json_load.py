@@ -0,0 +1,89 @@
+"""
+Compares decoding of JSON into immutable values
+via ``json.loads`` followed by ``freeze`` and via ``loads_json``.
+Documents are lists of similar records, thus they have many equal sub-objects.
+Memory is the total size of the result with shared objects counted once.
+"""
+
+import gc
+import json
+from sys import getsizeof
+from typing import IO
+
+from frozendictx import FrozendictBase, freeze, loads_json
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+implementations = [
+    ('`json.loads`', lambda s: json.loads(s)),
+    ('`json.loads` and `freeze`', lambda s: freeze(json.loads(s))),
+    ('`loads_json` without interning', lambda s: loads_json(s, intern=False)),
+    ('`loads_json`', lambda s: loads_json(s)),
+    ]
+
+
+def make_document(n: int, /) -> str:
+    records = [
+        {
+            'id': i,
+            'kind': ['event', 'metric', 'log'][i % 3],
+            'tags': ['prod', 'eu-west'] if i % 2 else ['dev'],
+            'source': {'host': f'host-{i % 10}', 'port': 8080},
+            }
+        for i in range(n)
+        ]
+    return json.dumps(records)
+
+
+def deep_size(o, /) -> int:
+    seen = set()
+    stack = [o]
+    size = 0
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+
+        seen.add(id(o))
+        if isinstance(o, FrozendictBase):
+            size += o.sizeof()
+        else:
+            size += getsizeof(o)
+
+        if isinstance(o, (list, tuple)):
+            stack.extend(o)
+        elif isinstance(o, (dict, FrozendictBase)):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+
+    return size
+
+
+def run(io: IO, /):
+    sizes = [100, 10_000, 100_000]
+    table = Table(
+        ['Implementation', *(f'{n:,} records, ms' for n in sizes), *(f'{n:,} records, KiB' for n in sizes)],
+        [Alignment.LEFT, *(Alignment.RIGHT for _ in range(2 * len(sizes)))],
+        io,
+        )
+
+    documents = [make_document(n) for n in sizes]
+    for descr, f in implementations:
+        times = []
+        memory = []
+        for s in documents:
+            number = max(1, 1_000_000 // len(s))
+            times.append(format_summary(time_stmt('f(s)', dict(f=f, s=s), number=number), unit=1e6, digits=2))
+            memory.append(f'{deep_size(f(s)) / 1024:,.0f}')
+            gc.collect()
+
+        table.append([descr, *times, *memory])
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/json-load.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        run(f)
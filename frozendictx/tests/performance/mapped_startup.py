@@ -0,0 +1,61 @@
+"""
+Compares time required to get the first value from a dictionary stored in a file:
+unpickling ``frozendict`` versus opening ``mappedfrozendict``.
+"""
+
+import os
+import pickle
+from tempfile import TemporaryDirectory
+from typing import IO
+
+from frozendictx import frozendict, mappedfrozendict
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+
+def run_for_n_values(n: int, directory: str, io: IO, /):
+    d = frozendict({f'{i}': i for i in range(1, n + 1)})
+    pickle_path = os.path.join(directory, 'd.pickle')
+    mapped_path = os.path.join(directory, 'd.fdx')
+    with open(pickle_path, 'wb') as f:
+        pickle.dump(d, f)
+
+    mappedfrozendict.write(mapped_path, d).close()
+    key = f'{n}'
+
+    def load_pickle():
+        with open(pickle_path, 'rb') as f:
+            return pickle.load(f)[key]
+
+    def open_mapped():
+        m = mappedfrozendict(mapped_path)
+        value = m[key]
+        m.close()
+        return value
+
+    implementations = [
+        ('`pickle.load` of `frozendict`', load_pickle, os.path.getsize(pickle_path)),
+        ('`mappedfrozendict`', open_mapped, os.path.getsize(mapped_path)),
+        ]
+
+    io.write(f'# {n:,} items in dict\n\n')
+    table = Table(
+        ['Implementation', 'Time required, μs', 'File size, bytes'],
+        [Alignment.LEFT, Alignment.RIGHT, Alignment.RIGHT],
+        io,
+        )
+
+    number = max(1, 10_000 // n)
+    for descr, func, size in implementations:
+        value = time_stmt('f()', dict(f=func), number=number)
+        table.append([descr, format_summary(value, unit=1000, digits=3), f'{size:,}'])
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/mapped-startup.md', 'w') as f, TemporaryDirectory() as tmp:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        for N in [10, 1000, 100_000, 1_000_000]:
+            run_for_n_values(N, tmp, f)
@@ -11,6 +11,7 @@ https://docs.python.org/release/3.9.7/whatsnew/changelog.html#python-3-9-7-final
 from collections.abc import Mapping, Set
 from typing import IO
 
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
 from tests.performance.helper import *
 
 # noinspection PyUnresolvedReferences,PyProtectedMember
@@ -38,24 +39,26 @@ def run_for_n_values(n: int, io: IO, /):
     _ = d.items()  # if some caching exists
     io.write(f'# {n:,} items in dict\n\n')
     table = Table(
-        ['Calculation way', 'Time required, s'],
+        ['Calculation way', 'Time required, μs'],
         [Alignment.LEFT, Alignment.RIGHT],
         io,
         )
 
-    hash_frozenset = get_time_value(repeat('f(d)', globals=dict(d=d, f=mapping_hash_0)))
-    table.append(['`hash(frozenset(...))`', hash_frozenset.seconds])
+    number = max(1, 100_000 // n)
+    hash_frozenset = time_stmt('f(d)', dict(d=d, f=mapping_hash_0), number=number)
+    table.append(['`hash(frozenset(...))`', format_summary(hash_frozenset, unit=1000, digits=3)])
 
-    set_hash = get_time_value(repeat('f(d)', globals=dict(d=d, f=mapping_hash_1)))
-    table.append(['`Set._hash(...)`', set_hash.seconds])
+    set_hash = time_stmt('f(d)', dict(d=d, f=mapping_hash_1), number=number)
+    table.append(['`Set._hash(...)`', format_summary(set_hash, unit=1000, digits=3)])
 
-    cached_set_hash = get_time_value(repeat('f(d)', globals=dict(d=d, f=mapping_hash_2)))
-    table.append(['Cached `Set._hash(...)`', cached_set_hash.seconds])
+    cached_set_hash = time_stmt('f(d)', dict(d=d, f=mapping_hash_2), number=number)
+    table.append(['Cached `Set._hash(...)`', format_summary(cached_set_hash, unit=1000, digits=3)])
 
     io.write('\n')
 
 
 with open('reports/mapping-hash.md', 'w') as f:
     f.write(report_header())
+    f.write(SUMMARY_NOTE)
     for N in [10, 100, 1000, 10_000]:
         run_for_n_values(N, f)
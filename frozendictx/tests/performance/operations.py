@@ -0,0 +1,71 @@
+"""
+Compares time of common operations on ``dict``, ``frozendict`` and ``nativefrozendict``.
+Hash values of immutable dictionaries are cached before measurements.
+"""
+
+from typing import IO
+
+from frozendictx import frozendict, nativefrozendict
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+implementations = dict, frozendict, nativefrozendict
+
+operations = [
+    ('`d[key]`', 'd[key]'),
+    ('`d.get(key)`', 'd.get(key)'),
+    ('`key in d`', 'key in d'),
+    ('`d.get(missing)`', 'd.get(missing)'),
+    ('`len(d)`', 'len(d)'),
+    ('`for _ in d`', 'for _ in d: pass'),
+    ('`d.items()` iteration', 'for _ in d.items(): pass'),
+    ('`d == other`', 'd == other'),
+    ('`hash(d)`', 'hash(d)'),
+    ('`d | small`', 'd | small'),
+    ('`cls(source)`', 'cls(source)'),
+    ]
+
+
+def run_for_n_values(n: int, io: IO, /):
+    source = {f'{i}': i for i in range(1, n + 1)}
+    instances = [cls(source) for cls in implementations]
+    for d in instances[1:]:
+        hash(d)
+
+    io.write(f'# {n:,} items in dict\n\n')
+    table = Table(
+        ['Operation', *(f'`{cls.__name__}`, ns' for cls in implementations)],
+        [Alignment.LEFT, *(Alignment.RIGHT for _ in implementations)],
+        io,
+        )
+
+    number = max(1, 100_000 // n)
+    for descr, stmt in operations:
+        row = [descr]
+        for d in instances:
+            if stmt == 'hash(d)' and d.__class__ is dict:
+                row.append('—')
+                continue
+
+            g = dict(
+                d=d,
+                cls=d.__class__,
+                key=f'{n // 2 + 1}',
+                missing='missing',
+                other=d.__class__(source),
+                small={'1': 0},
+                source=source,
+                )
+            row.append(format_summary(time_stmt(stmt, g, number=number * 10)))
+
+        table.append(row)
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/operations.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        for N in [10, 1000, 100_000]:
+            run_for_n_values(N, f)
@@ -0,0 +1,74 @@
+"""
+Compares stacking of small layers on top of a large dictionary
+via ``|`` of ``frozendict`` and via ``frozenoverlay``.
+Time includes building of the stack and the given number of lookups of keys from the bottom layer,
+i.e., the worst case for an overlay.
+"""
+
+from collections.abc import Callable
+from typing import IO
+
+from frozendictx import frozendict, frozenoverlay
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+BASE_SIZE = 1000
+LAYER_SIZE = 2
+
+
+def stack_frozendict(base: frozendict, layers: list[frozendict], /) -> frozendict:
+    result = base
+    for layer in layers:
+        result = result | layer
+
+    return result
+
+
+def stack_overlay(base: frozendict, layers: list[frozendict], /) -> frozenoverlay:
+    return frozenoverlay(base, *layers)
+
+
+implementations = [
+    ('`frozendict` and `|`', stack_frozendict),
+    ('`frozenoverlay`', stack_overlay),
+    ]
+
+
+def build_and_lookup(stack: Callable, base: frozendict, layers: list, keys: list, /):
+    d = stack(base, layers)
+    for k in keys:
+        d[k]
+
+
+def run_for_n_layers(n: int, io: IO, /):
+    base = frozendict({f'key{i}': i for i in range(BASE_SIZE)})
+    layers = [frozendict({f'layer{j}-{i}': i for i in range(LAYER_SIZE)}) for j in range(n)]
+    lookups = [0, 10, 100, 1000, 10_000]
+
+    io.write(f'# {n} layers on top of {BASE_SIZE:,} items\n\n')
+    table = Table(
+        ['Implementation', *(f'{m:,} lookups, μs' for m in lookups)],
+        [Alignment.LEFT, *(Alignment.RIGHT for _ in lookups)],
+        io,
+        )
+
+    for descr, stack in implementations:
+        row = [descr]
+        for m in lookups:
+            keys = [f'key{i % BASE_SIZE}' for i in range(m)]
+            g = dict(f=build_and_lookup, stack=stack, base=base, layers=layers, keys=keys)
+            number = max(1, 1000 // (m + 1))
+            value = time_stmt('f(stack, base, layers, keys)', g, number=number)
+            row.append(format_summary(value, unit=1000, digits=3))
+
+        table.append(row)
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/overlay.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        for N in [1, 2, 4, 8]:
+            run_for_n_layers(N, f)
@@ -0,0 +1,59 @@
+"""
+Compares pickling of a list of ``frozendict`` instances with the same keys
+and of the same instances in ``FrozendictBatch``.
+Hash values of all instances are cached before pickling.
+The last column includes unpickling and hashing of every instance,
+e.g., to use them as keys.
+"""
+
+import pickle
+from typing import IO
+
+from frozendictx import FrozendictBatch, frozendict
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+KEYS = ('id', 'name', 'country', 'created_at', 'score')
+
+
+def load_and_hash(data: bytes, /):
+    for d in pickle.loads(data):
+        hash(d)
+
+
+def run_for_n_values(n: int, io: IO, /):
+    items = [frozendict(zip(KEYS, (i, f'name {i}', 'NL', 1_600_000_000 + i, i / 7))) for i in range(n)]
+    for d in items:
+        hash(d)
+
+    implementations = [
+        ('`list`', items),
+        ('`FrozendictBatch`', FrozendictBatch(items)),
+        ]
+
+    io.write(f'# {n:,} dictionaries\n\n')
+    table = Table(
+        ['Container', 'Pickle size, bytes', 'Dumps, μs', 'Loads, μs', 'Loads and hash, μs'],
+        [Alignment.LEFT, Alignment.RIGHT, Alignment.RIGHT, Alignment.RIGHT, Alignment.RIGHT],
+        io,
+        )
+
+    number = max(1, 10_000 // n)
+    for descr, container in implementations:
+        data = pickle.dumps(container, pickle.HIGHEST_PROTOCOL)
+        g = dict(pickle=pickle, c=container, data=data, f=load_and_hash)
+        row = [descr, f'{len(data):,}']
+        for stmt in ['pickle.dumps(c, pickle.HIGHEST_PROTOCOL)', 'pickle.loads(data)', 'f(data)']:
+            row.append(format_summary(time_stmt(stmt, g, number=number), unit=1000))
+
+        table.append(row)
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/pickle-batch.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        for N in [10, 1000, 100_000]:
+            run_for_n_values(N, f)
@@ -0,0 +1,55 @@
+"""
+Compares memory occupied by rows stored as ``frozendict`` and as ``frozenrecord``.
+Values are created beforehand and shared, i.e., only containers are measured.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import IO
+
+from frozendictx import frozendict, schema
+from tests.performance.helper import *
+
+ROWS = 100_000
+
+
+def measure(factory: Callable[[list], object], rows: list[list], /) -> float:
+    gc.collect()
+    tracemalloc.start()
+    instances = [factory(row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Exclude the list holding instances
+    size -= instances.__sizeof__()
+    return size / len(rows)
+
+
+def run_for_n_keys(n: int, io: IO, /):
+    keys = tuple(f'key{i}' for i in range(n))
+    rows = [list(range(i, i + n)) for i in range(ROWS)]
+    row_schema = schema(keys)
+
+    implementations = [
+        ('`frozendict`', lambda row: frozendict(zip(keys, row))),
+        ('`frozenrecord`', row_schema.from_values),
+        ]
+
+    io.write(f'# {n:,} keys in a row\n\n')
+    table = Table(
+        ['Implementation', 'Bytes per row'],
+        [Alignment.LEFT, Alignment.RIGHT],
+        io,
+        )
+
+    for descr, factory in implementations:
+        table.append([descr, f'{measure(factory, rows):.1f}'])
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/schema-memory.md', 'w') as f:
+        f.write(report_header())
+        for N in [1, 3, 5, 10, 20]:
+            run_for_n_keys(N, f)
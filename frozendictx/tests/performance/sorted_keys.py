@@ -0,0 +1,81 @@
+"""
+Compares range and prefix queries over keys of ``frozendict``
+via sorting of keys on every query and via ``frozendict.sorted_keys``.
+Time of the index includes its building on the first query.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import IO
+
+from frozendictx import frozendict
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+QUERY_WIDTH = 10
+
+
+def range_sorted(d: frozendict, bounds: list, /):
+    for lo, hi in bounds:
+        keys = sorted(d)
+        keys[bisect_left(keys, lo):bisect_right(keys, hi)]
+
+
+def range_index(d: frozendict, bounds: list, /):
+    for lo, hi in bounds:
+        list(d.sorted_keys().irange(lo, hi))
+
+
+def prefix_sorted(d: frozendict, prefixes: list, /):
+    for p in prefixes:
+        [k for k in sorted(d) if k.startswith(p)]
+
+
+def prefix_index(d: frozendict, prefixes: list, /):
+    for p in prefixes:
+        list(d.sorted_keys().prefix(p))
+
+
+implementations = [
+    ('range', 'sorting on every query', range_sorted),
+    ('range', '`sorted_keys`', range_index),
+    ('prefix', 'sorting on every query', prefix_sorted),
+    ('prefix', '`sorted_keys`', prefix_index),
+    ]
+
+
+def run_for_size(size: int, io: IO, /):
+    names = [f'key{i:08}' for i in range(size)]
+    bounds = [(names[i], names[min(i + QUERY_WIDTH, size - 1)]) for i in range(0, size, max(1, size // 100))]
+    # Every prefix matches 10 keys at most
+    prefixes = [name[:-1] for name in names[::max(10, size // 100)]]
+    queries = [1, 10, 100]
+
+    io.write(f'# {size:,} keys\n\n')
+    table = Table(
+        ['Query', 'Implementation', *(f'{m:,} queries, μs' for m in queries)],
+        [Alignment.LEFT, Alignment.LEFT, *(Alignment.RIGHT for _ in queries)],
+        io,
+        )
+
+    for query, descr, f in implementations:
+        args = bounds if query == 'range' else prefixes
+        row = [query, descr]
+        for m in queries:
+            chunk = (args * m)[:m]
+            # A new dictionary is created in every run to include building of the index
+            g = dict(f=f, frozendict=frozendict, source=dict.fromkeys(names, 0), chunk=chunk)
+            number = max(1, 100_000 // (size * m))
+            value = time_stmt('f(frozendict(source), chunk)', g, number=number)
+            row.append(format_summary(value, unit=1000))
+
+        table.append(row)
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/sorted-keys.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        for N in [100, 10_000, 1_000_000]:
+            run_for_size(N, f)
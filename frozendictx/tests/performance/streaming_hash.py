@@ -0,0 +1,81 @@
+"""
+Compares time and peak memory required to calculate hash value of a mapping
+via ``hash(frozenset(...))`` and via ``streaming_mapping_hash``.
+Peak memory is measured with ``tracemalloc`` in a separate run,
+it includes only memory allocated during the calculation.
+The last table compares times at sizes where streaming becomes faster,
+``STREAMING_HASH_THRESHOLD`` is chosen from it.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable, Mapping
+from typing import IO
+
+from frozendictx import streaming_mapping_hash
+from tests.performance.harness import SUMMARY_NOTE, format_summary, time_stmt
+from tests.performance.helper import *
+
+
+def frozenset_hash(m: Mapping, /) -> int:
+    return hash(frozenset(m.items()))
+
+
+implementations = [
+    ('`hash(frozenset(...))`', frozenset_hash),
+    ('`streaming_mapping_hash(...)`', streaming_mapping_hash),
+    ]
+
+
+def peak_memory(func: Callable[[Mapping], int], m: Mapping, /) -> int:
+    gc.collect()
+    tracemalloc.start()
+    func(m)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run_for_n_values(n: int, io: IO, /):
+    d = {f'{i}': i for i in range(1, n + 1)}
+    number = max(1, 100_000 // n)
+
+    io.write(f'# {n:,} items in dict\n\n')
+    table = Table(
+        ['Calculation way', 'Time required, μs', 'Peak memory, bytes'],
+        [Alignment.LEFT, Alignment.RIGHT, Alignment.RIGHT],
+        io,
+        )
+
+    for descr, func in implementations:
+        value = time_stmt('f(d)', dict(d=d, f=func), number=number)
+        table.append([descr, format_summary(value, unit=1000, digits=3), f'{peak_memory(func, d):,}'])
+
+    io.write('\n')
+
+
+def run_crossover(sizes: list[int], io: IO, /):
+    io.write('# Crossover\n\n')
+    table = Table(
+        ['Items', 'Frozenset, ms', 'Streaming, ms', 'Streaming / frozenset'],
+        [Alignment.RIGHT, Alignment.RIGHT, Alignment.RIGHT, Alignment.RIGHT],
+        io,
+        )
+
+    for n in sizes:
+        d = {f'{i}': i for i in range(1, n + 1)}
+        values = [time_stmt('f(d)', dict(d=d, f=func), number=1) for _, func in implementations]
+        ratio = values[1].median / values[0].median
+        table.append([f'{n:,}', *(format_summary(v, unit=1e6) for v in values), f'{ratio:.2f}'])
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/streaming-hash.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        for N in [10, 100, 1000, 10_000, 100_000, 1_000_000, 10_000_000]:
+            run_for_n_values(N, f)
+
+        run_crossover([100_000, 150_000, 200_000, 300_000, 400_000, 500_000, 700_000, 1_000_000], f)
@@ -0,0 +1,132 @@
+"""
+Measures scaling of read-only operations on ``frozendict`` across threads.
+Every thread performs the same amount of work, thus with perfect scaling
+wall time does not depend on the number of threads.
+Speedup is the throughput relative to one thread.
+First hashes are measured on new instances for every thread and every run,
+otherwise all runs but the first would read cached hash values.
+Instances hashed by all threads at once are hashed only once in total,
+thus the amount of work does not grow with the number of threads
+and speedup is not reported for them.
+
+Scaling is possible only on free-threaded builds of CPython (3.13t and later)
+on a machine with enough cores, otherwise GIL serializes threads and speedup stays about 1.
+"""
+
+import sys
+from os import cpu_count
+from threading import Barrier, Thread
+from time import perf_counter_ns
+from typing import IO
+
+from frozendictx import frozendict
+from tests.performance.harness import SUMMARY_NOTE, format_summary, summarize
+from tests.performance.helper import *
+
+SIZE = 1000
+OPERATIONS = 200_000
+
+
+def lookups(d: frozendict, keys: list, /):
+    for k in keys:
+        d[k]
+
+
+def cached_hashes(d: frozendict, keys: list, /):
+    for _ in keys:
+        hash(d)
+
+
+def first_hashes(instances: list[frozendict], keys: list, /):
+    for fd in instances:
+        hash(fd)
+
+
+def new_instances(source: dict, /) -> list[frozendict]:
+    return [frozendict(source) for _ in range(OPERATIONS // SIZE)]
+
+
+def shared(create, /):
+    # Returns a function which creates one argument for all threads
+    def create_shared(source: dict, n: int, /) -> list:
+        return [create(source)] * n
+
+    return create_shared
+
+
+def per_thread(create, /):
+    # Returns a function which creates a separate argument for every thread
+    def create_per_thread(source: dict, n: int, /) -> list:
+        return [create(source) for _ in range(n)]
+
+    return create_per_thread
+
+
+# Name, function, creation of arguments of threads, whether speedup is reported
+operations = [
+    ('lookup', lookups, shared(frozendict), True),
+    ('cached hash', cached_hashes, shared(frozendict), True),
+    ('first hash', first_hashes, per_thread(new_instances), True),
+    ('first hash of shared instances', first_hashes, shared(new_instances), False),
+    ]
+
+
+def run_threads(f, args: list, keys: list, /) -> int:
+    """Return wall time in nanoseconds for threads which call ``f(arg, keys)`` simultaneously, one per argument."""
+    n = len(args)
+    barrier = Barrier(n + 1)
+
+    def target(arg):
+        barrier.wait()
+        f(arg, keys)
+        barrier.wait()
+
+    threads = [Thread(target=target, args=(arg,)) for arg in args]
+    for t in threads:
+        t.start()
+
+    barrier.wait()
+    start = perf_counter_ns()
+    barrier.wait()
+    end = perf_counter_ns()
+    for t in threads:
+        t.join()
+
+    return end - start
+
+
+def run(io: IO, /):
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    io.write(f'# {SIZE:,} items, {OPERATIONS:,} operations per thread\n\n')
+    io.write(f'- **GIL enabled**: {gil}\n- **CPU count**: {cpu_count()}\n\n')
+
+    source = {f'key{i}': i for i in range(SIZE)}
+    keys = [f'key{i % SIZE}' for i in range(OPERATIONS)]
+    threads = [1, 2, 4, 8]
+    table = Table(
+        ['Operation', *(f'{n} threads, ms' for n in threads), *(f'{n} threads speedup' for n in threads[1:])],
+        [Alignment.LEFT, *(Alignment.RIGHT for _ in range(2 * len(threads) - 1))],
+        io,
+        )
+
+    for name, f, create, scales in operations:
+        summaries = []
+        for n in threads:
+            summaries.append(summarize([run_threads(f, create(source, n), keys) for _ in range(15)]))
+
+        if scales:
+            times = [s.median for s in summaries]
+            speedups = [f'{times[0] * n / t:.2f}' for n, t in zip(threads[1:], times[1:])]
+        else:
+            speedups = ['-'] * (len(threads) - 1)
+
+        table.append([name, *(format_summary(s, unit=1e6) for s in summaries), *speedups])
+
+    io.write('\n')
+
+
+if __name__ == '__main__':
+    with open('reports/threads.md', 'w') as f:
+        f.write(report_header())
+        f.write(SUMMARY_NOTE)
+        run(f)
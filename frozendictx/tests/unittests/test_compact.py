@@ -0,0 +1,134 @@
+import pickle
+from copy import deepcopy
+from unittest import TestCase
+
+from frozendictx import frozendict, mapping_hash
+from frozendictx._frozendict import COMPACT_MAX_SIZE, _compactfrozendict, _storage
+
+
+class Subclass(frozendict):
+    __slots__ = ()
+
+
+class EqualToAll:
+    # Breaks the rule that equal objects have equal hash values
+    def __eq__(self, other, /):
+        return True
+
+    __hash__ = object.__hash__
+
+
+class Compact(TestCase):
+    def setUp(self, /):
+        self.d = {'a': 1, 'b': (2,), 'c': None}
+        self.fd = frozendict(self.d)
+        self.large = frozendict.adopt(dict(self.d))
+
+    def test_storage(self, /):
+        """Tests if only small frozendict instances are stored in tuples"""
+        self.assertIs(_compactfrozendict, type(self.fd))
+        self.assertIs(_compactfrozendict, type(frozendict()))
+        self.assertIs(_compactfrozendict, type(frozendict.fromkeys(range(COMPACT_MAX_SIZE))))
+        self.assertIsNot(_compactfrozendict, type(frozendict.fromkeys(range(COMPACT_MAX_SIZE + 1))))
+        self.assertIsNot(_compactfrozendict, type(self.large))
+        self.assertIsNot(_compactfrozendict, type(Subclass(self.d)))
+        # Keys take the slot of FrozendictBase, items are never materialized as a dict
+        self.assertEqual(('__values',), _compactfrozendict.__slots__)
+        self.assertEqual(('a', 'b', 'c'), self.fd._FrozendictBase__source)
+        self.assertIs(self.fd, _storage(self.fd))
+
+    def test_transparent(self, /):
+        """Tests if a compact instance looks like other frozendict instances"""
+        self.assertIs(frozendict, self.fd.__class__)
+        self.assertIsInstance(self.fd, frozendict)
+        self.assertEqual(str(self.large), str(self.fd))
+        self.assertEqual('frozendict()', repr(frozendict()))
+        self.assertLess(self.fd.sizeof(), self.large.sizeof())
+        # type() reveals the storage
+        self.assertIsNot(frozendict, type(self.fd))
+
+    def test_lookup_by_equality(self, /):
+        """Tests if keys are matched by equality regardless of hash values unlike dict lookups"""
+        key = EqualToAll()
+        self.assertIn(key, self.fd)
+        self.assertEqual(1, self.fd[key])
+        self.assertNotIn(key, self.large)
+        self.assertIsNone(self.large.get(key))
+
+    def test_lookup(self, /):
+        """Tests if lookups behave like lookups in a dict"""
+        self.assertEqual((2,), self.fd['b'])
+        self.assertIsNone(self.fd['c'])
+        self.assertEqual(1, self.fd.get('a'))
+        self.assertEqual(0, self.fd.get('x', 0))
+        self.assertIn('a', self.fd)
+        self.assertNotIn('x', self.fd)
+        self.assertEqual(3, len(self.fd))
+        self.assertEqual(['a', 'b', 'c'], list(self.fd))
+        self.assertEqual(['c', 'b', 'a'], list(reversed(self.fd)))
+        with self.assertRaises(KeyError):
+            _ = self.fd['x']
+
+        for f in [self.fd.__getitem__, self.fd.get, self.fd.__contains__]:
+            with self.assertRaises(TypeError):
+                f([])
+
+    def test_views(self, /):
+        """Tests if views are equal to views of a dict"""
+        self.assertEqual(self.d.keys(), self.fd.keys())
+        self.assertEqual(self.d.items(), self.fd.items())
+        self.assertEqual(list(self.d.values()), list(self.fd.values()))
+        self.assertEqual({'a'}, self.fd.keys() & {'a', 'x'})
+        self.assertIn(('b', (2,)), self.fd.items())
+
+    def test_equality(self, /):
+        """Tests if equality and hash values do not depend on storage and order of items"""
+        reordered = frozendict(reversed(self.d.items()))
+        for other in [self.d, self.large, reordered, frozendict(self.d)]:
+            with self.subTest(other=other):
+                self.assertEqual(other, self.fd)
+                self.assertEqual(self.fd, other)
+
+        self.assertNotEqual(self.fd, self.fd | {'a': 2})
+        self.assertNotEqual(self.fd, frozendict(a=1))
+        self.assertEqual(hash(self.large), hash(self.fd))
+        self.assertEqual(hash(reordered), hash(self.fd))
+        self.assertEqual(mapping_hash(self.d), hash(self.fd))
+        self.assertIs(self.fd, frozendict.intern(self.fd))
+        self.assertIs(self.fd, frozendict.intern(self.large))
+        self.assertFalse(self.fd == list(self.d.items()))
+        unhashable = frozendict(a=[])
+        with self.assertRaisesRegex(TypeError, "unhashable type: 'list'"):
+            hash(unhashable)
+
+    def test_pickle(self, /):
+        """Tests if pickling and copying preserve items and the cached hash value"""
+        # Hash value of None is passed only since Python 3.12
+        fd = frozendict(a=1, b=(2,))
+        hash(fd)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            data = pickle.dumps(fd, protocol)
+            self.assertNotIn(b'_compactfrozendict', data)
+            unpickled = pickle.loads(data)
+            self.assertIs(_compactfrozendict, type(unpickled))
+            self.assertEqual(fd, unpickled)
+            self.assertEqual(hash(fd), unpickled._frozendict__hash)
+
+        self.assertIs(self.fd, deepcopy(self.fd))
+        mutable = frozendict(a=[1])
+        copied = deepcopy(mutable)
+        self.assertEqual(mutable, copied)
+        self.assertIsNot(mutable['a'], copied['a'])
+
+    def test_derived(self, /):
+        """Tests if merged and patched dictionaries get the right storage and hash value"""
+        hash(self.fd)
+        merged = self.fd | dict.fromkeys(range(COMPACT_MAX_SIZE))
+        self.assertIsNot(_compactfrozendict, type(merged))
+        self.assertEqual({**self.d, **dict.fromkeys(range(COMPACT_MAX_SIZE))}, merged)
+        self.assertEqual({'x': 0, **self.d}, {'x': 0} | self.fd)
+
+        result = self.fd.patch(self.fd.diff({'a': 2, 'b': (2,)}))
+        self.assertIs(_compactfrozendict, type(result))
+        self.assertEqual({'a': 2, 'b': (2,)}, result)
+        self.assertEqual(self.fd, self.large.patch(self.large.diff(self.fd)))
@@ -0,0 +1,109 @@
+import pickle
+from random import Random
+from unittest import TestCase
+
+from frozendictx import FrozendictDelta, frozendict, frozenmap, frozenoverlay
+
+
+class Delta(TestCase):
+    def setUp(self, /):
+        self.old = {'a': 1, 'b': 2, 'c': 3, 'd': [4]}
+        self.new = {'a': 1, 'b': 20, 'd': [4], 'e': 5}
+
+    def check(self, delta: FrozendictDelta, /):
+        self.assertEqual({'e': 5}, delta.added)
+        self.assertEqual({'b': 20}, delta.changed)
+        self.assertEqual(('c',), delta.removed)
+        self.assertEqual(3, len(delta))
+
+    def test_diff(self, /):
+        """Tests if diff finds added, changed and removed keys for all implementations"""
+        for cls in [frozendict, frozenmap, frozenoverlay]:
+            with self.subTest(cls=cls):
+                self.check(cls(self.old).diff(self.new))
+                self.check(cls(self.old).diff(cls(self.new)))
+
+    def test_empty(self, /):
+        """Tests if diff of equal dictionaries is empty and patch returns the same dictionary"""
+        fd = frozendict(self.old)
+        delta = fd.diff(frozendict(self.old))
+        self.assertFalse(delta)
+        self.assertEqual(FrozendictDelta(), delta)
+        self.assertIs(fd, fd.patch(delta))
+
+    def test_patch(self, /):
+        """Tests if patch of the old dictionary produces the new one for all implementations"""
+        for cls in [frozendict, frozenmap, frozenoverlay]:
+            with self.subTest(cls=cls):
+                old = cls(self.old)
+                result = old.patch(old.diff(self.new))
+                self.assertIsInstance(result, cls)
+                self.assertEqual(self.new, result)
+                self.assertEqual(self.old, old)
+
+    def test_patch_mismatch(self, /):
+        """Tests if a delta is not applied to a dictionary it was not made from"""
+        for cls in [frozendict, frozenmap]:
+            with self.subTest(cls=cls):
+                delta = cls(self.old).diff(self.new)
+                with self.assertRaises(ValueError):
+                    cls(self.new).patch(delta)
+
+                with self.assertRaises(ValueError):
+                    cls(a=1).patch(delta)
+
+    def test_apply_to(self, /):
+        """Tests if a delta changes a mutable mapping in place and rejects immutable ones"""
+        delta = frozendict(self.old).diff(self.new)
+        d = dict(self.old)
+        self.assertIsNone(delta.apply_to(d))
+        self.assertEqual(self.new, d)
+
+        added = FrozendictDelta({'e': 5})
+        for cls in [frozendict, frozenmap, frozenoverlay]:
+            with self.subTest(cls=cls):
+                with self.assertRaises(TypeError):
+                    added.apply_to(cls(self.old))
+
+    def test_pickle(self, /):
+        """Tests if a delta is pickled with changed items only"""
+        old = frozendict({i: i for i in range(10_000)})
+        delta = old.diff(old | {1: -1, -1: 1})
+        data = pickle.dumps(delta, pickle.HIGHEST_PROTOCOL)
+        self.assertLess(len(data), 200)
+        self.assertEqual(delta, pickle.loads(data))
+
+    def test_derived_hash(self, /):
+        """Tests if patch of a hashed frozendict derives the correct hash value"""
+        old = frozendict({str(i): i for i in range(100)})
+        hash(old)
+        new = old.patch(FrozendictDelta({'x': 1}, {'1': -1}, ['2', '3']))
+        self.assertIsNotNone(new._frozendict__hash)
+        self.assertEqual(hash(frozendict(new)), hash(new))
+
+    def test_frozenmap_structural(self, /):
+        """Tests if structural diff of frozenmap matches the diff of plain dictionaries"""
+        rnd = Random(0)
+        old = frozenmap({i: i for i in range(2000)})
+        # Colliding keys in the same slot of different levels
+        old = old.update({i * 2 ** 20: i for i in range(50)})
+        for _ in range(20):
+            new = old
+            for _ in range(rnd.randrange(1, 40)):
+                k = rnd.randrange(-100, 2100)
+                new = new.delete(k) if k in new and rnd.random() < 0.5 else new.set(k, rnd.randrange(3))
+
+            delta = old.diff(new)
+            self.assertEqual(frozendict(old).diff(dict(new)), delta)
+            self.assertEqual(new, old.patch(delta))
+            self.assertEqual(hash(frozenmap(new)), hash(old.patch(delta)))
+
+    def test_overlay_layers(self, /):
+        """Tests if diff of an overlay with added layers visits added layers only"""
+        base = frozenoverlay(self.old)
+        top = base | {'b': 20, 'e': 5} | {'a': 1}
+        delta = base.diff(top)
+        self.assertEqual({'e': 5}, delta.added)
+        self.assertEqual({'b': 20}, delta.changed)
+        self.assertEqual((), delta.removed)
+        self.assertEqual(top, base.patch(delta))
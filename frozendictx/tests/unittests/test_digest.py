@@ -0,0 +1,96 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+from frozendictx import frozendict, frozenmap, mapping_digest
+from frozendictx._frozendict import DIGEST_SIZE
+
+
+class Digest(TestCase):
+    def setUp(self, /):
+        self.d = {
+            'name': 'x',
+            'size': 10,
+            'ratio': 0.25,
+            'flags': (True, None, b'\x00'),
+            'inner': frozendict(a=1, b=frozenset({1, 2})),
+            }
+        self.fd = frozendict(self.d)
+
+    def test_value(self, /):
+        """Tests if digest has the expected size and is cached"""
+        digest = self.fd.digest()
+        self.assertIsInstance(digest, bytes)
+        self.assertEqual(DIGEST_SIZE, len(digest))
+        self.assertIs(digest, self.fd.digest())
+        self.assertEqual(digest, mapping_digest(self.d))
+
+    def test_nested(self, /):
+        """Tests if digests of nested dictionaries are calculated once and reused"""
+        self.fd.digest()
+        inner = self.fd['inner']
+        self.assertIsNotNone(inner._frozendict__digest)
+        self.assertEqual(self.fd.digest(), (self.fd | {'size': 10}).digest())
+
+    def test_equal(self, /):
+        """Tests if equal dictionaries have equal digests regardless of order and implementation"""
+        reordered = frozendict(reversed(self.d.items()))
+        large = frozendict.fromkeys(range(100), 0)
+        for a, b in [
+            (self.fd, reordered),
+            (self.fd, frozenmap(self.d)),
+            (frozendict(a=1), frozendict(a=1.0)),
+            (frozendict(a=1), frozendict(a=True)),
+            (frozendict(a=0), frozendict(a=-0.0)),
+            (frozendict(a=2), frozendict(a=2 + 0j)),
+            (large, frozendict(reversed(large.items()))),
+            ]:
+            with self.subTest(a=a, b=b):
+                self.assertEqual(a, b)
+                self.assertEqual(mapping_digest(a), mapping_digest(b))
+
+    def test_different(self, /):
+        """Tests if different dictionaries have different digests"""
+        dictionaries = [
+            frozendict(),
+            frozendict(a=''),
+            frozendict(a=None),
+            frozendict(a='1'),
+            frozendict(a=b'1'),
+            frozendict(a=1),
+            frozendict(a=1.5),
+            frozendict(a=2 ** 100),
+            frozendict(a=-1),
+            frozendict(a=(1,)),
+            frozendict(a=((1,),)),
+            frozendict(a=frozenset({1})),
+            frozendict(a=frozendict(b=1)),
+            frozendict(a=(), b=()),
+            frozendict(ab=()),
+            frozendict(a=('b', 'c')),
+            frozendict(a=('bc',)),
+            ]
+        digests = {d.digest() for d in dictionaries}
+        self.assertEqual(len(dictionaries), len(digests))
+
+    def test_unsupported(self, /):
+        """Tests if digest of a dictionary with a mutable or unknown value raises TypeError"""
+        for value in [[1], {1: 2}, {1}, object()]:
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    frozendict(a=value).digest()
+
+    def test_processes(self, /):
+        """Tests if digest does not depend on the hash seed"""
+        code = (
+            'from frozendictx import frozendict;'
+            "print(frozendict({str(i): (i, str(i)) for i in range(20)}).digest().hex())"
+        )
+        digests = set()
+        for seed in ['1', '2', 'random']:
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+            digests.add(result.stdout.strip())
+
+        self.assertEqual({frozendict({str(i): (i, str(i)) for i in range(20)}).digest().hex()}, digests)
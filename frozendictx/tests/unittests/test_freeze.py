@@ -0,0 +1,78 @@
+from collections import namedtuple
+from copy import deepcopy
+from unittest import TestCase
+
+from frozendictx import freeze, frozendict, frozenmap, thaw
+
+P = namedtuple('P', 'x y')
+
+
+class Freeze(TestCase):
+    def setUp(self, /):
+        self.shared = {'x': [1, 2]}
+        self.doc = {
+            'name': 'doc',
+            'tags': ['a', 'b'],
+            'ids': {1, 2},
+            'items': [self.shared, self.shared, ({'y': None},)],
+            }
+
+    def test_freeze(self, /):
+        """Tests if nested containers are converted into immutable ones"""
+        frozen = freeze(self.doc)
+        self.assertIs(frozendict, frozen.__class__)
+        self.assertEqual(('a', 'b'), frozen['tags'])
+        self.assertEqual(frozenset({1, 2}), frozen['ids'])
+        self.assertEqual(frozendict(x=(1, 2)), frozen['items'][0])
+        self.assertEqual((frozendict(y=None),), frozen['items'][2])
+        self.assertIsInstance(hash(frozen), int)
+
+    def test_shared(self, /):
+        """Tests if shared substructures stay shared"""
+        frozen = freeze(self.doc)
+        self.assertIs(frozen['items'][0], frozen['items'][1])
+
+        thawed = thaw(frozen)
+        self.assertIs(thawed['items'][0], thawed['items'][1])
+
+    def test_cycle(self, /):
+        """Tests if cyclic structures are rejected"""
+        cyclic = [1]
+        cyclic.append({'self': cyclic})
+        self.assertRaises(ValueError, freeze, cyclic)
+
+    def test_keep_immutable(self, /):
+        """Tests if immutable containers are kept when nothing is converted"""
+        d = frozendict(a=(1, 2), b='b')
+        self.assertIs(d, freeze(d))
+
+        m = frozenmap(a=1)
+        self.assertIs(m, freeze(m))
+
+        t = (1, 'a', d)
+        self.assertIs(t, freeze(t))
+
+    def test_namedtuple(self, /):
+        """Tests if named tuples keep their class"""
+        p = P(1, 2)
+        self.assertIs(p, freeze({'q': p})['q'])
+
+        frozen = freeze(P([1], {'a': 2}))
+        self.assertIs(P, frozen.__class__)
+        self.assertEqual(P((1,), frozendict(a=2)), frozen)
+
+    def test_cached_hash(self, /):
+        """Tests if hash values are calculated during freezing"""
+        frozen = freeze(self.doc)
+        self.assertIsInstance(frozen._frozendict__hash, int)
+        self.assertIsInstance(frozen['items'][0]._frozendict__hash, int)
+        self.assertIs(frozen, deepcopy(frozen))
+
+        unhashable = freeze({'a': bytearray()})
+        self.assertRaises(TypeError, hash, unhashable)
+
+    def test_thaw(self, /):
+        """Tests if thaw reverts freeze"""
+        doc = dict(self.doc, items=[self.shared, self.shared, [{'y': None}]])
+        self.assertEqual(doc, thaw(freeze(doc)))
+        self.assertIs(dict, thaw(frozenmap(a=1)).__class__)
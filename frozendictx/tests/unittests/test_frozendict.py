@@ -1,7 +1,23 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from threading import Barrier
 from unittest import TestCase
 
-from frozendictx import frozendict
+from frozendictx import FrozendictBase, frozendict, frozenmap
+from frozendictx._intern import InternPool
+
+
+class Initialized(frozendict):
+    # Counts calls of __new__ and sets an attribute in __init__
+    new_calls = 0
+
+    def __new__(cls, iterable = (), /, **kwargs):
+        Initialized.new_calls += 1
+        return super().__new__(cls, iterable, **kwargs)
+
+    def __init__(self, iterable = (), /, **kwargs):
+        self.initialized = True
 
 
 class Deepcopy(TestCase):
@@ -58,3 +74,182 @@ class Hash(TestCase):
 
         value = self.try_hash(fd)
         self.assertEqual('list', value, f'Current hash: {value!r}')
+
+
+class Threads(TestCase):
+    N = 8
+
+    def run_simultaneously(self, f, /) -> list:
+        barrier = Barrier(self.N)
+
+        def target():
+            barrier.wait()
+            return f()
+
+        with ThreadPoolExecutor(self.N) as executor:
+            futures = [executor.submit(target) for _ in range(self.N)]
+            return [future.result() for future in futures]
+
+    def test_hash(self, /):
+        """Tests if concurrent first hashing of the same instance gives the same value"""
+        for _ in range(20):
+            source = {str(i): i for i in range(10_000)}
+            fd = frozendict(source)
+            self.assertEqual([hash(frozendict(source))] * self.N, self.run_simultaneously(fd.__hash__))
+
+    def test_intern(self, /):
+        """Tests if concurrent interning of equal dictionaries gives the same instance and counts every call"""
+        pool = InternPool()
+        for i in range(20):
+            d = {'thread': i}
+            results = self.run_simultaneously(lambda: [pool.intern(frozendict(d)) for _ in range(100)])
+            first = results[0][0]
+            self.assertTrue(all(r is first for rs in results for r in rs))
+
+        stats = pool.stats()
+        self.assertEqual(20 * 100 * self.N, stats.hits + stats.misses)
+        self.assertEqual(20, stats.misses)
+        del first, results
+        self.assertEqual(0, len(pool))
+
+    def test_deepcopy(self, /):
+        """Tests if concurrent deepcopy returns the same instance or copies"""
+        fd = frozendict({str(i): i for i in range(10_000)})
+        self.assertTrue(all(r is fd for r in self.run_simultaneously(lambda: deepcopy(fd))))
+
+        fd = frozendict({str(i): [i] for i in range(100)})
+        results = self.run_simultaneously(lambda: deepcopy(fd))
+        self.assertTrue(all(r is not fd and r == fd for r in results))
+
+
+class DerivedHash(TestCase):
+    def test_or(self, /):
+        """Tests if hash value of a dictionary derived via | from a hashed one is cached and correct"""
+        fd = frozendict((str(i), i) for i in range(100))
+        hash(fd)
+
+        for other in [{'1': -1}, {'-1': -1}, {'1': 1}]:
+            result = fd | other
+            self.assertIsNot(result._frozendict__hash, None)
+            self.assertEqual(hash(frozenset(result.items())), result._frozendict__hash)
+
+    def test_ror(self, /):
+        """Tests if hash value of a dictionary derived via reversed | from a hashed one is cached and correct"""
+        fd = frozendict((str(i), i) for i in range(100))
+        hash(fd)
+
+        result = {'1': -1, '-1': -1} | fd
+        self.assertIsNot(result._frozendict__hash, None)
+        self.assertEqual(hash(frozenset(result.items())), result._frozendict__hash)
+
+    def test_unhashable(self, /):
+        """Tests if hash value is not derived when other mapping is unhashable"""
+        fd = frozendict((str(i), i) for i in range(100))
+        hash(fd)
+
+        result = fd | {'1': [1]}
+        self.assertIs(result._frozendict__hash, None)
+        self.assertRaises(TypeError, hash, result)
+
+
+class Intern(TestCase):
+    def test_intern(self, /):
+        """Tests if equal dictionaries are collapsed into one instance"""
+        fd = frozendict.intern({'one': 1, 'two': 2})
+
+        self.assertIs(fd, frozendict.intern(frozendict(two=2, one=1)))
+        self.assertIs(fd, frozendict.interned([('one', 1)], two=2))
+        self.assertIsNot(fd, frozendict.intern({'one': 1}))
+
+    def test_stats(self, /):
+        """Tests if statistics of the pool are updated"""
+        before = frozendict.intern_stats()
+        fd = frozendict.intern({'intern': 'stats'})
+        frozendict.intern({'intern': 'stats'})
+        after = frozendict.intern_stats()
+
+        self.assertEqual(before.misses + 1, after.misses)
+        self.assertEqual(before.hits + 1, after.hits)
+        self.assertEqual(before.size + 1, after.size)
+        self.assertEqual(before.bytes_saved + fd.sizeof(), after.bytes_saved)
+
+        del fd
+        self.assertEqual(after.size - 1, frozendict.intern_stats().size)
+
+    def test_unhashable(self, /):
+        """Tests if unhashable dictionaries cannot be interned"""
+        self.assertRaises(TypeError, frozendict.intern, {'one': [1]})
+
+
+class Equality(TestCase):
+    def test_hashed(self, /):
+        """Tests equality of hashed dictionaries"""
+        fd1 = frozendict(one=1, two=2)
+        fd2 = frozendict(two=2, one=1)
+        fd3 = frozendict(one=1)
+        for fd in (fd1, fd2, fd3):
+            hash(fd)
+
+        self.assertEqual(fd1, fd2)
+        self.assertNotEqual(fd1, fd3)
+        self.assertFalse(fd1 != fd2)
+        self.assertFalse(fd1 == fd3)
+
+
+class Constructors(TestCase):
+    def test_adopt(self, /):
+        """Tests if adopted dict is used without copying"""
+        d = {'a': 1}
+        fd = frozendict.adopt(d)
+        self.assertEqual(d, fd)
+        self.assertIs(d, fd._FrozendictBase__source)
+        self.assertIs(d, FrozendictBase.adopt(d)._FrozendictBase__source)
+        self.assertEqual(hash(frozendict(d)), hash(fd))
+
+    def test_fromkeys(self, /):
+        """Tests if fromkeys creates the same dictionaries as dict.fromkeys"""
+        self.assertEqual(dict.fromkeys(range(5), 0), frozendict.fromkeys(range(5), 0))
+        self.assertIs(frozendict, frozendict.fromkeys('ab').__class__)
+        self.assertEqual(dict.fromkeys('ab'), frozenmap.fromkeys('ab'))
+        self.assertIs(frozenmap, frozenmap.fromkeys('ab').__class__)
+
+    def test_merged(self, /):
+        """Tests if merged is equal to a chain of unions"""
+        a = frozendict(a=1, b=2)
+        b = {'b': 3, 'c': 4}
+        c = frozenmap(c=5)
+        self.assertEqual(a | b | c, frozendict.merged(a, b, c))
+        self.assertEqual({}, frozendict.merged())
+        self.assertIs(frozenmap, frozenmap.merged(a, b).__class__)
+
+    def test_or(self, /):
+        """Tests if union works with dict, frozendict and other mappings"""
+        a = frozendict(a=1, b=2)
+        self.assertEqual({'a': 1, 'b': 3}, a | frozendict(b=3))
+        self.assertEqual({'a': 1, 'b': 2, 'c': 3}, a | frozenmap(c=3))
+        self.assertEqual({'b': 2, 'c': 3, 'a': 1}, {'b': 0, 'c': 3} | a)
+        self.assertEqual(['b', 'c', 'a'], list({'b': 0, 'c': 3} | a))
+
+    def test_pickle(self, /):
+        """Tests if unpickled dictionary is equal to the original one"""
+        fd = frozendict(a=1, b=(2, 3))
+        hash(fd)
+        unpickled = pickle.loads(pickle.dumps(fd))
+        self.assertIs(frozendict, unpickled.__class__)
+        self.assertEqual(fd, unpickled)
+        self.assertEqual(hash(fd), hash(unpickled))
+
+    def test_subclass(self, /):
+        """Tests if results of operations on subclasses are created via their constructors"""
+        a = Initialized(a=1)
+        b = {'b': 2}
+        results = a | b, b | a, a.patch(a.diff(b)), Initialized.fromkeys('ab'), Initialized.merged(a, b)
+        for result in results:
+            self.assertIs(Initialized, result.__class__)
+            self.assertTrue(result.initialized)
+
+        calls = Initialized.new_calls
+        unpickled = pickle.loads(pickle.dumps(a))
+        self.assertEqual(calls + 1, Initialized.new_calls)
+        self.assertIs(Initialized, unpickled.__class__)
+        self.assertEqual(a, unpickled)
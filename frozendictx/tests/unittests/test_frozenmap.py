@@ -0,0 +1,115 @@
+import pickle
+from copy import deepcopy
+from random import Random
+from unittest import TestCase
+
+from frozendictx import frozendict, frozenmap
+
+
+class Colliding:
+    """Key with a lot of hash collisions"""
+    __slots__ = 'value',
+
+    def __init__(self, value: int, /):
+        self.value = value
+
+    def __hash__(self, /):
+        return self.value % 7
+
+    def __eq__(self, other, /):
+        return isinstance(other, Colliding) and self.value == other.value
+
+
+class Derivation(TestCase):
+    def test_set(self, /):
+        """Tests if set returns a new instance and keeps the original one untouched"""
+        fm = frozenmap(one=1, two=2)
+        fm2 = fm.set('three', 3)
+
+        self.assertEqual({'one': 1, 'two': 2}, fm)
+        self.assertEqual({'one': 1, 'two': 2, 'three': 3}, fm2)
+        self.assertIs(fm, fm.set('one', 1))
+
+    def test_delete(self, /):
+        """Tests if delete returns a new instance and raises KeyError on absent keys"""
+        fm = frozenmap(one=1, two=2)
+
+        self.assertEqual({'two': 2}, fm.delete('one'))
+        self.assertEqual({'one': 1, 'two': 2}, fm)
+        self.assertRaises(KeyError, fm.delete, 'three')
+
+    def test_update(self, /):
+        """Tests if update and union operators work like dict counterparts"""
+        fm = frozenmap(one=1, two=2)
+
+        self.assertEqual({'one': 1, 'two': 22, 'three': 3}, fm.update([('two', 22)], three=3))
+        self.assertEqual({'one': 1, 'two': 22}, fm | {'two': 22})
+        self.assertEqual({'one': 1, 'two': 2, 'three': 3}, {'two': 22, 'three': 3} | fm)
+        self.assertIsInstance({} | fm, frozenmap)
+
+    def test_random(self, /):
+        """Tests derivations against dict on random operations including hash collisions"""
+        rnd = Random(0)
+        d = {}
+        fm = frozenmap()
+        snapshots = []
+        for i in range(3000):
+            key = rnd.choice([rnd.randrange(500), Colliding(rnd.randrange(100)), str(rnd.randrange(100))])
+            if rnd.random() < 0.6:
+                d[key] = i
+                fm = fm.set(key, i)
+            elif key in d:
+                del d[key]
+                fm = fm.delete(key)
+
+            if i % 100 == 0:
+                snapshots.append((d.copy(), fm))
+
+        for d, fm in snapshots:
+            self.assertEqual(len(d), len(fm))
+            self.assertEqual(d, dict(fm.items()))
+            self.assertEqual(fm, d)
+
+
+class Contract(TestCase):
+    def test_equality(self, /):
+        """Tests if frozenmap is equal to dict and frozendict with the same items"""
+        d = dict(one=1, two=2, three=3)
+        fm = frozenmap(d)
+
+        self.assertEqual(d, fm)
+        self.assertEqual(fm, frozendict(d))
+        self.assertEqual(frozendict(d), fm)
+        self.assertNotEqual(fm, frozenmap(one=1))
+
+    def test_hash(self, /):
+        """Tests if frozenmap has the same hash value as frozendict with the same items"""
+        d = dict(one=1, two=2, three=3)
+
+        self.assertEqual(hash(frozendict(d)), hash(frozenmap(d)))
+        self.assertRaises(TypeError, hash, frozenmap(one=[1]))
+
+    def test_deepcopy(self, /):
+        """Tests if hashable frozenmap instance returns itself on deepcopy"""
+        fm = frozenmap(one=1)
+        fm_unhashable = frozenmap(one=[1])
+
+        self.assertIs(fm, deepcopy(fm))
+        self.assertIsNot(fm_unhashable, deepcopy(fm_unhashable))
+
+    def test_pickle(self, /):
+        """Tests if frozenmap survives pickling"""
+        fm = frozenmap((i, str(i)) for i in range(1000))
+
+        self.assertEqual(fm, pickle.loads(pickle.dumps(fm)))
+
+
+class DerivedHash(TestCase):
+    def test_derivations(self, /):
+        """Tests if hash value of derived frozenmap instances is cached and correct"""
+        fm = frozenmap((str(i), i) for i in range(100))
+        hash(fm)
+
+        for result in [fm.set('1', -1), fm.set('-1', -1), fm.delete('1'), fm | {'1': -1, '-1': -1}]:
+            self.assertIsNot(result._frozenmap__hash, None)
+            self.assertEqual(hash(frozenset(result.items())), result._frozenmap__hash)
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from frozendictx import mapping_hash
+from frozendictx import mapping_hash, streaming_mapping_hash
 
 
 class MappingHash(TestCase):
@@ -52,3 +52,20 @@ class MappingHash(TestCase):
 
         value = mapping_hash(d)
         self.assertEqual(value, 5003416146848621781, f'Current hash: {value!r}')
+
+
+class StreamingMappingHash(TestCase):
+    def test_compatibility(self, /):
+        """Checks if streaming hash value is equal to hash value of frozenset of items"""
+        for n in [0, 1, 5, 10, 100, 1000]:
+            for d in [
+                {f'{i}': i for i in range(n)},
+                {i: -i for i in range(n)},
+                {-i: (f'{i}', i) for i in range(n)},
+                ]:
+                with self.subTest(n=n, d=d):
+                    self.assertEqual(hash(frozenset(d.items())), streaming_mapping_hash(d))
+
+    def test_unhashable(self, /):
+        """Checks if streaming hash raises TypeError for unhashable values"""
+        self.assertRaises(TypeError, streaming_mapping_hash, {'one': [1]})
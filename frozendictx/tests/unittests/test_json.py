@@ -0,0 +1,74 @@
+import io
+import json
+from unittest import TestCase
+
+from frozendictx import frozendict, frozenmap, iter_ndjson, load_json, loads_json
+from frozendictx._json import _Builder
+
+
+class Json(TestCase):
+    document = {
+        'name': 'config',
+        'items': [{'id': 1, 'tags': ['a', 'b']}, {'id': 1, 'tags': ['a', 'b']}, [[1, 2], [1, 2]]],
+        'flags': {'on': True, 'ratio': 1.0, 'count': 1, 'none': None},
+        }
+
+    def test_loads(self, /):
+        """Tests if objects are decoded as frozendict and arrays as tuples"""
+        result = loads_json(json.dumps(self.document))
+        self.assertIsInstance(result, frozendict)
+        self.assertIsInstance(result['items'], tuple)
+        self.assertIsInstance(result['items'][0], frozendict)
+        self.assertIsInstance(result['items'][0]['tags'], tuple)
+        self.assertEqual(self.document['flags'], result['flags'])
+        self.assertEqual(((1, 2), (1, 2)), result['items'][2])
+        self.assertEqual((1, 2), loads_json('[1, 2]'))
+        self.assertEqual(1, loads_json(b'1'))
+
+    def test_intern(self, /):
+        """Tests if equal sub-objects are shared and values of different types are not"""
+        result = loads_json(json.dumps(self.document))
+        self.assertIs(result['items'][0], result['items'][1])
+        self.assertIs(result['items'][2][0], result['items'][2][1])
+
+        result = loads_json('[{"a": 1}, {"a": true}, {"a": 1.0}, [1], [true]]')
+        self.assertIs(result[0]['a'].__class__, int)
+        self.assertIs(result[1]['a'].__class__, bool)
+        self.assertIs(result[2]['a'].__class__, float)
+        self.assertIs(result[4][0].__class__, bool)
+
+        result = loads_json('[[0.0], [-0.0], {"a": 0.0}, {"a": -0.0}, [0.0]]')
+        self.assertEqual(['0.0', '-0.0'], [repr(v[0]) for v in result[:2]])
+        self.assertEqual(['0.0', '-0.0'], [repr(v['a']) for v in result[2:4]])
+        self.assertIs(result[0], result[4])
+
+        result = loads_json(json.dumps(self.document), intern=False)
+        self.assertIsNot(result['items'][0], result['items'][1])
+
+    def test_cls(self, /):
+        """Tests if objects are created as instances of the given class"""
+        result = load_json(io.StringIO(json.dumps(self.document)), frozenmap)
+        self.assertIsInstance(result, frozenmap)
+        self.assertIsInstance(result['flags'], frozenmap)
+
+    def test_ndjson(self, /):
+        """Tests if documents are decoded line by line and shared across lines"""
+        lines = b'{"a": [1, 2], "b": {"c": "d"}}\n\n[1, 2]\n{"b": {"c": "d"}}\n'
+        results = list(iter_ndjson(io.BytesIO(lines)))
+        self.assertEqual(3, len(results))
+        self.assertIs(results[0]['a'], results[1])
+        self.assertIs(results[0]['b'], results[2]['b'])
+        keys = list(results[0])
+        self.assertIs(keys[1], next(iter(results[2])))
+
+    def test_ndjson_bounded(self, /):
+        """Tests if the number of remembered keys and sub-objects does not exceed the limit"""
+        builder = _Builder(frozendict, True, 10)
+        decode = builder.decoder().decode
+        for i in range(100):
+            self.assertEqual({f'k{i}': (i,)}, builder.result(decode(f'{{"k{i}": [{i}]}}')))
+            self.assertLessEqual(len(builder.keys), 10)
+            self.assertLessEqual(len(builder.objects), 10)
+
+        results = list(iter_ndjson([f'{{"k{i}": [{i}]}}' for i in range(100)], max_interned=10))
+        self.assertEqual({'k99': (99,)}, results[-1])
@@ -0,0 +1,120 @@
+import os
+import pickle
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from frozendictx import MappedFrozendictWriter, frozendict, mappedfrozendict
+
+
+class Mapped(TestCase):
+    def setUp(self, /):
+        self.dir = TemporaryDirectory()
+        self.d = {'one': 1, 2: 'two', 3.5: b'three', None: None, b'four': 4.5, 'five': [5], 'six': (6, '6')}
+        self.mapped = mappedfrozendict.write(self.path('d'), self.d)
+
+    def tearDown(self, /):
+        self.mapped.close()
+        self.dir.cleanup()
+
+    def path(self, name: str, /) -> str:
+        return os.path.join(self.dir.name, name)
+
+    def test_mapping(self, /):
+        """Tests mapping methods against dict"""
+        self.assertEqual(list(self.d), list(self.mapped))
+        self.assertEqual(list(self.d.values()), list(self.mapped.values()))
+        self.assertEqual(list(self.d.items()), list(self.mapped.items()))
+        self.assertEqual(list(reversed(self.d)), list(reversed(self.mapped)))
+        self.assertEqual(len(self.d), len(self.mapped))
+        for k, v in self.d.items():
+            self.assertEqual(v, self.mapped[k])
+
+        self.assertIsNone(self.mapped.get('seven'))
+        self.assertRaises(KeyError, self.mapped.__getitem__, 'seven')
+        self.assertRaises(TypeError, self.mapped.__getitem__, ['seven'])
+
+    def test_writer(self, /):
+        """Tests if writer streams items and produces the same dictionary"""
+        with MappedFrozendictWriter(self.path('w')) as writer:
+            for k, v in self.d.items():
+                writer.add(k, v)
+
+        mapped = mappedfrozendict(self.path('w'))
+        try:
+            self.assertEqual(self.mapped, mapped)
+        finally:
+            mapped.close()
+
+        empty = mappedfrozendict.write(self.path('e'))
+        try:
+            self.assertEqual({}, empty)
+            self.assertNotIn('one', empty)
+        finally:
+            empty.close()
+
+    def test_duplicate_keys(self, /):
+        """Tests if duplicate keys are rejected and the file is removed"""
+        self.assertRaises(ValueError, mappedfrozendict.write, self.path('x'), [(1, 'one'), (1.0, 'two')])
+        self.assertFalse(os.path.exists(self.path('x')))
+
+    def test_unfinished(self, /):
+        """Tests if an unfinished file cannot be opened"""
+        writer = MappedFrozendictWriter(self.path('u'))
+        writer.add('one', 1)
+        self.assertRaises(ValueError, mappedfrozendict, self.path('u'))
+        writer.discard()
+        self.assertFalse(os.path.exists(self.path('u')))
+
+    def test_unsupported_keys(self, /):
+        """Tests if keys of unsupported types are rejected"""
+        self.assertRaises(TypeError, mappedfrozendict.write, self.path('t'), {(1, 2): 'tuple'})
+
+    def test_equality(self, /):
+        """Tests if mapped dictionary is equal to dict and frozendict with the same items"""
+        self.assertEqual(self.d, self.mapped)
+        self.assertEqual(frozendict(self.d), self.mapped)
+        self.assertEqual(self.mapped, frozendict(self.d))
+
+    def test_hash(self, /):
+        """Tests if mapped dictionary has the same hash value as frozendict with the same items"""
+        d = {'one': 1, 'two': 2}
+        mapped = mappedfrozendict.write(self.path('h'), d)
+        try:
+            self.assertEqual(hash(frozendict(d)), hash(mapped))
+            self.assertRaises(TypeError, hash, self.mapped)
+        finally:
+            mapped.close()
+
+    def test_pickle(self, /):
+        """Tests if unpickled instances open the same file"""
+        unpickled = pickle.loads(pickle.dumps(self.mapped))
+        try:
+            self.assertEqual(self.mapped.path, unpickled.path)
+            self.assertEqual(self.mapped, unpickled)
+        finally:
+            unpickled.close()
+
+    def test_pickle_relative(self, /):
+        """Tests if instances opened via a relative path are unpickled in another working directory"""
+        cwd = os.getcwd()
+        os.chdir(self.dir.name)
+        try:
+            mapped = mappedfrozendict('d')
+        finally:
+            os.chdir(cwd)
+
+        try:
+            data = pickle.dumps(mapped)
+            os.chdir(os.path.dirname(self.dir.name))
+            try:
+                unpickled = pickle.loads(data)
+            finally:
+                os.chdir(cwd)
+
+            try:
+                self.assertEqual(os.path.abspath(self.path('d')), unpickled.path)
+                self.assertEqual(self.mapped, unpickled)
+            finally:
+                unpickled.close()
+        finally:
+            mapped.close()
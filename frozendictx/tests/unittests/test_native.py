@@ -0,0 +1,77 @@
+import pickle
+from copy import copy, deepcopy
+from unittest import TestCase
+
+from frozendictx import freeze, frozendict, frozenoverlay, nativefrozendict, thaw
+
+
+class Native(TestCase):
+    def setUp(self, /):
+        self.d = {'a': 1, 'b': (2, 3)}
+        self.nd = nativefrozendict(self.d)
+
+    def test_mapping(self, /):
+        """Tests if reads are the same as for dict"""
+        self.assertIsInstance(self.nd, dict)
+        self.assertEqual(self.d, self.nd)
+        self.assertEqual(list(self.d.items()), list(self.nd.items()))
+        self.assertEqual(1, self.nd['a'])
+        self.assertIn('b', self.nd)
+
+    def test_immutable(self, /):
+        """Tests if mutators are blocked"""
+        with self.assertRaises(TypeError):
+            self.nd['c'] = 3
+
+        with self.assertRaises(TypeError):
+            del self.nd['a']
+
+        for name in ['clear', 'pop', 'popitem', 'setdefault', 'update']:
+            self.assertFalse(hasattr(self.nd, name), name)
+
+        self.nd.__init__(c=3)
+        self.assertEqual(self.d, self.nd)
+
+        nd = self.nd
+        nd |= {'c': 3}
+        self.assertIsNot(self.nd, nd)
+        self.assertEqual(self.d, self.nd)
+
+    def test_constructors(self, /):
+        """Tests if constructors return instances of the class"""
+        self.assertIs(nativefrozendict, nativefrozendict.fromkeys('ab').__class__)
+        self.assertEqual(dict.fromkeys('ab', 0), nativefrozendict.fromkeys('ab', 0))
+        self.assertEqual(self.d | {'a': 0}, nativefrozendict.merged(self.d, {'a': 0}))
+
+    def test_or(self, /):
+        """Tests if union returns an instance of the class"""
+        result = self.nd | {'c': 3}
+        self.assertIs(nativefrozendict, result.__class__)
+        self.assertEqual(self.d | {'c': 3}, result)
+
+        result = {'a': 0, 'c': 3} | self.nd
+        self.assertIs(nativefrozendict, result.__class__)
+        self.assertEqual({'a': 1, 'c': 3, 'b': (2, 3)}, result)
+
+    def test_hash(self, /):
+        """Tests if hash value is the same as of frozendict"""
+        self.assertEqual(hash(frozendict(self.d)), hash(self.nd))
+        self.assertEqual(frozendict(self.d), self.nd)
+        self.assertRaises(TypeError, hash, nativefrozendict(a=[]))
+
+    def test_copy(self, /):
+        """Tests copy and pickle semantics"""
+        self.assertIs(self.nd, copy(self.nd))
+        self.assertIs(self.nd, deepcopy(self.nd))
+        nd = nativefrozendict(a=[])
+        self.assertIsNot(nd['a'], deepcopy(nd)['a'])
+
+        unpickled = pickle.loads(pickle.dumps(self.nd))
+        self.assertIs(nativefrozendict, unpickled.__class__)
+        self.assertEqual(self.nd, unpickled)
+
+    def test_integration(self, /):
+        """Tests if other utilities treat the class as immutable"""
+        self.assertIs(self.nd, freeze(self.nd))
+        self.assertIs(dict, thaw(self.nd).__class__)
+        self.assertIs(self.nd, frozenoverlay(self.nd, {'c': 3}).layers[0])
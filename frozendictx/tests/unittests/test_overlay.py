@@ -0,0 +1,86 @@
+import pickle
+from copy import deepcopy
+from unittest import TestCase
+
+from frozendictx import frozendict, frozenmap, frozenoverlay
+from frozendictx._overlay import OVERLAY_MAX_DEPTH
+
+
+class Overlay(TestCase):
+    def setUp(self, /):
+        self.defaults = frozendict(a=1, b=2, c=3)
+        self.tenant = {'b': 20, 'd': 40}
+        self.user = frozenmap(c=300)
+        self.overlay = frozenoverlay(self.defaults, self.tenant, self.user)
+        self.flat = self.defaults | self.tenant | self.user
+
+    def test_mapping(self, /):
+        """Tests mapping methods against the flat frozendict"""
+        self.assertEqual(self.flat['b'], self.overlay['b'])
+        self.assertEqual(self.flat['c'], self.overlay['c'])
+        self.assertIsNone(self.overlay.get('e'))
+        self.assertRaises(KeyError, self.overlay.__getitem__, 'e')
+        self.assertIn('d', self.overlay)
+        self.assertEqual(list(self.flat.items()), list(self.overlay.items()))
+        self.assertEqual(list(reversed(self.flat)), list(reversed(self.overlay)))
+        self.assertEqual(len(self.flat), len(self.overlay))
+
+    def test_layers(self, /):
+        """Tests if immutable layers are referenced and mutable ones are copied"""
+        self.assertEqual(3, self.overlay.depth)
+        self.assertIs(self.user, self.overlay.layers[2])
+
+        self.tenant['d'] = 0
+        self.assertEqual(40, self.overlay['d'])
+
+    def test_or(self, /):
+        """Tests if union adds layers"""
+        result = self.overlay | {'a': 10}
+        self.assertIs(frozenoverlay, result.__class__)
+        self.assertEqual(4, result.depth)
+        self.assertEqual(self.flat | {'a': 10}, result)
+
+        result = {'e': 5, 'a': 10} | self.overlay
+        self.assertEqual(4, result.depth)
+        self.assertEqual({'e': 5, 'a': 10} | dict(self.flat), result)
+
+    def test_flatten_depth(self, /):
+        """Tests if overlay is flattened when it becomes too deep"""
+        result = self.overlay
+        n = OVERLAY_MAX_DEPTH - self.overlay.depth
+        for i in range(n):
+            result = result | {i: i}
+
+        self.assertEqual(OVERLAY_MAX_DEPTH, result.depth)
+        result = result | {n: n}
+        self.assertEqual(1, result.depth)
+        self.assertEqual(self.flat | {i: i for i in range(n + 1)}, result)
+
+    def test_flatten_lookups(self, /):
+        """Tests if overlay is flattened when lookups cost more than merging"""
+        overlay = frozenoverlay({i: i for i in range(10)}, {'a': 1}, {'b': 1})
+        for _ in range(5):
+            self.assertEqual(0, overlay[0])
+
+        self.assertEqual(3, overlay.depth)
+        for _ in range(5):
+            self.assertEqual(0, overlay[0])
+
+        self.assertEqual(1, overlay.depth)
+
+    def test_equality(self, /):
+        """Tests if overlay is equal to the flat frozendict"""
+        self.assertEqual(self.flat, self.overlay)
+        self.assertEqual(self.overlay, self.flat)
+        self.assertEqual(dict(self.flat), self.overlay)
+        self.assertNotEqual(self.overlay, self.flat | {'a': 0})
+
+    def test_hash(self, /):
+        """Tests if overlay has the same hash value as the flat frozendict"""
+        self.assertEqual(hash(self.flat), hash(self.overlay))
+        self.assertRaises(TypeError, hash, frozenoverlay(self.defaults, {'a': []}))
+
+    def test_copy(self, /):
+        """Tests if overlay survives deepcopy and pickling"""
+        self.assertIs(self.overlay, deepcopy(self.overlay))
+        self.assertEqual(self.overlay, pickle.loads(pickle.dumps(self.overlay)))
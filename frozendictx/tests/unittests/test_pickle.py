@@ -0,0 +1,135 @@
+import os
+import pickle
+import subprocess
+import sys
+from unittest import TestCase
+
+from frozendictx import FrozendictBatch, frozendict
+from frozendictx._frozendict import HASH_SEED_TOKEN, restore_hashed
+
+
+class Identity:
+    pass
+
+
+class CachedHash(TestCase):
+    def test_same_seed(self, /):
+        """Tests if the cached hash value is passed within the same hash seed"""
+        d = frozendict(a=1, b=(2, 'c'), c=frozendict(d=b'e'))
+        hash(d)
+        unpickled = pickle.loads(pickle.dumps(d))
+        self.assertEqual(d, unpickled)
+        self.assertEqual(hash(d), unpickled._frozendict__hash)
+
+    def test_not_hashed(self, /):
+        """Tests if nothing is passed when hash value is not calculated"""
+        unpickled = pickle.loads(pickle.dumps(frozendict(a=1)))
+        self.assertIsNone(unpickled._frozendict__hash)
+
+    def test_identity_hash(self, /):
+        """Tests if hash value is not passed when it depends on identities of objects"""
+        d = frozendict(a=Identity())
+        hash(d)
+        self.assertIsNone(pickle.loads(pickle.dumps(d))._frozendict__hash)
+
+    def test_identity_scalars(self, /):
+        """Tests if hash value is not passed when NaN or None (before Python 3.12) is hashed by identity"""
+        for value in [float('nan'), complex(0, float('nan')), (1, float('nan'))]:
+            with self.subTest(value=value):
+                d = frozendict(a=value)
+                hash(d)
+                self.assertIsNone(pickle.loads(pickle.dumps(d))._frozendict__hash)
+                self.assertIsNone(pickle.loads(pickle.dumps(FrozendictBatch([d])))[0]._frozendict__hash)
+
+        d = frozendict(a=None)
+        hash(d)
+        cached = pickle.loads(pickle.dumps(d))._frozendict__hash
+        if sys.version_info >= (3, 12):
+            self.assertEqual(hash(d), cached)
+        else:
+            self.assertIsNone(cached)
+
+    def test_other_process(self, /):
+        """Tests if a hash value pickled in one process is valid in another process with the same seed"""
+        dump = (
+            'import pickle, sys\n'
+            'from frozendictx import FrozendictBatch, frozendict\n'
+            'items = [frozendict(a=None, b=float("nan")), frozendict(a=1.5, b=2j, c=("d", b"e", True))]\n'
+            'for d in items: hash(d)\n'
+            'sys.stdout.buffer.write(pickle.dumps((items, FrozendictBatch(items))))\n'
+        )
+        check = (
+            'import pickle, sys\n'
+            'from frozendictx import frozendict\n'
+            'items, batch = pickle.loads(sys.stdin.buffer.read())\n'
+            'print(all(hash(d) == hash(frozendict(d.items())) for d in [*items, *batch]))\n'
+            'print(items[1]._frozendict__hash is not None)\n'
+        )
+        env = dict(os.environ, PYTHONHASHSEED='1')
+        data = subprocess.run([sys.executable, '-c', dump], capture_output=True, env=env, check=True).stdout
+        result = subprocess.run([sys.executable, '-c', check], input=data, capture_output=True, env=env, check=True)
+        self.assertEqual([b'True', b'True'], result.stdout.split())
+
+    def test_other_seed(self, /):
+        """Tests if hash value is dropped when the seed is different"""
+        d = restore_hashed(frozendict, {'a': 'b'}, 1, HASH_SEED_TOKEN + 1)
+        self.assertIsNone(d._frozendict__hash)
+
+        d = frozendict(a='b', c='d')
+        hash(d)
+        code = (
+            'import pickle, sys\n'
+            'from frozendictx import frozendict\n'
+            'd = pickle.loads(sys.stdin.buffer.read())\n'
+            'print(hash(d) == hash(frozendict(d.items())))\n'
+        )
+        seed = '2' if os.environ.get('PYTHONHASHSEED') == '1' else '1'
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            input=pickle.dumps(d),
+            capture_output=True,
+            env=env,
+            check=True,
+            )
+        self.assertEqual(b'True', result.stdout.strip())
+
+
+class Batch(TestCase):
+    def setUp(self, /):
+        self.items = [frozendict(id=i, name=f'{i}') for i in range(10)]
+        self.items.append(frozendict(other=[1]))
+        self.items.append(frozendict())
+        for d in self.items[:5]:
+            hash(d)
+
+        self.batch = FrozendictBatch(self.items)
+
+    def test_sequence(self, /):
+        """Tests sequence methods"""
+        self.assertEqual(len(self.items), len(self.batch))
+        self.assertEqual(self.items, list(self.batch))
+        self.assertIs(self.items[3], self.batch[3])
+        self.assertEqual(FrozendictBatch(self.items[2:5]), self.batch[2:5])
+        self.assertRaises(TypeError, FrozendictBatch, [{'a': 1}])
+
+    def test_pickle(self, /):
+        """Tests if items and cached hash values survive pickling with all protocols"""
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(self.batch, protocol))
+            self.assertIs(FrozendictBatch, unpickled.__class__)
+            self.assertEqual(self.batch, unpickled)
+            self.assertEqual(hash(self.items[0]), unpickled[0]._frozendict__hash)
+            self.assertIsNone(unpickled[7]._frozendict__hash)
+
+    def test_out_of_band(self, /):
+        """Tests if indexes of keys are passed out-of-band with protocol 5"""
+        buffers = []
+        data = pickle.dumps(self.batch, 5, buffer_callback=buffers.append)
+        self.assertEqual(1, len(buffers))
+        self.assertEqual(self.batch, pickle.loads(data, buffers=buffers))
+
+    def test_keys_once(self, /):
+        """Tests if keys of dictionaries of the same shape are pickled once"""
+        data = pickle.dumps(FrozendictBatch(frozendict(some_long_key=i) for i in range(100)))
+        self.assertEqual(1, data.count(b'some_long_key'))
@@ -0,0 +1,79 @@
+import pickle
+from copy import deepcopy
+from unittest import TestCase
+
+from frozendictx import FrozendictBase, frozendict, frozenrecord
+
+
+class Schema(TestCase):
+    def test_same_class(self, /):
+        """Tests if the same keys produce the same schema class"""
+        cls = frozendict.schema(('id', 'name'))
+
+        self.assertIs(cls, frozendict.schema(['id', 'name']))
+        self.assertIsNot(cls, frozendict.schema(['name', 'id']))
+        self.assertTrue(issubclass(cls, frozenrecord))
+        self.assertTrue(issubclass(cls, FrozendictBase))
+
+    def test_duplicate_keys(self, /):
+        """Tests if schema keys must be unique"""
+        self.assertRaises(ValueError, frozendict.schema, ('id', 'id'))
+
+    def test_construction(self, /):
+        """Tests if instances are created only with schema keys"""
+        cls = frozendict.schema(('id', 'name'))
+
+        self.assertEqual(cls.from_values((1, 'one')), cls(name='one', id=1))
+        self.assertRaises(ValueError, cls, id=1)
+        self.assertRaises(ValueError, cls, id=1, name='one', value=1)
+        self.assertRaises(ValueError, cls.from_values, (1,))
+
+
+class Contract(TestCase):
+    def setUp(self, /):
+        self.cls = frozendict.schema(('id', 'name', 'ts'))
+        self.d = dict(id=1, name='one', ts=3)
+        self.record = self.cls.from_values(self.d.values())
+
+    def test_mapping(self, /):
+        """Tests mapping methods against dict"""
+        self.assertEqual(list(self.d), list(self.record))
+        self.assertEqual(list(self.d.values()), list(self.record.values()))
+        self.assertEqual(list(self.d.items()), list(self.record.items()))
+        self.assertEqual(self.d.keys(), self.record.keys())
+        self.assertEqual(len(self.d), len(self.record))
+        self.assertEqual('one', self.record['name'])
+        self.assertIsNone(self.record.get('value'))
+        self.assertRaises(KeyError, self.record.__getitem__, 'value')
+        self.assertIn('ts', self.record)
+
+    def test_equality(self, /):
+        """Tests if record is equal to dict and frozendict with the same items"""
+        self.assertEqual(self.d, self.record)
+        self.assertEqual(frozendict(self.d), self.record)
+        self.assertEqual(self.record, frozendict(self.d))
+        self.assertNotEqual(self.record, self.cls(self.d, ts=4))
+
+    def test_hash(self, /):
+        """Tests if record has the same hash value as frozendict with the same items"""
+        self.assertEqual(hash(frozendict(self.d)), hash(self.record))
+        self.assertRaises(TypeError, hash, self.cls(self.d, ts=[3]))
+
+    def test_or(self, /):
+        """Tests if union keeps the schema only when keys are not added"""
+        result = self.record | {'ts': 4}
+        self.assertIs(self.cls, result.__class__)
+        self.assertEqual(dict(self.d, ts=4), result)
+
+        result = self.record | {'value': 4}
+        self.assertIs(frozendict, result.__class__)
+        self.assertEqual(dict(self.d, value=4), result)
+
+        self.assertIs(self.record, {'ts': 4} | self.record)
+        self.assertEqual(dict(self.d, value=4), {'value': 4} | self.record)
+
+    def test_copy(self, /):
+        """Tests if records survive deepcopy and pickling"""
+        self.assertIs(self.record, deepcopy(self.record))
+        self.assertEqual(self.record, pickle.loads(pickle.dumps(self.record)))
+        self.assertIs(self.cls, pickle.loads(pickle.dumps(self.record)).__class__)
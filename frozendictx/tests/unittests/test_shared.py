@@ -0,0 +1,99 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from frozendictx import frozendict, sharedfrozendict
+
+
+def lookup(args: tuple[sharedfrozendict, str], /):
+    d, key = args
+    return d[key], len(d)
+
+
+class Shared(TestCase):
+    def setUp(self, /):
+        self.d = {'one': 1, 2: 'two', 3.5: b'three', None: None, b'four': 4.5, 'five': [5], 'six': (6, '6')}
+        self.shared = sharedfrozendict(self.d)
+
+    def tearDown(self, /):
+        self.shared.close()
+        self.shared.unlink()
+
+    def test_mapping(self, /):
+        """Tests mapping methods against dict"""
+        self.assertEqual(list(self.d), list(self.shared))
+        self.assertEqual(list(self.d.values()), list(self.shared.values()))
+        self.assertEqual(list(self.d.items()), list(self.shared.items()))
+        self.assertEqual(list(reversed(self.d)), list(reversed(self.shared)))
+        self.assertEqual(len(self.d), len(self.shared))
+        for k, v in self.d.items():
+            self.assertEqual(v, self.shared[k])
+
+        self.assertIsNone(self.shared.get('seven'))
+        self.assertRaises(KeyError, self.shared.__getitem__, 'seven')
+        self.assertRaises(TypeError, self.shared.__getitem__, ['seven'])
+
+    def test_numeric_keys(self, /):
+        """Tests if equal numbers are the same keys like in dict"""
+        shared = sharedfrozendict({1: 'one', 2.0: 'two'})
+        try:
+            self.assertEqual('one', shared[1.0])
+            self.assertEqual('one', shared[True])
+            self.assertEqual('two', shared[2])
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_unsupported_keys(self, /):
+        """Tests if keys of unsupported types are rejected"""
+        self.assertRaises(TypeError, sharedfrozendict, {(1, 2): 'tuple'})
+
+    def test_equality(self, /):
+        """Tests if shared dictionary is equal to dict and frozendict with the same items"""
+        self.assertEqual(self.d, self.shared)
+        self.assertEqual(frozendict(self.d), self.shared)
+        self.assertEqual(self.shared, frozendict(self.d))
+
+    def test_hash(self, /):
+        """Tests if shared dictionary has the same hash value as frozendict with the same items"""
+        d = {'one': 1, 'two': 2}
+        shared = sharedfrozendict(d)
+        try:
+            self.assertEqual(hash(frozendict(d)), hash(shared))
+            self.assertRaises(TypeError, hash, self.shared)
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_attach(self, /):
+        """Tests if attached and unpickled instances use the same block"""
+        attached = sharedfrozendict.attach(self.shared.name)
+        unpickled = pickle.loads(pickle.dumps(self.shared))
+        try:
+            self.assertEqual(self.shared, attached)
+            self.assertEqual(self.shared.name, unpickled.name)
+            self.assertEqual(self.shared, unpickled)
+        finally:
+            attached.close()
+            unpickled.close()
+
+    def test_read_only(self, /):
+        """Tests if created and attached instances cannot write to the block"""
+        attached = sharedfrozendict.attach(self.shared.name)
+        try:
+            for d in self.shared, attached:
+                for view in d._sharedfrozendict__index, d._sharedfrozendict__entries, d._sharedfrozendict__data:
+                    self.assertTrue(view.readonly)
+                    with self.assertRaises(TypeError):
+                        view[0] = 0
+        finally:
+            attached.close()
+
+        self.assertEqual(self.d, dict(self.shared.items()))
+
+    def test_worker(self, /):
+        """Tests if shared dictionary is accessible from worker processes"""
+        with ProcessPoolExecutor(1) as executor:
+            result = list(executor.map(lookup, [(self.shared, 'one'), (self.shared, 'six')]))
+
+        self.assertEqual([(1, len(self.d)), ((6, '6'), len(self.d))], result)
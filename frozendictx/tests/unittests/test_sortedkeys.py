@@ -0,0 +1,87 @@
+import gc
+from unittest import TestCase
+
+from frozendictx import SortedKeys, frozendict
+from frozendictx._sortedkeys import _indexes
+
+
+class Sorted(TestCase):
+    def setUp(self, /):
+        self.keys = ['pear', 'apple', 'peach', 'plum', 'apricot', 'banana', 'pea']
+        self.fd = frozendict.fromkeys(self.keys, 0)
+        self.sk = self.fd.sorted_keys()
+
+    def test_sequence(self, /):
+        """Tests if keys are sorted and sequence operations work"""
+        self.assertIsInstance(self.sk, SortedKeys)
+        expected = sorted(self.keys)
+        self.assertEqual(expected, list(self.sk))
+        self.assertEqual(expected[::-1], list(reversed(self.sk)))
+        self.assertEqual(len(expected), len(self.sk))
+        self.assertEqual(expected[1:3], self.sk[1:3])
+        self.assertIn('plum', self.sk)
+        self.assertNotIn('grape', self.sk)
+        self.assertEqual(expected.index('peach'), self.sk.index('peach'))
+        with self.assertRaises(ValueError):
+            self.sk.index('grape')
+
+        # Bounds behave like in list.index
+        for key, start, stop in [('plum', 0, 100), ('zucchini', 0, 100), ('pear', -3, 100), ('apple', -3, 100), ('apple', 0, -6)]:
+            with self.subTest(key=key, start=start, stop=stop):
+                try:
+                    expected_index = expected.index(key, start, stop)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        self.sk.index(key, start, stop)
+                else:
+                    self.assertEqual(expected_index, self.sk.index(key, start, stop))
+
+    def test_nth(self, /):
+        """Tests if nth returns keys by position in sorted order"""
+        self.assertEqual('apple', self.sk.nth(0))
+        self.assertEqual('plum', self.sk.nth(-1))
+        with self.assertRaises(IndexError):
+            self.sk.nth(len(self.keys))
+
+    def test_floor_ceil(self, /):
+        """Tests if floor and ceil return nearest keys"""
+        self.assertEqual('peach', self.sk.floor('peach'))
+        self.assertEqual('peach', self.sk.ceil('peach'))
+        self.assertEqual('banana', self.sk.floor('cherry'))
+        self.assertEqual('pea', self.sk.ceil('cherry'))
+        self.assertIsNone(self.sk.floor('a'))
+        self.assertIsNone(self.sk.ceil('z'))
+        self.assertEqual('', self.sk.ceil('z', ''))
+
+    def test_irange(self, /):
+        """Tests if irange respects bounds, inclusiveness and direction"""
+        self.assertEqual(['banana', 'pea', 'peach'], list(self.sk.irange('b', 'peach')))
+        self.assertEqual(['pea'], list(self.sk.irange('banana', 'peach', inclusive=(False, False))))
+        self.assertEqual(['apple', 'apricot'], list(self.sk.irange(None, 'b')))
+        self.assertEqual(['pear', 'plum'], list(self.sk.irange('pear')))
+        self.assertEqual(['peach', 'pea', 'banana'], list(self.sk.irange('b', 'peach', reverse=True)))
+        self.assertEqual([], list(self.sk.irange('q', 'a')))
+        self.assertEqual(sorted(self.keys), list(self.sk.irange()))
+
+    def test_prefix(self, /):
+        """Tests if prefix returns exactly keys with the given prefix"""
+        self.assertEqual(['pea', 'peach', 'pear'], list(self.sk.prefix('pea')))
+        self.assertEqual(['apple', 'apricot'], list(self.sk.prefix('ap')))
+        self.assertEqual([], list(self.sk.prefix('grape')))
+        self.assertEqual(sorted(self.keys), list(self.sk.prefix('')))
+
+    def test_cache(self, /):
+        """Tests if the index is built once and released with the dictionary"""
+        self.assertIs(self.sk, self.fd.sorted_keys())
+        # An equal dictionary has its own index
+        self.assertIsNot(self.sk, frozendict(self.fd).sorted_keys())
+        key = id(self.fd)
+        self.assertIn(key, _indexes)
+        del self.fd
+        gc.collect()
+        self.assertNotIn(key, _indexes)
+
+    def test_incomparable(self, /):
+        """Tests if incomparable keys raise TypeError"""
+        with self.assertRaises(TypeError):
+            frozendict({1: 1, 'a': 2}).sorted_keys()
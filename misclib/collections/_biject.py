@@ -1,8 +1,20 @@
-from collections.abc import Iterable, Iterator, Mapping, MappingView, Set
-from sys import getsizeof
-from typing import Generic, Optional, TypeVar, Union, overload
-
-__all__ = 'PairsView', 'AbstractBijectiveMap', 'BijectiveMap', 'FrozenBijectiveMap'
+from collections.abc import Collection, ItemsView, Iterable, Iterator, KeysView, Mapping, MappingView, Sequence, Set
+from operator import is_
+from sys import getsizeof, hash_info
+from typing import Generic, NamedTuple, Optional, TypeVar, Union, overload
+
+from ._trie import Trie
+
+__all__ = (
+    'PairsView',
+    'AbstractBijectiveMap',
+    'BijectiveMap',
+    'FrozenBijectiveMap',
+    'BijectionConflict',
+    'BijectionConflictError',
+    'load_pairs',
+    'load_columns',
+    )
 
 T1 = TypeVar('T1')
 T2 = TypeVar('T2')
@@ -18,6 +30,33 @@ T = TypeVar('T')
 
 dummy = object()
 
+_HASH_MASK = (1 << hash_info.width) - 1
+_HASH_SIGN = 1 << (hash_info.width - 1)
+
+
+def _is_self_pair(pair: P, /) -> bool:
+    value1, value2 = pair
+    return value1 is value2 or value1 == value2
+
+
+def _count_self_pairs(d: dict[V, V], /) -> int:
+    # Both values of a pair are adjacent in a dictionary made by unique_pairs,
+    # but a value paired with itself has a single entry bound to the key object itself
+    return sum(map(is_, d, d.values()))
+
+
+def _link(d: dict[V, V], value1: V, value2: V, /) -> bool:
+    # Binds values which are not in the dictionary, returns whether they are a self-pair
+    d[value1] = value2
+    d[value2] = value1
+    return d[value1] is value1
+
+
+def _unlink(d: dict[V, V], value: V, /) -> bool:
+    # Removes the pair including the value if it is present, returns whether it was a self-pair
+    bound = d.pop(value, dummy)
+    return bound is not dummy and d.pop(bound, dummy) is dummy
+
 
 @MappingView.register
 class PairsView(Generic[T1, T2], Set[P]):
@@ -27,7 +66,9 @@ class PairsView(Generic[T1, T2], Set[P]):
         self._source = source
 
     def __len__(self, /):
-        return len(self._source) // 2
+        # A value paired with itself is counted once in the source
+        source = self._source
+        return (len(source) + source._self_pairs) // 2
 
     def __contains__(self, pair: P, /):
         o = pair[0]
@@ -36,13 +77,27 @@ class PairsView(Generic[T1, T2], Set[P]):
 
     def __iter__(self, /) -> Iterator[P]:
         items = iter(self._source.items())
-        for pair, _ in zip(items, items):
+        if not self._source._self_pairs:
+            for pair, _ in zip(items, items):
+                yield pair
+
+            return
+
+        for pair in items:
             yield pair
+            if pair[0] is not pair[1]:
+                next(items)
 
     def __reversed__(self, /) -> Iterator[P]:
         items = reversed(self._source.items())
-        for _, pair in zip(items, items):
-            yield pair
+        if not self._source._self_pairs:
+            for _, pair in zip(items, items):
+                yield pair
+
+            return
+
+        for pair in items:
+            yield pair if pair[0] is pair[1] else next(items)
 
     def __repr__(self, /):
         return f'{self.__class__.__name__}({self._source!r})'
@@ -69,9 +124,149 @@ def unique_pairs(*data: Union[Mapping[T1, T2], Iterable[P]], mapping: dict[V, V]
     return d
 
 
+class BijectionConflict(NamedTuple):
+    """
+    A pair which was replaced by a later pair sharing a value with it.
+    The first value of ``replaced`` is the shared one.
+    """
+    replaced: P
+    by: P
+
+
+class BijectionConflictError(ValueError):
+    """
+    Raised by bulk loaders if some pairs share values.
+    All found conflicts are available via ``conflicts`` attribute.
+    """
+
+    def __init__(self, conflicts: list[BijectionConflict], /):
+        super().__init__(f'{len(conflicts)} pairs are replaced by later pairs, the first one: {conflicts[0]}')
+        self.conflicts = conflicts
+
+
+def _replay(pairs: Iterable[P], /) -> tuple[dict[V, V], list[BijectionConflict]]:
+    # Does the same as unique_pairs, but records replaced pairs
+    d = {}
+    conflicts = []
+    for value1, value2 in pairs:
+        for value in value1, value2:
+            bound = d.pop(value, dummy)
+            if bound is not dummy:
+                d.pop(bound, dummy)
+                # Repeated pairs are not conflicts
+                if {value, bound} != {value1, value2}:
+                    conflicts.append(BijectionConflict((value, bound), (value1, value2)))
+
+        d[value1] = value2
+        d[value2] = value1
+
+    return d, conflicts
+
+
+def _bind(pairs: Iterable[P], /) -> dict[V, V]:
+    # Both values of a pair are adjacent like in unique_pairs, PairsView relies on it
+    d = {}
+    for value1, value2 in pairs:
+        d[value1] = value2
+        d[value2] = value1
+
+    return d
+
+
+def _check(
+        d: dict[V, V],
+        size: int,
+        pairs: Iterable[P],
+        conflicts: Optional[list[BijectionConflict]],
+        /,
+        ) -> dict[V, V]:
+    # 2 * size distinct values imply that no value is bound twice
+    if len(d) == 2 * size:
+        return d
+
+    d, found = _replay(pairs)
+    if found:
+        if conflicts is None:
+            raise BijectionConflictError(found)
+
+        conflicts.extend(found)
+
+    return d
+
+
+def load_pairs(
+        data: Union[Mapping[T1, T2], Iterable[P]],
+        /,
+        check: bool = True,
+        conflicts: Optional[list[BijectionConflict]] = None,
+        ) -> dict[V, V]:
+    """
+    Returns a dictionary with both directions of pairs from a mapping or an iterable of pairs
+    like ``unique_pairs`` does, but in one pass with two assignments per pair.
+
+    Values shared by several pairs are detected by a separate pass which runs
+    only if the number of distinct values is less than twice the number of pairs.
+    If ``conflicts`` is ``None``, raises :class:`BijectionConflictError` in this case;
+    otherwise, found conflicts are appended to ``conflicts``,
+    and later pairs replace earlier ones like in ``unique_pairs``.
+    If ``check`` is false, the pass is skipped, and pairs must not share values.
+
+    >>> from misclib.collections._biject import BijectionConflictError, load_pairs
+    >>> load_pairs([(1, 'a'), (2, 'b')])
+    {1: 'a', 'a': 1, 2: 'b', 'b': 2}
+    >>> conflicts = []
+    >>> load_pairs([(1, 'a'), (2, 'a'), (1, 'a')], conflicts=conflicts)
+    {1: 'a', 'a': 1}
+    >>> conflicts
+    [BijectionConflict(replaced=('a', 1), by=(2, 'a')), BijectionConflict(replaced=('a', 2), by=(1, 'a'))]
+    >>> try:
+    ...     load_pairs({1: 'a', 2: 'a'})
+    ... except BijectionConflictError as e:
+    ...     e.conflicts
+    [BijectionConflict(replaced=('a', 1), by=(2, 'a'))]
+    """
+    if isinstance(data, AbstractBijectiveMap):
+        # Values of a bijective map are already unique
+        return _bind(data.pairs()) if data._data is None else data._data.copy()
+
+    if isinstance(data, Mapping):
+        data = data.items()
+    elif check and not isinstance(data, Collection):
+        # Pairs are iterated again if some of them share values
+        data = list(data)
+
+    d = _bind(data)
+    return _check(d, len(data), data, conflicts) if check else d
+
+
+def load_columns(
+        values1: Sequence[T1],
+        values2: Sequence[T2],
+        /,
+        check: bool = True,
+        conflicts: Optional[list[BijectionConflict]] = None,
+        ) -> dict[V, V]:
+    """
+    Returns a dictionary with both directions of pairs given as two sequences of equal length,
+    ``values1[i]`` is paired with ``values2[i]``.
+    Conflicts are handled like in :func:`load_pairs`.
+    Raises :class:`ValueError` if lengths of sequences are different.
+
+    >>> from misclib.collections._biject import load_columns
+    >>> load_columns(range(3), 'abc')
+    {0: 'a', 'a': 0, 1: 'b', 'b': 1, 2: 'c', 'c': 2}
+    """
+    if len(values1) != len(values2):
+        raise ValueError(f'sequences have different lengths: {len(values1)} and {len(values2)}')
+
+    d = _bind(zip(values1, values2))
+    return _check(d, len(values1), zip(values1, values2), conflicts) if check else d
+
+
 @Mapping.register
 class AbstractBijectiveMap(Generic[T1, T2]):
-    __slots__ = '_data',
+    # _self_pairs is the number of values paired with themselves, they have a single entry in _data
+    __slots__ = '_data', '_self_pairs'
 
     @overload
     def __init__(self, mapping: Mapping[T1, T2], /): ...
@@ -82,6 +277,37 @@ class AbstractBijectiveMap(Generic[T1, T2]):
 
     def __init__(self, data=(), /):
         self._data: dict[V, V] = unique_pairs(data)
+        self._self_pairs = _count_self_pairs(self._data)
+
+    @classmethod
+    def _adopt(cls, d: dict[V, V], /):
+        self = object.__new__(cls)
+        self._data = d
+        self._self_pairs = _count_self_pairs(d)
+        return self
+
+    @classmethod
+    def from_pairs(
+            cls,
+            data: Union[Mapping[T1, T2], Iterable[P]],
+            /,
+            check: bool = True,
+            conflicts: Optional[list[BijectionConflict]] = None,
+            ):
+        """Creates a bijective map from pairs loaded via :func:`load_pairs`."""
+        return cls._adopt(load_pairs(data, check, conflicts))
+
+    @classmethod
+    def from_columns(
+            cls,
+            values1: Sequence[T1],
+            values2: Sequence[T2],
+            /,
+            check: bool = True,
+            conflicts: Optional[list[BijectionConflict]] = None,
+            ):
+        """Creates a bijective map from pairs loaded via :func:`load_columns`."""
+        return cls._adopt(load_columns(values1, values2, check, conflicts))
 
     def __len__(self, /):
         return len(self._data)
@@ -152,10 +378,9 @@ class AbstractBijectiveMap(Generic[T1, T2]):
 
 class BijectiveMap(AbstractBijectiveMap):
     def set(self, v1: T1, v2: T2, /):
-        self._data.pop(self._data.pop(v1, dummy), dummy)
-        self._data.pop(self._data.pop(v2, dummy), dummy)
-        self._data[v1] = v2
-        self._data[v2] = v1
+        d = self._data
+        self._self_pairs -= _unlink(d, v1) + _unlink(d, v2)
+        self._self_pairs += _link(d, v1, v2)
 
     def add(self, v1: T1, v2: T2, /):
         if v1 in self._data:
@@ -163,8 +388,7 @@ class BijectiveMap(AbstractBijectiveMap):
         elif v2 in self._data:
             v = v2
         else:
-            self._data[v1] = v2
-            self._data[v2] = v1
+            self._self_pairs += _link(self._data, v1, v2)
             return
 
         raise ValueError(f'value {v} is already bound to {self[v]}')
@@ -175,7 +399,20 @@ class BijectiveMap(AbstractBijectiveMap):
     def update(self, other: Iterable[P], /): ...
 
     def update(self, other=(), /):
-        unique_pairs(other, mapping=self._data)
+        # The same as unique_pairs, but counts values paired with themselves
+        if isinstance(other, AbstractBijectiveMap):
+            other = other.pairs()
+        elif isinstance(other, Mapping):
+            other = other.items()
+
+        d = self._data
+        self_pairs = self._self_pairs
+        try:
+            for value1, value2 in other:
+                self_pairs -= _unlink(d, value1) + _unlink(d, value2)
+                self_pairs += _link(d, value1, value2)
+        finally:
+            self._self_pairs = self_pairs
 
     @overload
     def pop(self, value: T1, /) -> T2: ...
@@ -195,22 +432,128 @@ class BijectiveMap(AbstractBijectiveMap):
             return default
 
         v = self._data.pop(value)
-        self._data.__delitem__(v)
+        if self._data.pop(v, dummy) is dummy:
+            self._self_pairs -= 1
+
         return v
 
     def popitem(self, /) -> P:
-        self._data.popitem()  # pops (v2, v1)
+        pair = self._data.popitem()  # pops (v2, v1)
+        if pair[0] is pair[1]:
+            self._self_pairs -= 1
+            return pair
+
         return self._data.popitem()
 
     def __delitem__(self, value: V, /):
-        self._data.__delitem__(self._data.pop(value))
+        if self._data.pop(self._data.pop(value), dummy) is dummy:
+            self._self_pairs -= 1
 
     def clear(self, /):
         self._data.clear()
+        self._self_pairs = 0
+
+
+class _FrozenPairsView(PairsView[T1, T2]):
+    __slots__ = ()
+
+    def __len__(self, /):
+        return len(self._source._tries[0])
+
+    def __iter__(self, /) -> Iterator[P]:
+        return iter(self._source._tries[0].items())
+
+    def __reversed__(self, /) -> Iterator[P]:
+        return reversed(list(self._source._tries[0].items()))
+
+
+class _FrozenItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self, /):
+        for pair in self._mapping._tries[0].items():
+            yield pair
+            if not _is_self_pair(pair):
+                yield pair[1], pair[0]
+
+
+def _pair_bits(value1, value2, /) -> int:
+    # A product of mixed hash values does not depend on the order of values,
+    # but unlike a sum it depends on which values are paired.
+    # Bits above the hash width do not affect lower ones and are cut once by _hash_from_state
+    h1 = hash(value1) * 3644798167 + 89869747
+    h2 = hash(value2) * 3644798167 + 89869747
+    return (h1 ^ (h1 >> 32)) * (h2 ^ (h2 >> 32))
+
+
+def _pairs_state(pairs: Iterable[P], /) -> int:
+    # Xor does not depend on the order of pairs; pairs are not collected.
+    # The same as xor of _pair_bits, but without calls
+    state = 0
+    for value1, value2 in pairs:
+        h1 = hash(value1) * 3644798167 + 89869747
+        h2 = hash(value2) * 3644798167 + 89869747
+        state ^= (h1 ^ (h1 >> 32)) * (h2 ^ (h2 >> 32))
+
+    return state
+
+
+def _hash_from_state(state: int, size: int, /) -> int:
+    # Disperses bits like frozenset does for xor of hash values of its items
+    h = (state & _HASH_MASK) ^ ((size + 1) * 1927868237 & _HASH_MASK)
+    h ^= (h >> 11) ^ (h >> 25)
+    h = (h * 69069 + 907133923) & _HASH_MASK
+    if h == _HASH_MASK:
+        return 590923713
+
+    return h - (h & _HASH_SIGN) * 2
+
+
+def _find_pair(forward: Trie[T1, T2], inverse: Trie[T2, T1], value: V, /) -> Optional[P]:
+    v = forward.get(value, dummy)
+    if v is not dummy:
+        return value, v
+
+    v = inverse.get(value, dummy)
+    if v is not dummy:
+        return v, value
+
+    return None
 
 
 class FrozenBijectiveMap(AbstractBijectiveMap[T1_co, T2_co]):
-    __slots__ = '_hash',
+    """
+    An immutable bijective map.
+
+    A map created from pairs stores them in a dictionary like :class:`BijectiveMap` does.
+    Methods :meth:`with_pair` and :meth:`without` return new maps which store pairs
+    in two persistent tries: one maps first values to second ones
+    and another maps second values to first ones.
+    Derived maps share all nodes of tries except changed paths,
+    i.e., derivation takes logarithmic time and memory;
+    tries of a map created from pairs are built on its first derivation.
+    Lookups in tries are several times slower than in a dictionary;
+    pairs of a derived map are iterated in the order of hash values of their first values.
+
+    Hash value is calculated on the first call of ``hash`` by a pass over pairs,
+    and maps derived from a hashed one update it from changed pairs only.
+
+    >>> from misclib.collections._biject import FrozenBijectiveMap
+    >>> fb = FrozenBijectiveMap({1: 'a', 2: 'b'})
+    >>> fb2 = fb.with_pair(3, 'a')
+    >>> sorted(fb2.pairs())
+    [(2, 'b'), (3, 'a')]
+    >>> fb2['a'], fb2[2], 1 in fb2
+    (3, 'b', False)
+    >>> fb2.without('b') == FrozenBijectiveMap({3: 'a'})
+    True
+    >>> hash(fb2) == hash(FrozenBijectiveMap({'a': 3, 2: 'b'}))
+    True
+    >>> fb == {1: 'a', 'a': 1, 2: 'b', 'b': 2}
+    True
+    """
+    # Either _data is a dictionary or _tries is a pair of tries and _size is the number of values
+    __slots__ = '_tries', '_size', '_state'
 
     @overload
     def __init__(self, mapping: Mapping[T1_co, T2_co], /): ...
@@ -220,11 +563,198 @@ class FrozenBijectiveMap(AbstractBijectiveMap[T1_co, T2_co]):
     def __init__(self, /): ...
 
     def __init__(self, data=(), /):
-        super().__init__(data)
-        self._hash = hash(frozenset(frozenset(pair) for pair in self.pairs()))
+        if isinstance(data, FrozenBijectiveMap):
+            # Both dictionaries and tries of frozen maps are never changed, thus they are shared
+            self._data = data._data
+            self._self_pairs = data._self_pairs
+            self._tries = data._tries
+            self._size = data._size
+            self._state = data._state
+        else:
+            super().__init__(data)
+            self._tries = None
+            self._size = None
+            self._state = None
+
+    @classmethod
+    def _adopt(cls, d: dict[V, V], /):
+        self = super()._adopt(d)
+        self._tries = None
+        self._size = None
+        self._state = None
+        return self
+
+    @classmethod
+    def _from_tries(cls, forward: Trie[T1, T2], inverse: Trie[T2, T1], size: int, state: Optional[int], /):
+        self = object.__new__(cls)
+        self._data = None
+        self._self_pairs = None
+        self._tries = forward, inverse
+        self._size = size
+        self._state = state
+        return self
+
+    def _get_tries(self, /) -> tuple[Trie, Trie]:
+        tries = self._tries
+        if tries is None:
+            # Pairs are read in one pass over the dictionary, including values paired with themselves
+            forward = dict(self.pairs())
+            tries = self._tries = Trie(forward), Trie(dict(zip(forward.values(), forward)))
+
+        return tries
+
+    def __len__(self, /):
+        data = self._data
+        return self._size if data is None else len(data)
+
+    def __getitem__(self, value, /):
+        data = self._data
+        if data is not None:
+            return data[value]
+
+        forward, inverse = self._tries
+        v = forward.get(value, dummy)
+        return inverse[value] if v is dummy else v
+
+    def __contains__(self, value: V, /):
+        data = self._data
+        if data is not None:
+            return value in data
+
+        forward, inverse = self._tries
+        return value in forward or value in inverse
+
+    def __iter__(self, /):
+        data = self._data
+        if data is not None:
+            return iter(data)
+
+        return (pair[0] for pair in self.items())
+
+    def __reversed__(self, /):
+        data = self._data
+        return reversed(list(self) if data is None else data)
+
+    def get(self, value, default=None, /):
+        data = self._data
+        if data is not None:
+            return data.get(value, default)
+
+        forward, inverse = self._tries
+        v = forward.get(value, dummy)
+        return inverse.get(value, default) if v is dummy else v
+
+    def values(self, /):
+        data = self._data
+        return KeysView(self) if data is None else data.keys()
+
+    keys = values
+
+    def items(self, /):
+        data = self._data
+        return _FrozenItemsView(self) if data is None else data.items()
+
+    def pairs(self, /) -> PairsView[T1_co, T2_co]:
+        return PairsView(self) if self._data is not None else _FrozenPairsView(self)
+
+    def with_pair(self, v1: T1, v2: T2, /) -> 'FrozenBijectiveMap[T1, T2]':
+        """
+        Returns a bijective map with two values bound to each other.
+        Pairs which include any of the values are removed like in ``BijectiveMap.set``.
+        """
+        forward, inverse = self._get_tries()
+        size = len(self)
+        state = self._state
+        for value in v1, v2:
+            pair = _find_pair(forward, inverse, value)
+            if pair is not None:
+                if pair == (v1, v2):
+                    return self
+
+                forward = forward.delete(pair[0])
+                inverse = inverse.delete(pair[1])
+                size -= 1 if _is_self_pair(pair) else 2
+                if state is not None:
+                    state ^= _pair_bits(*pair)
+
+        if state is not None:
+            state ^= _pair_bits(v1, v2)
+
+        size += 1 if _is_self_pair((v1, v2)) else 2
+        return self._from_tries(forward.set(v1, v2), inverse.set(v2, v1), size, state)
+
+    def without(self, value: V, /) -> 'FrozenBijectiveMap[T1_co, T2_co]':
+        """
+        Returns a bijective map without the pair which includes the value.
+        Raises :class:`KeyError` if the value is absent.
+        """
+        forward, inverse = self._get_tries()
+        pair = _find_pair(forward, inverse, value)
+        if pair is None:
+            raise KeyError(value)
+
+        state = self._state
+        return self._from_tries(
+            forward.delete(pair[0]),
+            inverse.delete(pair[1]),
+            len(self) - (1 if _is_self_pair(pair) else 2),
+            None if state is None else state ^ _pair_bits(*pair),
+            )
+
+    def __eq__(self, other, /):
+        if isinstance(other, FrozenBijectiveMap):
+            if len(self) != len(other):
+                return False
+
+            if self._state is not None and other._state is not None and self._state != other._state:
+                return False
+        elif not isinstance(other, Mapping):
+            return NotImplemented
+
+        data = self._data
+        if data is not None:
+            # The other map compares itself to the dictionary if it is stored in tries
+            return data == other
+
+        if len(self) != len(other):
+            return False
+
+        # Pairs of a bijective map with the same length are equal if one direction is equal,
+        # otherwise both directions are checked
+        bijective = isinstance(other, AbstractBijectiveMap)
+        get = other.get
+        for value1, value2 in self._tries[0].items():
+            v = get(value1, dummy)
+            if not (v is value2 or v == value2):
+                return False
+
+            if not bijective:
+                v = get(value2, dummy)
+                if not (v is value1 or v == value1):
+                    return False
+
+        return True
+
+    def __ne__(self, other, /):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __reduce__(self, /):
+        return self.__class__, (tuple(self.pairs()),)
 
     def __hash__(self, /):
-        return self._hash
+        state = self._state
+        if state is None:
+            # Pairs are iterated as is, thus no container is created
+            state = self._state = _pairs_state(self.pairs())
+
+        return _hash_from_state(state, len(self))
 
     def __sizeof__(self, /):
-        return super().__sizeof__() + getsizeof(self._hash)
+        # Nodes of tries are shared with derived maps, thus they are not included
+        size = object.__sizeof__(self)
+        for o in self._data, self._state:
+            if o is not None:
+                size += getsizeof(o)
+
+        return size
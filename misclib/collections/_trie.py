@@ -0,0 +1,299 @@
+from collections.abc import ItemsView, Iterator, KeysView, Mapping, ValuesView
+from sys import hash_info
+from typing import Any, Self
+
+__all__ = 'Trie',
+
+# Every level of the trie consumes 5 bits of a hash value, i.e., every node has up to 32 children
+_SHIFT_STEP = 5
+_INDEX_MASK = (1 << _SHIFT_STEP) - 1
+_HASH_MASK = (1 << hash_info.width) - 1
+
+_missing = object()
+
+
+class _Node:
+    """
+    A node of a hash array mapped trie.
+    A set bit in the bitmap marks which of 32 possible children are present in the tuple.
+    A child is a key-value tuple, a node or a bucket.
+    Nodes are never changed, changed copies are created instead.
+    """
+    __slots__ = 'bitmap', 'children'
+
+    def __init__(self, bitmap: int, children: tuple, /) -> None:
+        self.bitmap = bitmap
+        self.children = children
+
+
+class _Bucket:
+    """
+    A child of a node which holds key-value tuples with keys having the same hash value.
+    """
+    __slots__ = 'hash', 'leaves'
+
+    def __init__(self, h: int, leaves: tuple, /) -> None:
+        self.hash = h
+        self.leaves = leaves
+
+
+_empty = _Node(0, ())
+
+
+def _hash(key: Any, /) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _find(node: _Node, h: int, key: Any, /) -> Any:
+    shift = 0
+    while True:
+        bit = 1 << ((h >> shift) & _INDEX_MASK)
+        if not node.bitmap & bit:
+            return _missing
+
+        child = node.children[(node.bitmap & (bit - 1)).bit_count()]
+        cls = child.__class__
+        if cls is _Node:
+            node = child
+            shift += _SHIFT_STEP
+        elif cls is _Bucket:
+            if child.hash == h:
+                for k, v in child.leaves:
+                    if k is key or k == key:
+                        return v
+
+            return _missing
+        else:
+            k, v = child
+            return v if k is key or k == key else _missing
+
+
+def _split(child: tuple | _Bucket, h1: int, leaf: tuple, h2: int, shift: int, /) -> _Node:
+    # Hash values are different, thus they differ in some level below
+    i1 = (h1 >> shift) & _INDEX_MASK
+    i2 = (h2 >> shift) & _INDEX_MASK
+    if i1 == i2:
+        return _Node(1 << i1, (_split(child, h1, leaf, h2, shift + _SHIFT_STEP),))
+
+    return _Node((1 << i1) | (1 << i2), (child, leaf) if i1 < i2 else (leaf, child))
+
+
+def _assoc(node: _Node, shift: int, h: int, key: Any, value: Any, /) -> tuple[_Node, bool]:
+    """
+    Returns a node with the key bound to the value and whether the key was absent.
+    """
+    bit = 1 << ((h >> shift) & _INDEX_MASK)
+    index = (node.bitmap & (bit - 1)).bit_count()
+    children = node.children
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, (*children[:index], (key, value), *children[index:])), True
+
+    child = children[index]
+    cls = child.__class__
+    if cls is _Node:
+        new, added = _assoc(child, shift + _SHIFT_STEP, h, key, value)
+    elif cls is _Bucket:
+        if child.hash == h:
+            leaves = tuple(leaf for leaf in child.leaves if not (leaf[0] is key or leaf[0] == key))
+            added = len(leaves) == len(child.leaves)
+            new = _Bucket(h, (*leaves, (key, value)))
+        else:
+            new = _split(child, child.hash, (key, value), h, shift + _SHIFT_STEP)
+            added = True
+    else:
+        k = child[0]
+        if k is key or k == key:
+            # The original key object is kept like dict does
+            new = k, value
+            added = False
+        else:
+            hk = _hash(k)
+            if hk == h:
+                new = _Bucket(h, (child, (key, value)))
+            else:
+                new = _split(child, hk, (key, value), h, shift + _SHIFT_STEP)
+
+            added = True
+
+    return _Node(node.bitmap, (*children[:index], new, *children[index + 1:])), added
+
+
+def _dissoc(node: _Node, shift: int, h: int, key: Any, /) -> Any:
+    """
+    Returns a node without the key or ``_missing`` if the key is absent.
+    """
+    bit = 1 << ((h >> shift) & _INDEX_MASK)
+    if not node.bitmap & bit:
+        return _missing
+
+    index = (node.bitmap & (bit - 1)).bit_count()
+    children = node.children
+    child = children[index]
+    cls = child.__class__
+    if cls is _Node:
+        new = _dissoc(child, shift + _SHIFT_STEP, h, key)
+        if new is _missing:
+            return _missing
+
+        if not new.bitmap:
+            new = None
+        elif len(new.children) == 1 and new.children[0].__class__ is not _Node:
+            # A single tuple or bucket is valid at any level of its path, thus it goes up
+            new = new.children[0]
+    elif cls is _Bucket:
+        if child.hash != h:
+            return _missing
+
+        leaves = tuple(leaf for leaf in child.leaves if not (leaf[0] is key or leaf[0] == key))
+        if len(leaves) == len(child.leaves):
+            return _missing
+
+        new = leaves[0] if len(leaves) == 1 else _Bucket(h, leaves)
+    else:
+        k = child[0]
+        if not (k is key or k == key):
+            return _missing
+
+        new = None
+
+    if new is None:
+        return _Node(node.bitmap ^ bit, (*children[:index], *children[index + 1:]))
+
+    return _Node(node.bitmap, (*children[:index], new, *children[index + 1:]))
+
+
+def _build(entries: list[tuple[int, tuple]], shift: int, /) -> _Node:
+    # Entries are hash values with key-value tuples, keys must be unique
+    groups = {}
+    for entry in entries:
+        index = (entry[0] >> shift) & _INDEX_MASK
+        group = groups.get(index)
+        if group is None:
+            groups[index] = [entry]
+        else:
+            group.append(entry)
+
+    bitmap = 0
+    children = []
+    for index in sorted(groups):
+        group = groups[index]
+        bitmap |= 1 << index
+        h = group[0][0]
+        if len(group) == 1:
+            children.append(group[0][1])
+        elif all(entry[0] == h for entry in group):
+            children.append(_Bucket(h, tuple(entry[1] for entry in group)))
+        else:
+            children.append(_build(group, shift + _SHIFT_STEP))
+
+    return _Node(bitmap, tuple(children))
+
+
+def _leaves(node: _Node, /) -> Iterator[tuple]:
+    for child in node.children:
+        cls = child.__class__
+        if cls is _Node:
+            yield from _leaves(child)
+        elif cls is _Bucket:
+            yield from child.leaves
+        else:
+            yield child
+
+
+class _TrieItemsView[K, V](ItemsView[K, V]):
+    __slots__ = ()
+
+    def __iter__(self, /) -> Iterator[tuple[K, V]]:
+        return _leaves(self._mapping._root)
+
+
+class _TrieValuesView[K, V](ValuesView[V]):
+    __slots__ = ()
+
+    def __iter__(self, /) -> Iterator[V]:
+        for _, v in _leaves(self._mapping._root):
+            yield v
+
+
+class Trie[K, V](Mapping[K, V]):
+    """
+    An immutable mapping stored in a hash array mapped trie.
+    Methods :meth:`set` and :meth:`delete` return new tries
+    which share all nodes except ones on the path to the changed key,
+    thus they take logarithmic time and memory.
+    Keys are iterated in the order of their hash values.
+
+    >>> from misclib.collections._trie import Trie
+    >>> t1 = Trie({1: 'a', 2: 'b'})
+    >>> t2 = t1.set(3, 'c').delete(1)
+    >>> dict(t1), dict(t2)
+    ({1: 'a', 2: 'b'}, {2: 'b', 3: 'c'})
+    >>> t2 == {2: 'b', 3: 'c'}
+    True
+    """
+    __slots__ = '_root', '_size'
+
+    def __init__(self, data: Mapping[K, V] = {}, /) -> None:
+        self._root = _build([(_hash(k), (k, v)) for k, v in data.items()], 0) if data else _empty
+        self._size = len(data)
+
+    @classmethod
+    def _from_root(cls, root: _Node, size: int, /) -> Self:
+        self = object.__new__(cls)
+        self._root = root
+        self._size = size
+        return self
+
+    def __len__(self, /) -> int:
+        return self._size
+
+    def __iter__(self, /) -> Iterator[K]:
+        for k, _ in _leaves(self._root):
+            yield k
+
+    def __contains__(self, key: Any, /) -> bool:
+        return _find(self._root, _hash(key), key) is not _missing
+
+    def __getitem__(self, key: K, /) -> V:
+        v = _find(self._root, _hash(key), key)
+        if v is _missing:
+            raise KeyError(key)
+
+        return v
+
+    def get(self, key, default=None, /):
+        v = _find(self._root, _hash(key), key)
+        return default if v is _missing else v
+
+    def keys(self, /) -> KeysView[K]:
+        return KeysView(self)
+
+    def values(self, /) -> ValuesView[V]:
+        return _TrieValuesView(self)
+
+    def items(self, /) -> ItemsView[K, V]:
+        return _TrieItemsView(self)
+
+    def set(self, key: K, value: V, /) -> Self:
+        """
+        Returns a trie with the key bound to the value.
+        """
+        root, added = _assoc(self._root, 0, _hash(key), key, value)
+        return self._from_root(root, self._size + added)
+
+    def delete(self, key: K, /) -> Self:
+        """
+        Returns a trie without the key.
+        Raises :class:`KeyError` if the key is absent.
+        """
+        root = _dissoc(self._root, 0, _hash(key), key)
+        if root is _missing:
+            raise KeyError(key)
+
+        return self._from_root(root, self._size - 1)
+
+    def __reduce__(self, /) -> tuple:
+        return self.__class__, (dict(self.items()),)
+
+    def __repr__(self, /) -> str:
+        return f'{self.__class__.__name__}({dict(self.items())!r})'
@@ -0,0 +1,241 @@
+from collections.abc import ItemsView, Iterable, Iterator, KeysView, Mapping, MutableMapping, ValuesView
+from typing import Any, Self, overload
+
+__all__ = 'Bijection',
+
+_missing = object()
+
+
+class Bijection[K, V](MutableMapping[K, V]):
+    """
+    A one-to-one mapping from keys to values.
+    Keys and values are stored in two separate dictionaries,
+    thus they may have overlapping domains, e.g., integers mapped to integers.
+
+    All methods operate on the forward side, i.e., look up keys and return values.
+    The inverse side is available via :attr:`inverse` which is a bijection
+    sharing both dictionaries with this one, i.e., its changes are reflected here.
+
+    >>> from misclib.collections.bijection import Bijection
+    >>> b = Bijection({1: 2, 2: 3, 3: 1})
+    >>> b[1], b.inverse[1], len(b)
+    (2, 3, 3)
+    >>> b[4] = 2
+    >>> b
+    Bijection({2: 3, 3: 1, 4: 2})
+    >>> b.inverse.pop(1)
+    3
+    >>> b
+    Bijection({2: 3, 4: 2})
+    >>> list(b.items())
+    [(2, 3), (4, 2)]
+    """
+    __slots__ = '_forward', '_inverse', '_mirror'
+
+    @overload
+    def __init__(self, mapping: Mapping[K, V], /) -> None: ...
+    @overload
+    def __init__(self, iterable: Iterable[tuple[K, V]] = (), /) -> None: ...
+
+    def __init__(self, data: Mapping[K, V] | Iterable[tuple[K, V]] = (), /) -> None:
+        if isinstance(data, Mapping):
+            # Keys of a mapping are unique, thus no pair is replaced if values are unique too
+            forward = dict(data.items())
+            inverse = dict(zip(forward.values(), forward))
+            if len(forward) == len(inverse):
+                self._forward = forward
+                self._inverse = inverse
+                self._mirror = None
+                return
+
+        self._forward = {}
+        self._inverse = {}
+        self._mirror = None
+        self.update(data)
+
+    @classmethod
+    def _from_dicts(cls, forward: dict[K, V], inverse: dict[V, K], /) -> Self:
+        self = object.__new__(cls)
+        self._forward = forward
+        self._inverse = inverse
+        self._mirror = None
+        return self
+
+    @property
+    def inverse(self, /) -> 'Bijection[V, K]':
+        """
+        The bijection from values to keys.
+        It is created in constant time and shares storage with this bijection.
+
+        >>> from misclib.collections.bijection import Bijection
+        >>> b = Bijection({'a': 1})
+        >>> b.inverse.set(2, 'b')
+        >>> b
+        Bijection({'a': 1, 'b': 2})
+        >>> b.inverse.get('a'), b.inverse.inverse is b
+        (None, True)
+        """
+        mirror = self._mirror
+        if mirror is None:
+            # Both bijections reference each other, thus the view is created once
+            mirror = self._from_dicts(self._inverse, self._forward)
+            mirror._mirror = self
+            self._mirror = mirror
+
+        return mirror
+
+    def __len__(self, /) -> int:
+        return len(self._forward)
+
+    def __iter__(self, /) -> Iterator[K]:
+        return iter(self._forward)
+
+    def __reversed__(self, /) -> Iterator[K]:
+        return reversed(self._forward)
+
+    def __contains__(self, key: Any, /) -> bool:
+        return key in self._forward
+
+    def __getitem__(self, key: K, /) -> V:
+        return self._forward[key]
+
+    @overload
+    def get(self, key: K, /) -> V | None: ...
+    @overload
+    def get[T](self, key: K, default: V | T, /) -> V | T: ...
+
+    def get(self, key, default=None, /):
+        """
+        Returns the value bound to a key if it is present and ``default`` otherwise.
+        Only keys are looked up, use :attr:`inverse` to look up values.
+        """
+        return self._forward.get(key, default)
+
+    def keys(self, /) -> KeysView[K]:
+        return self._forward.keys()
+
+    def values(self, /) -> ValuesView[V]:
+        return self._forward.values()
+
+    def items(self, /) -> ItemsView[K, V]:
+        """
+        Returns a view on key-value pairs of the dictionary of keys.
+        Its iteration creates no objects if pairs are not kept.
+        """
+        return self._forward.items()
+
+    def set(self, key: K, value: V, /) -> None:
+        """
+        Binds a key to a value.
+        Pairs which include the key or the value are removed beforehand.
+        """
+        forward = self._forward
+        inverse = self._inverse
+        old_value = forward.pop(key, _missing)
+        if old_value is not _missing:
+            del inverse[old_value]
+
+        old_key = inverse.pop(value, _missing)
+        if old_key is not _missing:
+            del forward[old_key]
+
+        forward[key] = value
+        inverse[value] = key
+
+    __setitem__ = set
+
+    def add(self, key: K, value: V, /) -> None:
+        """
+        Binds a key to a value.
+        Raises :class:`ValueError` if the key or the value is already bound.
+
+        >>> from misclib.collections.bijection import Bijection
+        >>> b = Bijection({'a': 1})
+        >>> b.add('b', 1)
+        Traceback (most recent call last):
+        ...
+        ValueError: value 1 is already bound to 'a'
+        """
+        if key in self._forward:
+            raise ValueError(f'key {key!r} is already bound to {self._forward[key]!r}')
+
+        if value in self._inverse:
+            raise ValueError(f'value {value!r} is already bound to {self._inverse[value]!r}')
+
+        self._forward[key] = value
+        self._inverse[value] = key
+
+    @overload
+    def pop(self, key: K, /) -> V: ...
+    @overload
+    def pop[T](self, key: K, default: V | T, /) -> V | T: ...
+
+    def pop(self, key, default=_missing, /):
+        """
+        Removes a key with its value and returns the value.
+        If the key is absent, returns ``default`` if it is given
+        and raises :class:`KeyError` otherwise.
+        """
+        value = self._forward.pop(key, _missing)
+        if value is _missing:
+            if default is _missing:
+                raise KeyError(key)
+
+            return default
+
+        del self._inverse[value]
+        return value
+
+    def popitem(self, /) -> tuple[K, V]:
+        """
+        Removes the last bound pair and returns it.
+        Raises :class:`KeyError` if the bijection is empty.
+        """
+        key, value = self._forward.popitem()
+        del self._inverse[value]
+        return key, value
+
+    def __delitem__(self, key: K, /) -> None:
+        del self._inverse[self._forward.pop(key)]
+
+    def clear(self, /) -> None:
+        self._forward.clear()
+        self._inverse.clear()
+
+    @overload
+    def update(self, mapping: Mapping[K, V], /) -> None: ...
+    @overload
+    def update(self, iterable: Iterable[tuple[K, V]] = (), /) -> None: ...
+
+    def update(self, data: Mapping[K, V] | Iterable[tuple[K, V]] = (), /) -> None:
+        """
+        Binds keys to values from a mapping or from an iterable of pairs like :meth:`set` does,
+        i.e., later pairs replace earlier ones which include the same key or value.
+        """
+        if isinstance(data, Mapping):
+            data = data.items()
+
+        set_ = self.set
+        for key, value in data:
+            set_(key, value)
+
+    def copy(self, /) -> Self:
+        """
+        Returns a shallow copy of the bijection.
+        """
+        return self._from_dicts(self._forward.copy(), self._inverse.copy())
+
+    def __eq__(self, other: Any, /) -> bool:
+        if isinstance(other, Bijection):
+            return self._forward == other._forward
+
+        if isinstance(other, Mapping):
+            return self._forward == other
+
+        return NotImplemented
+
+    def __reduce__(self, /) -> tuple:
+        return self.__class__, (self._forward,)
+
+    def __repr__(self, /) -> str:
+        return f'{self.__class__.__name__}({self._forward!r})'
@@ -0,0 +1,339 @@
+"""
+Layout of a file written by :meth:`IntBijection.save`:
+
+- header: magic bytes, the name of the byte order padded with zero bytes,
+  lengths of the forward and the inverse arrays and the number of pairs
+  as unsigned 64-bit little-endian integers;
+- the forward array followed by the inverse array,
+  every item is a signed 64-bit integer in the byte order from the header.
+
+The header takes 40 bytes, thus both arrays are aligned to 8 bytes in a mapped file.
+"""
+import os
+from array import array
+from collections.abc import Buffer, Iterable, Iterator, Mapping
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from sys import byteorder
+from typing import Any, Self, overload
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = 'UNBOUND', 'IntBijection'
+
+UNBOUND = -1
+"""Marks integers of the forward or the inverse array which are not bound."""
+
+_MAGIC = b'MLINTBIJ'
+_HEADER = Struct('<8s8sQQQ')
+
+type StrPath = str | os.PathLike[str]
+type IntArray = array[int] | memoryview
+
+
+def _invert(values: IntArray, /) -> array[int]:
+    # Returns the inverse array, values must be distinct non-negative integers or UNBOUND
+    inverse = array('q', [UNBOUND]) * (max(values, default=UNBOUND) + 1)
+    for i, v in enumerate(values):
+        if v >= 0:
+            if inverse[v] != UNBOUND:
+                raise ValueError(f'{v} is bound to both {inverse[v]} and {i}')
+
+            inverse[v] = i
+        elif v != UNBOUND:
+            raise ValueError(f'{v} is neither a non-negative integer nor {UNBOUND}')
+
+    return inverse
+
+
+def _copy(a: Buffer, /) -> array[int]:
+    result = array('q')
+    # NumPy arrays of 64-bit integers do not export their buffers as bytes
+    result.frombytes(memoryview(a).cast('B'))
+    return result
+
+
+def _lookup(a: IntArray, i: Any, /) -> int:
+    try:
+        # Negative integers must not index from the end
+        return a[i] if i >= 0 else UNBOUND
+    except (IndexError, TypeError):
+        return UNBOUND
+
+
+def _take(a: IntArray, indices: Iterable[int] | Buffer, /) -> Any:
+    """
+    Returns items of an array at given indices.
+    Raises :class:`KeyError` with the first index which is out of range or points to :data:`UNBOUND`.
+    """
+    if numpy is not None and isinstance(indices, numpy.ndarray):
+        return _take_numpy(a, indices)
+
+    if not (isinstance(indices, array) and indices.typecode == 'q'):
+        if isinstance(indices, Buffer):
+            # Iteration over a view yields integers for any integer format
+            indices = memoryview(indices)
+
+        indices = array('q', indices)
+
+    if numpy is not None:
+        return _copy(_take_numpy(a, numpy.frombuffer(indices, numpy.int64)))
+
+    if indices and min(indices) < 0:
+        raise KeyError(next(i for i in indices if i < 0))
+
+    try:
+        # A list is filled faster than an array
+        result = array('q', [a[i] for i in indices])
+    except IndexError:
+        raise KeyError(next(i for i in indices if i >= len(a))) from None
+
+    if UNBOUND in result:
+        raise KeyError(indices[result.index(UNBOUND)])
+
+    return result
+
+
+def _take_numpy(a: IntArray, indices: Any, /) -> Any:
+    table = numpy.frombuffer(a, numpy.int64)
+    invalid = (indices < 0) | (indices >= len(table))
+    if invalid.any():
+        raise KeyError(indices[invalid.argmax()].item())
+
+    result = table[indices]
+    invalid = result == UNBOUND
+    if invalid.any():
+        raise KeyError(indices[invalid.argmax()].item())
+
+    return result
+
+
+class IntBijection(Mapping[int, int]):
+    """
+    An immutable one-to-one mapping between ranges of non-negative integers,
+    e.g., from sparse row ids to dense compacted ids.
+
+    Pairs are stored in two arrays of signed 64-bit integers:
+    the ``i``-th item of the forward array is the value bound to key ``i``,
+    the ``j``-th item of the inverse array is the key bound to value ``j``;
+    integers which are not bound are marked with :data:`UNBOUND`.
+    Thus lookups in both directions take constant time,
+    and every pair takes 16 bytes plus 8 bytes per every unbound integer below the maximal one.
+    Arrays are ``array('q')`` or views on a mapped file, see :meth:`open`.
+
+    Methods :meth:`map_many` and :meth:`inverse_many` look up many integers at once;
+    they use NumPy if it is installed.
+    Pickling copies the arrays.
+
+    >>> from misclib.collections.int_bijection import IntBijection
+    >>> b = IntBijection.compact([10, 11, 15])
+    >>> b
+    IntBijection({10: 0, 11: 1, 15: 2})
+    >>> b[15], b.inverse[1], 12 in b, len(b)
+    (2, 11, False, 3)
+    >>> b.map_many([15, 10])
+    array('q', [2, 0])
+    >>> b.inverse_many(bytes([2, 0, 1]))
+    array('q', [15, 10, 11])
+    """
+    __slots__ = '_forward', '_inverse', '_size', '_mmap', '_mirror'
+
+    def __init__(self, values: Iterable[int] | Buffer = (), /) -> None:
+        """
+        Binds every integer ``i`` to ``values[i]``; :data:`UNBOUND` values leave ``i`` unbound.
+        Raises :class:`ValueError` if some value is negative and not :data:`UNBOUND`
+        or is bound to several integers.
+        """
+        if isinstance(values, Buffer):
+            values = memoryview(values)
+
+        forward = array('q', values)
+        self._set_arrays(forward, _invert(forward), None, None)
+
+    def _set_arrays(self, forward: IntArray, inverse: IntArray, size: int | None, mm: mmap | None, /) -> None:
+        self._forward = forward
+        self._inverse = inverse
+        self._size = len(inverse) - inverse.count(UNBOUND) if size is None else size
+        self._mmap = mm
+        self._mirror = None
+
+    @classmethod
+    def _from_arrays(cls, forward: IntArray, inverse: IntArray, size: int | None, mm: mmap | None, /) -> Self:
+        self = object.__new__(cls)
+        self._set_arrays(forward, inverse, size, mm)
+        return self
+
+    @classmethod
+    def compact(cls, ids: Iterable[int] | Buffer, /) -> Self:
+        """
+        Returns a bijection which binds distinct non-negative ids to 0, 1, 2 and so on
+        in the order of ids.
+        Raises :class:`ValueError` if some id is negative or repeated.
+
+        >>> from misclib.collections.int_bijection import IntBijection
+        >>> IntBijection.compact([3, 3])
+        Traceback (most recent call last):
+        ...
+        ValueError: 3 is bound to both 0 and 1
+        """
+        if isinstance(ids, Buffer):
+            ids = memoryview(ids)
+
+        inverse = array('q', ids)
+        if UNBOUND in inverse:
+            raise ValueError(f'{UNBOUND} cannot be an id')
+
+        return cls._from_arrays(_invert(inverse), inverse, None, None)
+
+    @property
+    def inverse(self, /) -> 'IntBijection':
+        """
+        The bijection from values to keys.
+        It is created once and shares arrays with this bijection.
+        """
+        mirror = self._mirror
+        if mirror is None:
+            mirror = self._from_arrays(self._inverse, self._forward, self._size, self._mmap)
+            mirror._mirror = self
+            self._mirror = mirror
+
+        return mirror
+
+    def __len__(self, /) -> int:
+        return self._size
+
+    def __iter__(self, /) -> Iterator[int]:
+        for key, value in enumerate(self._forward):
+            if value != UNBOUND:
+                yield key
+
+    def __contains__(self, key: Any, /) -> bool:
+        return _lookup(self._forward, key) != UNBOUND
+
+    def __getitem__(self, key: int, /) -> int:
+        value = _lookup(self._forward, key)
+        if value == UNBOUND:
+            raise KeyError(key)
+
+        return value
+
+    @overload
+    def get(self, key: int, /) -> int | None: ...
+    @overload
+    def get[T](self, key: int, default: int | T, /) -> int | T: ...
+
+    def get(self, key, default=None, /):
+        """
+        Returns the value bound to a key if it is present and ``default`` otherwise.
+        """
+        value = _lookup(self._forward, key)
+        return default if value == UNBOUND else value
+
+    def map_many(self, keys: Iterable[int] | Buffer, /) -> Any:
+        """
+        Returns values bound to keys given as an iterable of integers
+        or an object supporting the buffer protocol with integer items,
+        e.g., ``array``, ``bytes`` or ``memoryview``.
+        The result is a NumPy array if keys are a NumPy array and ``array('q')`` otherwise.
+        Raises :class:`KeyError` with the first key which is not bound.
+
+        >>> from misclib.collections.int_bijection import IntBijection
+        >>> IntBijection([2, -1, 0]).map_many([0, 1])
+        Traceback (most recent call last):
+        ...
+        KeyError: 1
+        """
+        return _take(self._forward, keys)
+
+    def inverse_many(self, values: Iterable[int] | Buffer, /) -> Any:
+        """
+        Returns keys bound to values like :meth:`map_many` returns values bound to keys.
+        """
+        return _take(self._inverse, values)
+
+    def copy(self, /) -> Self:
+        """
+        Returns a copy of the bijection stored in memory, i.e., not in a mapped file.
+        """
+        return self._from_arrays(_copy(self._forward), _copy(self._inverse), self._size, None)
+
+    def save(self, path: StrPath, /) -> None:
+        """
+        Writes the arrays to a file which can be opened via :meth:`open`.
+        """
+        with open(path, 'wb') as f:
+            forward = self._forward
+            inverse = self._inverse
+            f.write(_HEADER.pack(_MAGIC, byteorder.encode(), len(forward), len(inverse), self._size))
+            f.write(forward)
+            f.write(inverse)
+
+    @classmethod
+    def open(cls, path: StrPath, /) -> Self:
+        """
+        Maps a file written by :meth:`save` into memory and returns a bijection viewing its arrays.
+        Pages of the file are loaded by the operating system on demand
+        and shared among all processes which open the same file.
+        Raises :class:`ValueError` if the file is not written by :meth:`save`
+        or is written on a machine with another byte order.
+
+        >>> import os, tempfile
+        >>> from misclib.collections.int_bijection import IntBijection
+        >>> directory = tempfile.TemporaryDirectory()
+        >>> path = os.path.join(directory.name, 'ids.bin')
+        >>> IntBijection.compact([7, 3]).save(path)
+        >>> b = IntBijection.open(path)
+        >>> b, b.inverse_many([1, 0])
+        (IntBijection({3: 1, 7: 0}), array('q', [3, 7]))
+        >>> b.close()
+        >>> directory.cleanup()
+        """
+        with open(path, 'rb') as f:
+            mm = mmap(f.fileno(), 0, access=ACCESS_READ)
+
+        if len(mm) < _HEADER.size:
+            mm.close()
+            raise ValueError(f'file {path!r} does not contain a bijection')
+
+        magic, order, forward_len, inverse_len, size = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC or len(mm) != _HEADER.size + 8 * (forward_len + inverse_len):
+            mm.close()
+            raise ValueError(f'file {path!r} does not contain a bijection')
+
+        order = order.rstrip(b'\0').decode()
+        if order != byteorder:
+            mm.close()
+            raise ValueError(f'file {path!r} is written in {order}-endian byte order')
+
+        view = memoryview(mm)
+        middle = _HEADER.size + 8 * forward_len
+        forward = view[_HEADER.size:middle].cast('q')
+        inverse = view[middle:].cast('q')
+        view.release()
+        return cls._from_arrays(forward, inverse, size, mm)
+
+    def close(self, /) -> None:
+        """
+        Unmaps the file if the bijection is opened via :meth:`open`; does nothing otherwise.
+        The bijection and its inverse cannot be used after this call.
+        """
+        if self._mmap is not None:
+            self._forward.release()
+            self._inverse.release()
+            self._mmap.close()
+
+    def __eq__(self, other: Any, /) -> bool:
+        if isinstance(other, IntBijection) and len(self._forward) == len(other._forward):
+            return self._forward == other._forward
+
+        return super().__eq__(other)
+
+    def __reduce__(self, /) -> tuple:
+        forward = self._forward
+        return self.__class__, (forward if self._mmap is None else _copy(forward),)
+
+    def __repr__(self, /) -> str:
+        return f'{self.__class__.__name__}({dict(self.items())!r})'
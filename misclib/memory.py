@@ -0,0 +1,220 @@
+import gc
+from collections.abc import Iterable, Iterator, Mapping
+from sys import getsizeof
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any, NamedTuple
+
+__all__ = 'TypeCensus', 'Census', 'deep_sizeof', 'census'
+
+# Objects of these types belong to the program rather than to data, they are never counted
+_program_types = type, ModuleType, FunctionType, BuiltinFunctionType
+# Singletons are shared by everything, thus they are never counted
+_singletons = None, True, False, Ellipsis, NotImplemented
+
+
+def _walk(roots: Iterable[Any], exclude: Iterable[Any], /) -> tuple[dict[int, Any], dict[int, int]]:
+    """
+    Walks objects reachable from roots via ``gc.get_referents``,
+    i.e., items of containers, attribute dictionaries and values in slots.
+    Returns objects by their identifiers and the number of references to every object
+    from walked objects.
+    """
+    skipped = {id(o) for o in _singletons}
+    skipped.update(id(o) for o in exclude)
+    objects = {}
+    referrers = {}
+    stack = []
+    for o in roots:
+        key = id(o)
+        if key not in skipped and key not in objects and not isinstance(o, _program_types):
+            objects[key] = o
+            referrers[key] = 0
+            stack.append(o)
+
+    while stack:
+        parent = stack.pop()
+        referents = gc.get_referents(parent)
+        if isinstance(parent, dict):
+            # Dictionaries with only string keys do not traverse keys
+            traversed = set(map(id, referents))
+            referents.extend(k for k in dict.keys(parent) if id(k) not in traversed)
+
+        for o in referents:
+            key = id(o)
+            if key in skipped:
+                continue
+
+            if key in objects:
+                referrers[key] += 1
+            elif not isinstance(o, _program_types):
+                objects[key] = o
+                referrers[key] = 1
+                stack.append(o)
+
+    return objects, referrers
+
+
+def _own_sizeof(o: Any, /) -> int:
+    """
+    Returns the size of an object like ``getsizeof`` does,
+    but ignores overrides of ``__sizeof__`` written in Python,
+    since they usually add sizes of attributes which are counted separately by the walk.
+    """
+    cls = type(o)
+    if not isinstance(cls.__sizeof__, FunctionType):
+        return getsizeof(o)
+
+    # The nearest built-in implementation reports memory of the object itself;
+    # garbage collector overhead is the difference between getsizeof and __sizeof__
+    sizeof = next(
+        f for f in (vars(c).get('__sizeof__') for c in cls.__mro__)
+        if f is not None and not isinstance(f, FunctionType)
+        )
+    return sizeof(o) + getsizeof(o) - o.__sizeof__()
+
+
+def deep_sizeof(*objects: Any, exclude: Iterable[Any] = ()) -> int:
+    """
+    Returns the total size in bytes of the given objects and all objects reachable from them,
+    including garbage collector overhead.
+    Every object is counted once even if it is referenced several times.
+
+    Objects are found via ``gc.get_referents``, thus items of containers,
+    instance dictionaries and values in slots are included.
+    Classes, modules, functions and singletons like ``None`` are not included;
+    objects in ``exclude`` are not included as well as objects reachable only through them.
+    Overrides of ``__sizeof__`` written in Python are ignored,
+    since objects they add are counted when the walk reaches them.
+
+    >>> from sys import getsizeof
+    >>> from misclib.memory import deep_sizeof
+    >>> s = 'x' * 1000
+    >>> deep_sizeof([s, s]) == getsizeof([s, s]) + getsizeof(s)
+    True
+    >>> class Point:
+    ...     __slots__ = 'x', 'y'
+    ...     def __init__(self, x, y, /):
+    ...         self.x = x
+    ...         self.y = y
+    ...
+    >>> p = Point(10 ** 30, 10 ** 40)
+    >>> deep_sizeof(p) == getsizeof(p) + getsizeof(p.x) + getsizeof(p.y)
+    True
+    >>> deep_sizeof(p, exclude=[p.x]) == getsizeof(p) + getsizeof(p.y)
+    True
+    >>> from misclib.utils.color import Color
+    >>> c = Color(255, 0, 0, 128)
+    >>> deep_sizeof(c) == getsizeof(c) - getsizeof(c._argb) + deep_sizeof(c._argb)
+    True
+    """
+    found, _ = _walk(objects, exclude)
+    return sum(map(_own_sizeof, found.values()))
+
+
+class TypeCensus(NamedTuple):
+    """
+    Population of objects of one type.
+    An object is shared if counted objects reference it at least twice,
+    e.g., an interned string or a cached dictionary used in several places.
+    """
+    count: int
+    """The number of objects."""
+    size: int
+    """The total size of objects in bytes."""
+    shared_count: int
+    """The number of shared objects."""
+    shared_size: int
+    """The total size of shared objects in bytes."""
+
+
+class Census(Mapping[type, TypeCensus]):
+    """
+    Population of objects by their exact types.
+    Created via :func:`census`.
+    """
+    __slots__ = '_types',
+
+    def __init__(self, types: dict[type, TypeCensus], /):
+        self._types = types
+
+    def __getitem__(self, cls: type, /) -> TypeCensus:
+        return self._types[cls]
+
+    def __len__(self, /) -> int:
+        return len(self._types)
+
+    def __iter__(self, /) -> Iterator[type]:
+        return iter(self._types)
+
+    @property
+    def count(self, /) -> int:
+        """The total number of objects."""
+        return sum(t.count for t in self._types.values())
+
+    @property
+    def size(self, /) -> int:
+        """The total size of objects in bytes."""
+        return sum(t.size for t in self._types.values())
+
+    @property
+    def shared_size(self, /) -> int:
+        """The total size of shared objects in bytes."""
+        return sum(t.shared_size for t in self._types.values())
+
+    def most_common(self, n: int | None = None, /) -> list[tuple[type, TypeCensus]]:
+        """
+        Returns the list of ``n`` types which objects take the most memory
+        together with their population.
+        If ``n`` is omitted or ``None``, returns all types.
+        """
+        result = sorted(self._types.items(), key=lambda item: item[1].size, reverse=True)
+        return result if n is None else result[:n]
+
+    def __str__(self, /):
+        lines = [f'{"type":<40} {"count":>12} {"bytes":>14} {"shared":>12} {"shared bytes":>14}']
+        for cls, t in self.most_common():
+            name = f'{cls.__module__}.{cls.__qualname__}'
+            lines.append(f'{name:<40} {t.count:>12,} {t.size:>14,} {t.shared_count:>12,} {t.shared_size:>14,}')
+
+        return '\n'.join(lines)
+
+    def __repr__(self, /):
+        return f'{self.__class__.__name__}({self._types!r})'
+
+
+def census(*objects: Any, exclude: Iterable[Any] = ()) -> Census:
+    """
+    Counts objects reachable from the given objects by their exact types,
+    objects are found and counted like in :func:`deep_sizeof`.
+    If no object is given, all objects tracked by the garbage collector
+    and objects reachable from them are counted.
+
+    >>> from sys import getsizeof
+    >>> from misclib.memory import census
+    >>> s = 'y' * 1000
+    >>> c = census([s, s], {'key': s})
+    >>> c[list].count, c[dict].count, c[str].count
+    (1, 1, 2)
+    >>> c[str].shared_count, c[str].shared_size == getsizeof(s)
+    (1, True)
+    >>> c.size == getsizeof([s, s]) + getsizeof({'key': s}) + getsizeof(s) + getsizeof('key')
+    True
+    """
+    if objects:
+        found, referrers = _walk(objects, exclude)
+    else:
+        found, referrers = _walk(gc.get_objects(), exclude)
+
+    counts = {}
+    for key, o in found.items():
+        size = _own_sizeof(o)
+        shared = referrers[key] > 1
+        count, total, shared_count, shared_total = counts.get(type(o), (0, 0, 0, 0))
+        counts[type(o)] = (
+            count + 1,
+            total + size,
+            shared_count + shared,
+            shared_total + size if shared else shared_total,
+            )
+
+    return Census({cls: TypeCensus(*values) for cls, values in counts.items()})
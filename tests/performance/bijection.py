@@ -0,0 +1,85 @@
+"""
+Compares ``BijectiveMap`` which stores both directions in one dictionary
+with ``Bijection`` which stores them in two dictionaries.
+Keys are integers and values are strings, i.e., the domains do not overlap,
+otherwise ``BijectiveMap`` cannot store them.
+Prints a Markdown table; run from the root of the project:
+``python -m tests.performance.bijection``.
+"""
+
+import gc
+from collections.abc import Callable
+from timeit import repeat
+
+from misclib.collections._biject import BijectiveMap
+from misclib.collections.bijection import Bijection
+from misclib.memory import deep_sizeof
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+# Description, whether the time depends on the size, statements for BijectiveMap and Bijection
+operations = [
+    ('Creation from a dict', True, 'BijectiveMap(data)', 'Bijection(data)'),
+    ('Key lookup', False, 'b[key]', 'b[key]'),
+    ('Value lookup', False, 'b[value]', 'b.inverse[value]'),
+    ('`set` of a new pair and `pop`', False, 'b.set(-1, "new"); b.pop(-1)', 'b.set(-1, "new"); b.pop(-1)'),
+    ('Iteration over pairs', True, 'for _ in b.pairs(): pass', 'for _ in b.items(): pass'),
+    ('`len`', False, 'len(b)', 'len(b)'),
+    ]
+
+
+def timing(stmt: str, globals_: dict, /, number: int) -> float:
+    return min(repeat(stmt, repeat=5, number=number, globals=globals_)) / number
+
+
+def format_time(seconds: float, /) -> str:
+    if seconds >= 1e-3:
+        return f'{seconds * 1e3:,.2f} ms'
+
+    if seconds >= 1e-6:
+        return f'{seconds * 1e6:,.2f} μs'
+
+    return f'{seconds * 1e9:,.0f} ns'
+
+
+def run(print_: Callable[[str], object] = print, /):
+    header = ['Operation', 'Implementation', *(f'{n:,} pairs' for n in SIZES)]
+    print_(f'| {" | ".join(header)} |')
+    print_(f'| :--- | :--- |{" ---: |" * len(SIZES)}')
+    mappings = []
+    for n in SIZES:
+        data = {i: f'value{i}' for i in range(n)}
+        mappings.append((data, BijectiveMap(data), Bijection(data)))
+
+    for descr, sized, *statements in operations:
+        for cls, stmt in zip([BijectiveMap, Bijection], statements):
+            row = [descr, f'`{cls.__name__}`']
+            for (data, *instances), n in zip(mappings, SIZES):
+                b = instances[cls is Bijection]
+                number = max(1, 1_000_000 // n) if sized else 1_000_000
+                globals_ = dict(
+                    data=data,
+                    b=b,
+                    key=n // 2,
+                    value=f'value{n // 2}',
+                    BijectiveMap=BijectiveMap,
+                    Bijection=Bijection,
+                    )
+                row.append(format_time(timing(stmt, globals_, number=number)))
+                gc.collect()
+
+            print_(f'| {" | ".join(row)} |')
+
+    for cls in [BijectiveMap, Bijection]:
+        row = ['Memory per pair', f'`{cls.__name__}`']
+        for data, *instances in mappings:
+            b = instances[cls is Bijection]
+            # Keys and values are shared with the source dictionary, only containers are measured
+            size = deep_sizeof(b, exclude=[*data.keys(), *data.values()])
+            row.append(f'{size / len(data):,.1f} B')
+
+        print_(f'| {" | ".join(row)} |')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,72 @@
+"""
+Compares construction of ``FrozenBijectiveMap`` which hashes pairs eagerly
+via a frozenset of pair frozensets (the former behaviour, emulated here)
+with construction which leaves hashing for the first call of ``hash``.
+Every measurement of peak memory runs in a new process;
+the reported value is the growth of peak RSS after the source dictionary is created.
+Prints a Markdown table; run from the root of the project:
+``python -m tests.performance.frozen_bijection``.
+Peak RSS is measured via :mod:`resource`, i.e., on Unix only.
+"""
+
+import subprocess
+import sys
+from collections.abc import Callable
+
+from tests.performance.bijection import format_time, timing
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+SETUP = '''
+import resource
+from misclib.collections._biject import FrozenBijectiveMap
+data = {i: f'value{i}' for i in range(%d)}
+'''
+
+# Description, statement
+implementations = [
+    (
+        'Eager hash (before)',
+        'fb = FrozenBijectiveMap(data); hash(frozenset(frozenset(pair) for pair in fb.pairs()))',
+        ),
+    ('Lazy hash, not hashed', 'fb = FrozenBijectiveMap(data)'),
+    ('Lazy hash, hashed once', 'fb = FrozenBijectiveMap(data); hash(fb)'),
+    ]
+
+MEMORY = '''
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+%s
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before)
+'''
+
+
+def peak_memory(n: int, stmt: str, /) -> int:
+    code = SETUP % n + MEMORY % stmt
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    # ru_maxrss is in kibibytes on Linux
+    return int(result.stdout) * 1024
+
+
+def run(print_: Callable[[str], object] = print, /):
+    header = ['Implementation', 'Measure', *(f'{n:,} pairs' for n in SIZES)]
+    print_(f'| {" | ".join(header)} |')
+    print_(f'| :--- | :--- |{" ---: |" * len(SIZES)}')
+    # A child process inherits peak RSS of its parent, thus memory is measured
+    # before this process allocates anything for timing
+    memory_rows = [
+        [descr, 'Peak RSS growth', *(f'{peak_memory(n, stmt) / 2 ** 20:,.1f} MiB' for n in SIZES)]
+        for descr, stmt in implementations
+        ]
+    for (descr, stmt), memory_row in zip(implementations, memory_rows):
+        time_row = [descr, 'Time']
+        for n in SIZES:
+            globals_ = {}
+            exec(SETUP % n, globals_)
+            time_row.append(format_time(timing(stmt, globals_, number=max(1, 100_000 // n))))
+
+        print_(f'| {" | ".join(time_row)} |')
+        print_(f'| {" | ".join(memory_row)} |')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,69 @@
+"""
+Compares ``BijectiveMap`` with ``IntBijection`` for remapping of sparse row ids
+(every other integer) to dense compacted ids.
+Domains of values of ``BijectiveMap`` must not overlap, thus compacted ids are negated for it.
+Prints a Markdown table; run from the root of the project:
+``python -m tests.performance.int_bijection``.
+NumPy is used by ``IntBijection.map_many`` if it is installed.
+"""
+
+import gc
+from array import array
+from collections.abc import Callable
+
+from misclib.collections._biject import BijectiveMap
+from misclib.collections.int_bijection import IntBijection
+from misclib.memory import deep_sizeof
+from tests.performance.bijection import format_time, timing
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+# Description, whether the time depends on the size, statements for BijectiveMap and IntBijection
+operations = [
+    ('Creation', True, 'BijectiveMap(zip(ids, range(-1, -len(ids) - 1, -1)))', 'IntBijection.compact(ids)'),
+    ('Row id lookup', False, 'b[key]', 'b[key]'),
+    ('Compacted id lookup', False, 'b[value]', 'b.inverse[value]'),
+    ('Remapping of all row ids', True, 'array("q", map(b.__getitem__, ids))', 'b.map_many(ids)'),
+    ]
+
+
+def run(print_: Callable[[str], object] = print, /):
+    header = ['Operation', 'Implementation', *(f'{n:,} pairs' for n in SIZES)]
+    print_(f'| {" | ".join(header)} |')
+    print_(f'| :--- | :--- |{" ---: |" * len(SIZES)}')
+    mappings = []
+    for n in SIZES:
+        ids = array('q', range(0, 2 * n, 2))
+        mappings.append((ids, BijectiveMap(zip(ids, range(-1, -n - 1, -1))), IntBijection.compact(ids)))
+
+    for descr, sized, *statements in operations:
+        for cls, stmt in zip([BijectiveMap, IntBijection], statements):
+            row = [descr, f'`{cls.__name__}`']
+            for (ids, *instances), n in zip(mappings, SIZES):
+                b = instances[cls is IntBijection]
+                number = max(1, 1_000_000 // n) if sized else 1_000_000
+                globals_ = dict(
+                    ids=ids,
+                    b=b,
+                    key=ids[n // 2],
+                    value=-1 - n // 2 if cls is BijectiveMap else n // 2,
+                    array=array,
+                    BijectiveMap=BijectiveMap,
+                    IntBijection=IntBijection,
+                    )
+                row.append(format_time(timing(stmt, globals_, number=number)))
+                gc.collect()
+
+            print_(f'| {" | ".join(row)} |')
+
+    for cls in [BijectiveMap, IntBijection]:
+        row = ['Memory per pair', f'`{cls.__name__}`']
+        for ids, *instances in mappings:
+            b = instances[cls is IntBijection]
+            row.append(f'{deep_sizeof(b) / len(ids):,.1f} B')
+
+        print_(f'| {" | ".join(row)} |')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,78 @@
+"""
+Compares reads of ``FrozenBijectiveMap`` created from pairs, which stores them in a dictionary,
+with reads of a map derived via ``with_pair``, which stores pairs in two tries,
+and measures derivation itself.
+``BijectiveMap`` is the reference for a map backed by a dictionary.
+Prints a Markdown table; run from the root of the project:
+``python -m tests.performance.persistent_bijection``.
+"""
+
+from collections.abc import Callable
+
+from misclib.collections._biject import BijectiveMap, FrozenBijectiveMap
+from tests.performance.bijection import format_time, timing
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+ALL = 0, 1, 2
+FROZEN = 1, 2
+
+# Description, whether the time depends on the size, indices of measured kinds of maps, statement;
+# maps are ``b`` and ``other`` which is an equal map of the same kind
+operations = [
+    ('Creation from a dict', True, (0, 1), 'type(b)(data)'),
+    ('Key lookup', False, ALL, 'b[key]'),
+    ('Value lookup', False, ALL, 'b[value]'),
+    ('`==` with an equal map', True, ALL, 'b == other'),
+    ('Iteration over pairs', True, ALL, 'for _ in b.pairs(): pass'),
+    ('First `with_pair` (builds tries)', True, (1,), 'FrozenBijectiveMap(data).with_pair(-1, "new")'),
+    ('Next `with_pair`', False, FROZEN, 'b.with_pair(-1, "new")'),
+    ]
+
+
+def derive(data: dict, /) -> FrozenBijectiveMap:
+    # Adding and removing a pair leaves the same pairs stored in tries
+    return FrozenBijectiveMap(data).with_pair(-1, 'new').without(-1)
+
+
+def run(print_: Callable[[str], object] = print, /):
+    header = ['Operation', 'Implementation', *(f'{n:,} pairs' for n in SIZES)]
+    print_(f'| {" | ".join(header)} |')
+    print_(f'| :--- | :--- |{" ---: |" * len(SIZES)}')
+    # Description, function creating a map from a dictionary
+    kinds = [
+        ('`BijectiveMap`', BijectiveMap),
+        ('Created `FrozenBijectiveMap`', FrozenBijectiveMap),
+        ('Derived `FrozenBijectiveMap`', derive),
+        ]
+    mappings = []
+    for n in SIZES:
+        data = {i: f'value{i}' for i in range(n)}
+        mappings.append((data, [(make(data), make(data)) for _, make in kinds]))
+
+    for descr, sized, indices, stmt in operations:
+        for i in indices:
+            row = [descr, kinds[i][0]]
+            for (data, instances), n in zip(mappings, SIZES):
+                b, other = instances[i]
+                if 'b.with_pair' in stmt:
+                    # Tries of a created map are built on its first derivation and kept
+                    b.with_pair(-1, 'new')
+
+                number = max(1, 100_000 // n) if sized else 100_000
+                globals_ = dict(
+                    BijectiveMap=BijectiveMap,
+                    FrozenBijectiveMap=FrozenBijectiveMap,
+                    data=data,
+                    b=b,
+                    other=other,
+                    key=n // 2,
+                    value=f'value{n // 2}',
+                    )
+                row.append(format_time(timing(stmt, globals_, number=number)))
+
+            print_(f'| {" | ".join(row)} |')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,229 @@
+import pickle
+from doctest import DocTestSuite
+from itertools import combinations
+from math import comb
+from random import Random
+from unittest import TestCase, TestLoader, TestSuite
+
+from misclib.collections import _biject
+from misclib.collections._biject import BijectiveMap, FrozenBijectiveMap
+
+
+class PersistentFrozenBijectiveMap(TestCase):
+    def test_operations(self, /) -> None:
+        """Tests if persistent operations match changes of a mutable map and keep originals intact"""
+        rng = Random(0)
+        # Small domains make values collide often
+        bm = BijectiveMap()
+        fb = FrozenBijectiveMap()
+        # Derived maps update the hash value of a hashed one
+        hash(fb)
+        for _ in range(2000):
+            before = BijectiveMap(bm)
+            previous = fb
+            if bm and rng.random() < 0.3:
+                value = rng.choice(list(bm))
+                del bm[value]
+                fb = fb.without(value)
+            else:
+                v1 = rng.randrange(50)
+                v2 = rng.randrange(50, 100)
+                bm.set(v1, v2)
+                fb = fb.with_pair(v1, v2)
+
+            self.assertEqual(before, previous)
+            self.assertEqual(bm, fb)
+            self.assertEqual(set(bm.pairs()), set(fb.pairs()))
+            self.assertIsNotNone(fb._state)
+            self.assertEqual(hash(FrozenBijectiveMap(bm)), hash(fb))
+
+    def test_lazy_hash(self, /) -> None:
+        """Tests if hash value is calculated on demand and does not depend on order and orientation of pairs"""
+        pairs = [(1, 'a'), ('b', 'b'), (2.5, None), ((1, 2), frozenset()), (-1, -2)]
+        fb = FrozenBijectiveMap(pairs)
+        self.assertIsNone(fb._state)
+        self.assertIsNone(fb.with_pair(3, 'c')._state)
+        h = hash(fb)
+        self.assertIsNotNone(fb._state)
+        self.assertEqual(h, hash(fb))
+        self.assertEqual(h, hash(FrozenBijectiveMap(reversed(pairs))))
+        self.assertEqual(h, hash(FrozenBijectiveMap((v2, v1) for v1, v2 in pairs)))
+        self.assertNotEqual(h, hash(FrozenBijectiveMap([(1, 'b'), ('a', 'a'), *pairs[2:]])))
+
+    def test_collisions(self, /) -> None:
+        """Tests if values with equal hash values are stored and removed"""
+        fb = FrozenBijectiveMap([(-1, 'a'), (-2, 'b')])
+        self.assertEqual(hash(-1), hash(-2))
+        self.assertEqual(('a', 'b'), (fb[-1], fb[-2]))
+        fb = fb.without(-1)
+        self.assertEqual({-2: 'b', 'b': -2}, fb)
+        self.assertNotIn(-1, fb)
+        with self.assertRaises(KeyError):
+            fb.without(-1)
+
+    def test_pairings(self, /) -> None:
+        """Tests if different pairings of the same values have different hash values"""
+        hashes = set()
+        for a, b, c, d in combinations(range(12), 4):
+            for pairs in [((a, b), (c, d)), ((a, c), (b, d)), ((a, d), (b, c))]:
+                hashes.add(hash(FrozenBijectiveMap(pairs)))
+
+        self.assertEqual(3 * comb(12, 4), len(hashes))
+
+    def test_self_pairs(self, /) -> None:
+        """Tests if values paired with themselves are kept in created and derived maps"""
+        pairs = [(1, 1), (2, 2), (3, 4)]
+        expected = {1: 1, 2: 2, 3: 4, 4: 3}
+        fb = FrozenBijectiveMap(pairs)
+        for m in fb, fb.with_pair(5, 6).without(5), FrozenBijectiveMap.from_pairs(BijectiveMap(pairs)):
+            self.assertEqual(expected, dict(m.items()))
+            self.assertEqual(4, len(m))
+            self.assertEqual(3, len(m.pairs()))
+            self.assertEqual(set(pairs), set(m.pairs()))
+            self.assertEqual(sorted(expected), sorted(m))
+            self.assertIn(2, m)
+            self.assertEqual(m, expected)
+            self.assertEqual(hash(fb), hash(m))
+
+        self.assertEqual(pairs, list(fb.pairs()))
+        self.assertEqual(pairs[::-1], list(reversed(fb.pairs())))
+        derived = fb.without(2)
+        self.assertEqual({1: 1, 3: 4, 4: 3}, derived)
+        self.assertEqual(3, len(derived))
+        derived = derived.with_pair(1, 4)
+        self.assertEqual({1: 4, 4: 1}, derived)
+        self.assertEqual(2, len(derived))
+        self.assertEqual({1: 1, 5: 5}, fb.with_pair(5, 5).without(3).without(2))
+        self.assertEqual(expected, _biject.load_pairs(BijectiveMap(pairs)))
+
+    def test_self_pairs_mutable(self, /) -> None:
+        """Tests if values paired with themselves are counted and removed by methods of mutable maps"""
+        bm = BijectiveMap([(1, 1), (2, 2), (3, 4)])
+        self.assertEqual((3, 4), bm.popitem())
+        self.assertEqual((2, 2), bm.popitem())
+        self.assertEqual(1, len(bm.pairs()))
+        self.assertEqual((1, 1), bm.popitem())
+        self.assertEqual(0, len(bm.pairs()))
+        self.assertRaises(KeyError, bm.popitem)
+        self.assertEqual((1, 1), BijectiveMap([(1, 1)]).popitem())
+
+        rng = Random(0)
+        for _ in range(2000):
+            if bm and rng.random() < 0.3:
+                value = rng.choice(list(bm))
+                if rng.random() < 0.5:
+                    del bm[value]
+                else:
+                    self.assertEqual(bm[value], bm.pop(value))
+            elif rng.random() < 0.1:
+                bm.update([(rng.randrange(10), rng.randrange(10)) for _ in range(3)])
+            else:
+                bm.set(rng.randrange(10), rng.randrange(10))
+
+            pairs = list(bm.pairs())
+            self.assertEqual(len(pairs), len(bm.pairs()))
+            self.assertEqual(pairs[::-1], list(reversed(bm.pairs())))
+            self.assertEqual(len(bm), sum(1 if v1 == v2 else 2 for v1, v2 in pairs))
+            self.assertEqual(bm, FrozenBijectiveMap(pairs))
+
+    def test_equality(self, /) -> None:
+        """Tests if maps are compared with other mappings in both directions of pairs"""
+        for fb in FrozenBijectiveMap({1: 'a'}), FrozenBijectiveMap().with_pair(1, 'a'):
+            self.assertEqual(fb, {1: 'a', 'a': 1})
+            self.assertEqual({1: 'a', 'a': 1}, fb)
+            self.assertNotEqual(fb, {1: 'a', 'a': 2})
+            self.assertNotEqual({1: 'a', 'a': 2}, fb)
+            self.assertNotEqual(fb, {1: 'a', 2: 'a'})
+            self.assertEqual(fb, FrozenBijectiveMap({'a': 1}))
+            self.assertEqual(fb, BijectiveMap({'a': 1}))
+            self.assertNotEqual(fb, FrozenBijectiveMap({'a': 2}).with_pair(1, 'b').without(2))
+
+    def test_storage(self, /) -> None:
+        """Tests if maps created from pairs read a dictionary and derived maps read tries"""
+        fb = FrozenBijectiveMap({1: 'a'})
+        self.assertEqual({1: 'a', 'a': 1}, fb._data)
+        self.assertIsNone(fb._tries)
+        derived = fb.with_pair(2, 'b')
+        self.assertIsNotNone(fb._tries)
+        self.assertIsNone(derived._data)
+        self.assertIs(fb._tries, FrozenBijectiveMap(fb)._tries)
+        self.assertEqual(['a', 'b'], sorted(derived.values() - {1, 2}))
+        self.assertEqual((1, 'b', None), (derived['a'], derived.get(2), derived.get(3)))
+
+    def test_pickle(self, /) -> None:
+        """Tests if pickling preserves pairs and their order"""
+        fb = FrozenBijectiveMap((i, str(i)) for i in range(100))
+        unpickled = pickle.loads(pickle.dumps(fb))
+        self.assertEqual(fb, unpickled)
+        self.assertEqual(list(fb.pairs()), list(unpickled.pairs()))
+
+
+class BulkLoaders(TestCase):
+    def test_conflicts(self, /) -> None:
+        """Tests if conflicts are collected or raised by load_pairs and load_columns"""
+        expected = {2: 'a', 'a': 2, 3: 'b', 'b': 3, 1: 'c', 'c': 1}
+        values1 = [1, 2, 3, 1, 3]
+        values2 = ['a', 'a', 'b', 'c', 'b']
+        # 1 is unbound when (1, 'c') comes, and a repeated pair is not a conflict
+        found = [_biject.BijectionConflict(('a', 1), (2, 'a'))]
+        for load in (
+                lambda **kwargs: _biject.load_columns(values1, values2, **kwargs),
+                lambda **kwargs: _biject.load_pairs(zip(values1, values2), **kwargs),
+                ):
+            with self.assertRaises(_biject.BijectionConflictError) as cm:
+                load()
+
+            self.assertEqual(found, cm.exception.conflicts)
+            conflicts = []
+            d = load(conflicts=conflicts)
+            self.assertEqual(found, conflicts)
+            self.assertEqual(expected, d)
+            self.assertEqual(_biject.unique_pairs(zip(values1, values2)), d)
+
+        self.assertEqual({1: 'a', 'a': 1}, _biject.load_columns([1, 1], ['a', 'a']))
+        self.assertEqual({1: 1, 2: 3, 3: 2}, _biject.load_columns([1, 2], [1, 3]))
+
+    def test_unchecked(self, /) -> None:
+        """Tests if check=False skips the pass over pairs which share values"""
+        pairs = [(1, 'a'), (2, 'a')]
+        # No pass detects pairs which share values, thus a stale entry of the first pair is kept
+        self.assertEqual({1: 'a', 'a': 2, 2: 'a'}, _biject.load_pairs(pairs, check=False))
+        self.assertEqual({1: 'a', 'a': 2, 2: 'a'}, _biject.load_columns([1, 2], 'aa', check=False))
+        self.assertEqual({1: 'a', 'a': 1}, _biject.load_pairs(iter([(1, 'a')]), check=False))
+
+    def test_lengths(self, /) -> None:
+        """Tests if columns of different lengths are rejected"""
+        with self.assertRaisesRegex(ValueError, 'different lengths: 2 and 3'):
+            _biject.load_columns([1, 2], 'abc')
+
+        with self.assertRaises(ValueError):
+            FrozenBijectiveMap.from_columns([1], [])
+
+    def test_iterators(self, /) -> None:
+        """Tests if one-shot iterators of pairs are read twice when they share values"""
+        self.assertEqual({1: 'a', 'a': 1, 2: 'b', 'b': 2}, _biject.load_pairs(iter([(1, 'a'), (2, 'b')])))
+        conflicts = []
+        d = _biject.load_pairs(((i % 2, str(i)) for i in range(4)), conflicts=conflicts)
+        self.assertEqual({0: '2', '2': 0, 1: '3', '3': 1}, d)
+        self.assertEqual(2, len(conflicts))
+        with self.assertRaises(_biject.BijectionConflictError):
+            _biject.load_pairs(iter([(1, 'a'), (1, 'b')]))
+
+    def test_constructors(self, /) -> None:
+        """Tests if from_pairs and from_columns create maps of the called class"""
+        for cls in BijectiveMap, FrozenBijectiveMap:
+            with self.subTest(cls=cls):
+                bm = cls.from_pairs(iter([(1, 'a'), (2, 2)]))
+                self.assertIs(cls, bm.__class__)
+                self.assertEqual({1: 'a', 'a': 1, 2: 2}, bm)
+                self.assertEqual(2, len(bm.pairs()))
+                self.assertEqual(bm, cls.from_columns([1, 2], ['a', 2]))
+                conflicts = []
+                self.assertEqual({1: 'b', 'b': 1}, cls.from_columns([1, 1], 'ab', conflicts=conflicts))
+                self.assertEqual([_biject.BijectionConflict((1, 'a'), (1, 'b'))], conflicts)
+
+
+def load_tests(loader: TestLoader, tests: TestSuite, pattern: str, /) -> TestSuite:
+    suite = DocTestSuite(_biject, globs={'__name__': '__main__'})
+    suite.addTests(tests)
+    return suite
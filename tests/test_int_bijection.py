@@ -0,0 +1,89 @@
+import os
+import pickle
+from array import array
+from doctest import DocTestSuite
+from tempfile import TemporaryDirectory
+from unittest import TestCase, TestLoader, TestSuite, skipIf
+
+from misclib.collections import int_bijection
+from misclib.collections.int_bijection import UNBOUND, IntBijection
+
+
+class IntBijectionCase(TestCase):
+    def setUp(self, /) -> None:
+        self.ids = [5, 0, 9, 2]
+        self.b = IntBijection.compact(self.ids)
+
+    def test_lookups(self, /) -> None:
+        """Tests if lookups in both directions agree with a dictionary"""
+        d = {id_: i for i, id_ in enumerate(self.ids)}
+        self.assertEqual(d, self.b)
+        self.assertEqual({i: id_ for id_, i in d.items()}, self.b.inverse)
+        self.assertIs(self.b, self.b.inverse.inverse)
+        for key in [-1, 1, 10, 'a', None]:
+            with self.subTest(key=key):
+                self.assertNotIn(key, self.b)
+                self.assertIsNone(self.b.get(key))
+                with self.assertRaises(KeyError):
+                    _ = self.b[key]
+
+    def test_constructor(self, /) -> None:
+        """Tests if invalid values are rejected"""
+        self.assertEqual({1: 0}, IntBijection([UNBOUND, 0]))
+        for values in [[0, 0], [-2], [1, -1, 1]]:
+            with self.subTest(values=values):
+                with self.assertRaises(ValueError):
+                    IntBijection(values)
+
+        with self.assertRaises(ValueError):
+            IntBijection.compact([UNBOUND])
+
+    def test_many(self, /) -> None:
+        """Tests if lookups of many integers accept iterables and buffers"""
+        expected = array('q', [0, 3, 1])
+        for keys in [[5, 2, 0], (k for k in [5, 2, 0]), array('b', [5, 2, 0]), bytes([5, 2, 0])]:
+            with self.subTest(keys=keys):
+                self.assertEqual(expected, self.b.map_many(keys))
+
+        self.assertEqual(array('q', [5, 2, 0]), self.b.inverse_many(expected))
+        self.assertEqual(array('q'), self.b.map_many([]))
+        for keys in [[5, 1], [-1], [10], [5, 100]]:
+            with self.subTest(keys=keys):
+                with self.assertRaises(KeyError):
+                    self.b.map_many(keys)
+
+    @skipIf(int_bijection.numpy is None, 'NumPy is not installed')
+    def test_numpy(self, /) -> None:
+        """Tests if lookups of many integers return NumPy arrays for NumPy arrays"""
+        import numpy
+
+        result = self.b.map_many(numpy.array([5, 2, 0]))
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual([0, 3, 1], result.tolist())
+        with self.assertRaises(KeyError):
+            self.b.inverse_many(numpy.array([0, 4]))
+
+    def test_mapped(self, /) -> None:
+        """Tests if a saved bijection is opened as equal and pickled as a copy"""
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'ids.bin')
+            self.b.save(path)
+            mapped = IntBijection.open(path)
+            self.assertEqual(self.b, mapped)
+            self.assertEqual(self.b.inverse, mapped.inverse)
+            self.assertEqual(self.b.map_many(self.ids), mapped.map_many(self.ids))
+            self.assertEqual(self.b, pickle.loads(pickle.dumps(mapped)))
+            self.assertEqual(self.b, mapped.copy())
+            mapped.close()
+
+            with open(path, 'r+b') as f:
+                f.write(b'x')
+
+            with self.assertRaises(ValueError):
+                IntBijection.open(path)
+
+
+def load_tests(loader: TestLoader, tests: TestSuite, pattern: str, /) -> TestSuite:
+    suite = DocTestSuite(int_bijection, globs={'__name__': '__main__'})
+    suite.addTests(tests)
+    return suite
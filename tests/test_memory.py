@@ -0,0 +1,10 @@
+from doctest import DocTestSuite
+from unittest import TestLoader, TestSuite
+
+from misclib import memory
+
+
+def load_tests(loader: TestLoader, tests: TestSuite, pattern: str, /) -> TestSuite:
+    suite = DocTestSuite(memory, globs={'__name__': '__main__'})
+    suite.addTests(tests)
+    return suite
@@ -0,0 +1,117 @@
+import pickle
+from doctest import DocTestSuite
+from random import Random
+from unittest import TestCase, TestLoader, TestSuite
+
+from misclib.collections import _trie
+from misclib.collections._trie import Trie
+
+
+class Colliding:
+    """A key with many hash collisions"""
+    __slots__ = 'value',
+
+    def __init__(self, value: int, /) -> None:
+        self.value = value
+
+    def __hash__(self, /) -> int:
+        return self.value % 7
+
+    def __eq__(self, other, /) -> bool:
+        return isinstance(other, Colliding) and self.value == other.value
+
+    def __repr__(self, /) -> str:
+        return f'Colliding({self.value})'
+
+
+class TrieOperations(TestCase):
+    def check(self, d: dict, t: Trie, /) -> None:
+        self.assertEqual(len(d), len(t))
+        self.assertEqual(d, dict(t.items()))
+        self.assertEqual(sorted(map(repr, d)), sorted(map(repr, t)))
+        self.assertEqual(t, d)
+        self.check_collapsed(t._root, True)
+
+    def check_collapsed(self, node: _trie._Node, root: bool, /) -> None:
+        # A node below the root is not empty and does not hold a single tuple or bucket
+        children = node.children
+        self.assertEqual(node.bitmap.bit_count(), len(children))
+        if not root:
+            self.assertTrue(children)
+            self.assertFalse(len(children) == 1 and children[0].__class__ is not _trie._Node)
+
+        for child in children:
+            if child.__class__ is _trie._Node:
+                self.check_collapsed(child, False)
+            elif child.__class__ is _trie._Bucket:
+                self.assertGreater(len(child.leaves), 1)
+
+    def test_random(self, /) -> None:
+        """Tests set, delete and lookups against dict on random operations including hash collisions"""
+        rng = Random(0)
+        d = {}
+        t = Trie()
+        snapshots = []
+        for i in range(5000):
+            key = rng.choice([
+                rng.randrange(500),
+                # Hash values which differ only in high bits make long paths
+                rng.randrange(8) << 30,
+                Colliding(rng.randrange(100)),
+                str(rng.randrange(100)),
+                ])
+            if rng.random() < 0.6:
+                d[key] = i
+                t = t.set(key, i)
+            elif key in d:
+                del d[key]
+                t = t.delete(key)
+            else:
+                with self.assertRaises(KeyError):
+                    t.delete(key)
+
+            self.assertEqual(d.get(key, -1), t.get(key, -1))
+            self.assertEqual(key in d, key in t)
+            if i % 250 == 0:
+                snapshots.append((d.copy(), t))
+
+        for d, t in snapshots:
+            self.check(d, t)
+            self.check(d, Trie(d))
+
+    def test_delete_all(self, /) -> None:
+        """Tests if deletion of all keys collapses nodes and buckets down to an empty trie"""
+        rng = Random(1)
+        keys = [*range(300), *(i << 30 for i in range(1, 8)), *map(Colliding, range(50)), -1, -2]
+        t = Trie(dict.fromkeys(keys, 0))
+        d = dict.fromkeys(keys, 0)
+        rng.shuffle(keys)
+        for key in keys:
+            t = t.delete(key)
+            del d[key]
+            self.check(d, t)
+
+        self.assertEqual(0, t._root.bitmap)
+        self.assertEqual((), t._root.children)
+
+    def test_collisions(self, /) -> None:
+        """Tests if keys with equal hash values are stored, replaced and removed"""
+        self.assertEqual(hash(-1), hash(-2))
+        t = Trie({-1: 'a', -2: 'b', Colliding(0): 'c', Colliding(7): 'd'})
+        self.assertEqual(('a', 'b', 'c', 'd'), (t[-1], t[-2], t[Colliding(0)], t[Colliding(7)]))
+        t2 = t.set(Colliding(7), 'e').delete(-1)
+        self.assertEqual({-2: 'b', Colliding(0): 'c', Colliding(7): 'e'}, dict(t2.items()))
+        self.assertEqual('d', t[Colliding(7)])
+        self.assertNotIn(Colliding(14), t2)
+        self.assertRaises(KeyError, t2.delete, Colliding(14))
+
+    def test_pickle(self, /) -> None:
+        """Tests if pickling preserves items"""
+        t = Trie({i: str(i) for i in range(100)}).set(Colliding(3), None)
+        self.assertEqual(t, pickle.loads(pickle.dumps(t)))
+
+
+def load_tests(loader: TestLoader, tests: TestSuite, pattern: str, /) -> TestSuite:
+    suite = DocTestSuite(_trie, globs={'__name__': '__main__'})
+    suite.addTests(tests)
+    return suite